@@ -9,29 +9,43 @@ __version__ = "0.1.0"
 __author__ = "Suparious"
 __license__ = "MIT"
 
+import importlib
+import os
+from functools import lru_cache
 from pathlib import Path
-import sys
-
-# Ensure src is in the path
-package_dir = Path(__file__).parent
-if str(package_dir) not in sys.path:
-    sys.path.insert(0, str(package_dir))
-
-# Core imports for easier access
-try:
-    from src.chat_with_tools.agent import OpenRouterAgent
-    from src.chat_with_tools.orchestrator import TaskOrchestrator
-    from src.chat_with_tools.utils import setup_logging
-    
-    __all__ = [
-        "OpenRouterAgent",
-        "TaskOrchestrator",
-        "setup_logging",
-        "__version__",
-    ]
-except ImportError:
-    # If running from different context
-    __all__ = ["__version__"]
+
+# Resolved once at import; symlinks are normalized here so later joins don't
+# have to repeat the work.
+_PACKAGE_DIR = Path(__file__).resolve().parent
+
+# Core exports are resolved lazily (PEP 562) so that importing the package for
+# __version__ or check_setup() does not pull in openai, yaml and the tools.
+_LAZY = {
+    "OpenRouterAgent": ("chat_with_tools.agent", "OpenRouterAgent"),
+    "TaskOrchestrator": ("chat_with_tools.orchestrator", "TaskOrchestrator"),
+    "setup_logging": ("chat_with_tools.utils", "setup_logging"),
+}
+
+__all__ = [
+    "OpenRouterAgent",
+    "TaskOrchestrator",
+    "setup_logging",
+    "__version__",
+]
+
+def __getattr__(name):
+    """Import core exports on first access and cache them on the module"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazy exports in dir() for REPL completion"""
+    return sorted(set(globals()) | set(_LAZY))
 
 def get_version():
     """Get the current version of the framework"""
@@ -39,25 +53,49 @@ def get_version():
 
 def get_project_root():
     """Get the project root directory"""
-    return Path(__file__).parent
+    return _PACKAGE_DIR
 
 def check_setup():
     """Check if the framework is properly set up"""
-    project_root = get_project_root()
-    config_path = project_root / "config" / "config.yaml"
+    config_path = _PACKAGE_DIR / "config" / "config.yaml"
+    
+    # Key the cached result on the config mtime so edits are picked up
+    try:
+        config_mtime = config_path.stat().st_mtime_ns
+    except OSError:
+        config_mtime = None
+    
+    ok, issues = _check_setup_cached(config_mtime)
+    return ok, list(issues)
+
+@lru_cache(maxsize=1)
+def _check_setup_cached(config_mtime):
+    """Run the setup checks once per config file state"""
+    project_root = _PACKAGE_DIR
     
     issues = []
     
-    if not config_path.exists():
+    if config_mtime is None:
         issues.append("Configuration file not found at config/config.yaml")
     
-    # Check for required directories
-    required_dirs = ["src", "demos", "config", "src/chat_with_tools", "src/chat_with_tools/tools"]
-    for dir_name in required_dirs:
-        dir_path = project_root / dir_name
-        if not dir_path.exists():
-            issues.append(f"Required directory not found: {dir_name}")
+    # Check for required directories with one scandir per parent directory
+    required_dirs = {
+        "": ["src", "demos", "config"],
+        "src": ["chat_with_tools"],
+        "src/chat_with_tools": ["tools"],
+    }
+    for parent, names in required_dirs.items():
+        present = _list_subdirs(project_root / parent)
+        for name in names:
+            if name not in present:
+                issues.append(f"Required directory not found: {(Path(parent) / name).as_posix()}")
     
-    if issues:
-        return False, issues
-    return True, []
+    return not issues, tuple(issues)
+
+def _list_subdirs(path):
+    """Return the names of the directories directly under path"""
+    try:
+        with os.scandir(path) as entries:
+            return {entry.name for entry in entries if entry.is_dir()}
+    except OSError:
+        return set()
@@ -4,47 +4,92 @@ API-Based Demo for Chat with Tools Framework
 This demo uses the actual agent with your vLLM endpoint to demonstrate the tools.
 """
 
+import io
 import json
-import yaml
+import site
 import sys
 import os
-import time
-import traceback
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache
 from pathlib import Path
-from typing import Dict, Any, List
+from typing import TYPE_CHECKING, Dict, Any, List
 
-# Add both the project root and src directory to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-src_path = os.path.join(project_root, 'src')
-
-# Add src path first so imports work correctly
+# Make the in-tree package importable when the project isn't installed
+# (pip install -e . makes this a no-op). Only src/ is needed: this demo
+# imports nothing from the project root.
+src_path = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'src')
 if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+    site.addsitedir(src_path)
+
+# The agent (and with it openai) is imported where it is first used so the
+# menu comes up without paying for the full framework import.
+if TYPE_CHECKING:
+    from chat_with_tools.agent import OpenRouterAgent
+
+# Tests that run on worker threads collect their output in a per-thread
+# buffer that is written as one block when the test finishes
+_output = threading.local()
+_write_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    """Print into the current test's buffer, or straight to stdout."""
+    print(*args, file=getattr(_output, "buffer", None) or sys.stdout, **kwargs)
+
+
+def _write(text):
+    """Write preformatted text to the current test's buffer or stdout."""
+    (getattr(_output, "buffer", None) or sys.stdout).write(text)
+
+_BAR = "=" * 60
+_RULE = "-" * 40
+_RULE_WIDE = "-" * 60
+
+_MAIN_MENU = (
+    "\n" + _RULE + "\n"
+    "Select demo mode:\n"
+    "1. Sequential Thinking Demo\n"
+    "2. Memory Tool Demo\n"
+    "3. Python Executor Demo\n"
+    "4. Summarization Demo\n"
+    "5. Combined Tools Demo\n"
+    "6. Run All Automated Tests\n"
+    "7. Interactive Mode (Chat with Agent)\n"
+    "8. Exit\n"
+)
+
+
+@lru_cache(maxsize=1)
+def _load_config_cached(config_path: Path, mtime_ns: int) -> Dict[str, Any]:
+    """Parse the config file once per (path, mtime) so menu loops skip re-parsing.
+
+    Uses the LibYAML C loader when PyYAML is built with libyaml bindings and
+    silently falls back to the pure-Python SafeLoader otherwise.
+    """
+    import yaml
 
-# Now import directly from chat_with_tools (not src.chat_with_tools)
-from chat_with_tools.agent import OpenRouterAgent
+    loader = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+    with open(config_path, 'rb') as f:
+        return yaml.load(f, Loader=loader)
 
 
 def check_config():
     """Check if config is properly set up for API usage."""
-    print("\n" + "="*60)
-    print("🔍 CHECKING CONFIGURATION")
-    print("="*60)
+    sys.stdout.write(f"\n{_BAR}\n🔍 CHECKING CONFIGURATION\n{_BAR}\n")
     
     config_path = Path("config/config.yaml")
     if not config_path.exists():
         print("❌ config.yaml not found!")
         return None
     
-    with open(config_path, 'r') as f:
-        config = yaml.safe_load(f)
+    config = _load_config_cached(config_path, config_path.stat().st_mtime_ns)
     
     # Check API settings
-    api_key = config.get('openrouter', {}).get('api_key', '')
-    base_url = config.get('openrouter', {}).get('base_url', '')
-    model = config.get('openrouter', {}).get('model', '')
+    openrouter = config.get('openrouter') or {}
+    api_key = openrouter.get('api_key', '')
+    base_url = openrouter.get('base_url', '')
+    model = openrouter.get('model', '')
     
     print(f"✅ Config loaded from: {config_path}")
     print(f"📡 Base URL: {base_url}")
@@ -54,7 +99,9 @@ def check_config():
         print("✅ Using vLLM endpoint (OpenAI-compatible)")
     elif "openrouter" in base_url:
         print("✅ Using OpenRouter API")
-        if not api_key or api_key == "your-api-key-here":
+        # ConfigManager lets OPENROUTER_API_KEY override the file, so only
+        # warn when neither is set.
+        if (not api_key or api_key == "your-api-key-here") and 'OPENROUTER_API_KEY' not in os.environ:
             print("⚠️  Warning: OpenRouter API key not set in config.yaml")
     else:
         print("ℹ️  Using custom endpoint")
@@ -64,34 +111,34 @@ def check_config():
 
 def test_agent_initialization(silent=False):
     """Test if agent can be initialized with discovered tools."""
-    print("\n" + "="*60)
-    print("🤖 INITIALIZING AGENT")
-    print("="*60)
+    from chat_with_tools.agent import OpenRouterAgent
+
+    sys.stdout.write(f"\n{_BAR}\n🤖 INITIALIZING AGENT\n{_BAR}\n")
     
     try:
         agent = OpenRouterAgent(silent=silent)
         print(f"✅ Agent initialized successfully")
         print(f"📦 Tools loaded: {len(agent.tools)}")
         
-        # List available tools
-        print("\n📋 Available tools:")
-        for tool in agent.tools:
-            tool_name = tool['function']['name']
-            tool_desc = tool['function']['description'][:100] + "..." if len(tool['function']['description']) > 100 else tool['function']['description']
-            print(f"   • {tool_name}: {tool_desc}")
+        # List available tools in a single write
+        if not silent:
+            lines = ["\n📋 Available tools:"]
+            for tool in agent.tool_schemas:
+                desc = tool.description
+                lines.append(f"   • {tool.name}: {desc[:100]}{'...' if len(desc) > 100 else ''}")
+            sys.stdout.write("\n".join(lines) + "\n")
         
         return agent
     except Exception as e:
         print(f"❌ Failed to initialize agent: {e}")
-        traceback.print_exc()
+        import traceback
+        traceback.print_exc(limit=10)
         return None
 
 
-def demo_sequential_thinking_with_agent(agent: OpenRouterAgent):
+def demo_sequential_thinking_with_agent(agent: "OpenRouterAgent"):
     """Demo sequential thinking through the agent."""
-    print("\n" + "="*60)
-    print("🧠 SEQUENTIAL THINKING VIA AGENT")
-    print("="*60)
+    _write(f"\n{_BAR}\n🧠 SEQUENTIAL THINKING VIA AGENT\n{_BAR}\n")
     
     prompts = [
         "Use the sequential thinking tool to analyze: How can we improve code review processes in a development team? Start a thinking session, add at least 3 thoughts, revise one, and then conclude.",
@@ -99,26 +146,22 @@ def demo_sequential_thinking_with_agent(agent: OpenRouterAgent):
         "Think step-by-step about this problem: What are the trade-offs between microservices and monolithic architecture? Use the sequential thinking tool to explore this systematically."
     ]
     
-    print("\n📝 Testing sequential thinking with agent...")
-    print(f"Prompt: {prompts[0][:100]}...")
+    _print("\n📝 Testing sequential thinking with agent...")
+    _print(f"Prompt: {prompts[0][:100]}...")
     
     try:
         response = agent.run(prompts[0])
-        print("\n🤖 Agent Response:")
-        print("-" * 40)
-        print(response)
-        print("-" * 40)
+        _print("\n🤖 Agent Response:")
+        _write(f"{_RULE}\n{response}\n{_RULE}\n")
         return True
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _print(f"❌ Error: {e}")
         return False
 
 
-def demo_memory_with_agent(agent: OpenRouterAgent):
+def demo_memory_with_agent(agent: "OpenRouterAgent"):
     """Demo memory tool through the agent."""
-    print("\n" + "="*60)
-    print("💾 MEMORY TOOL VIA AGENT")
-    print("="*60)
+    _write(f"\n{_BAR}\n💾 MEMORY TOOL VIA AGENT\n{_BAR}\n")
     
     prompts = [
         "Store this in your memory as a fact: The Chat with Tools framework supports parallel execution of 4 agents by default. Tag it with 'framework' and 'architecture'.",
@@ -131,26 +174,22 @@ def demo_memory_with_agent(agent: OpenRouterAgent):
     ]
     
     for i, prompt in enumerate(prompts, 1):
-        print(f"\n📝 Test {i}: {prompt[:80]}...")
+        _print(f"\n📝 Test {i}: {prompt[:80]}...")
         try:
             response = agent.run(prompt)
-            print(f"\n🤖 Response {i}:")
-            print("-" * 40)
-            print(response[:500] + "..." if len(response) > 500 else response)
-            print("-" * 40)
-            time.sleep(1)  # Small delay between requests
+            _print(f"\n🤖 Response {i}:")
+            preview = response[:500] + "..." if len(response) > 500 else response
+            _write(f"{_RULE}\n{preview}\n{_RULE}\n")
         except Exception as e:
-            print(f"❌ Error: {e}")
+            _print(f"❌ Error: {e}")
             return False
     
     return True
 
 
-def demo_python_executor_with_agent(agent: OpenRouterAgent):
+def demo_python_executor_with_agent(agent: "OpenRouterAgent"):
     """Demo Python executor through the agent."""
-    print("\n" + "="*60)
-    print("🐍 PYTHON EXECUTOR VIA AGENT")
-    print("="*60)
+    _write(f"\n{_BAR}\n🐍 PYTHON EXECUTOR VIA AGENT\n{_BAR}\n")
     
     prompts = [
         """Use the Python executor to calculate the factorial of 10 and the first 15 Fibonacci numbers. 
@@ -162,28 +201,21 @@ def demo_python_executor_with_agent(agent: OpenRouterAgent):
         """Write and execute Python code to find all prime numbers between 1 and 100 using the Sieve of Eratosthenes algorithm."""
     ]
     
-    print("\n📝 Testing Python execution with agent...")
-    print(f"Prompt: {prompts[1][:100]}...")
+    _print("\n📝 Testing Python execution with agent...")
+    _print(f"Prompt: {prompts[1][:100]}...")
     
     try:
         response = agent.run(prompts[1])
-        print("\n🤖 Agent Response:")
-        print("-" * 40)
-        print(response)
-        print("-" * 40)
+        _print("\n🤖 Agent Response:")
+        _write(f"{_RULE}\n{response}\n{_RULE}\n")
         return True
     except Exception as e:
-        print(f"❌ Error: {e}")
+        _print(f"❌ Error: {e}")
         return False
 
 
-def demo_summarization_with_agent(agent: OpenRouterAgent):
-    """Demo summarization tool through the agent."""
-    print("\n" + "="*60)
-    print("📄 SUMMARIZATION VIA AGENT")
-    print("="*60)
-    
-    long_text = """
+# Sample text for the summarization demo, whitespace-normalized once at import
+_SUMMARY_TEXT = " ".join("""
     Artificial Intelligence has evolved significantly over the past decade, transforming from a specialized 
     research field into a cornerstone of modern technology. Machine learning algorithms now power everything 
     from recommendation systems to autonomous vehicles. Natural language processing has reached a level where 
@@ -194,40 +226,42 @@ def demo_summarization_with_agent(agent: OpenRouterAgent):
     automated grading. However, with these advances come important ethical considerations about privacy, bias, 
     and the future of human employment. Researchers and policymakers are working to establish frameworks that 
     ensure AI development remains beneficial and aligned with human values.
-    """
+    """.split())
+
+
+def demo_summarization_with_agent(agent: "OpenRouterAgent"):
+    """Demo summarization tool through the agent."""
+    _write(f"\n{_BAR}\n📄 SUMMARIZATION VIA AGENT\n{_BAR}\n")
     
-    prompts = [
-        f"Use the summarization tool to analyze this text and give me statistics about its readability: {long_text}",
+    # Each prompt is "<instruction>: <text>"; the shared text is only
+    # interpolated at call time.
+    instructions = [
+        "Use the summarization tool to analyze this text and give me statistics about its readability",
         
-        f"Summarize this text to 30% of its original length: {long_text}",
+        "Summarize this text to 30% of its original length",
         
-        f"Extract the 3 most important key points from this text: {long_text}"
+        "Extract the 3 most important key points from this text"
     ]
     
-    print("\n📝 Testing summarization with agent...")
-    print("Text sample:", long_text[:100] + "...")
+    _print("\n📝 Testing summarization with agent...")
+    _print("Text sample:", _SUMMARY_TEXT[:100] + "...")
     
-    for i, prompt in enumerate(prompts, 1):
-        print(f"\n📝 Test {i}: {prompt.split(':')[0]}...")
+    for i, instruction in enumerate(instructions, 1):
+        _print(f"\n📝 Test {i}: {instruction}...")
         try:
-            response = agent.run(prompt)
-            print(f"\n🤖 Response {i}:")
-            print("-" * 40)
-            print(response)
-            print("-" * 40)
-            time.sleep(1)
+            response = agent.run(f"{instruction}: {_SUMMARY_TEXT}")
+            _print(f"\n🤖 Response {i}:")
+            _write(f"{_RULE}\n{response}\n{_RULE}\n")
         except Exception as e:
-            print(f"❌ Error in test {i}: {e}")
+            _print(f"❌ Error in test {i}: {e}")
             return False
     
     return True
 
 
-def demo_combined_tools(agent: OpenRouterAgent):
+def demo_combined_tools(agent: "OpenRouterAgent"):
     """Demo using multiple tools together."""
-    print("\n" + "="*60)
-    print("🔗 COMBINED TOOLS DEMONSTRATION")
-    print("="*60)
+    _write(f"\n{_BAR}\n🔗 COMBINED TOOLS DEMONSTRATION\n{_BAR}\n")
     
     complex_prompt = """
     I need you to help me analyze a dataset. First, use the Python executor to generate 50 random 
@@ -236,28 +270,33 @@ def demo_combined_tools(agent: OpenRouterAgent):
     Finally, use sequential thinking to propose 3 ways we could visualize this data effectively.
     """
     
-    print("\n📝 Complex multi-tool task:")
-    print(complex_prompt[:150] + "...")
+    _print("\n📝 Complex multi-tool task:")
+    _print(complex_prompt[:150] + "...")
     
     try:
-        print("\n⏳ Processing complex request (this may take a moment)...")
+        _print("\n⏳ Processing complex request (this may take a moment)...")
         response = agent.run(complex_prompt)
-        print("\n🤖 Agent Response:")
-        print("-" * 40)
-        print(response)
-        print("-" * 40)
+        _print("\n🤖 Agent Response:")
+        _write(f"{_RULE}\n{response}\n{_RULE}\n")
         return True
     except Exception as e:
-        print(f"❌ Error: {e}")
-        traceback.print_exc()
+        _print(f"❌ Error: {e}")
+        import traceback
+        traceback.print_exc(limit=10)
         return False
 
 
-def run_interactive_demo(agent: OpenRouterAgent):
+# Tests run one after another on the main thread by run_automated_test_suite
+_SERIAL_TESTS = (
+    demo_memory_with_agent,
+    demo_python_executor_with_agent,
+    demo_combined_tools,
+)
+
+
+def run_interactive_demo(agent: "OpenRouterAgent"):
     """Run an interactive demo where users can test tools through natural language."""
-    print("\n" + "="*60)
-    print("💬 INTERACTIVE AGENT DEMO")
-    print("="*60)
+    sys.stdout.write(f"\n{_BAR}\n💬 INTERACTIVE AGENT DEMO\n{_BAR}\n")
     print("\nYou can now interact with the agent using natural language.")
     print("The agent has access to all tools and will use them as needed.")
     print("\nExample commands:")
@@ -266,7 +305,7 @@ def run_interactive_demo(agent: OpenRouterAgent):
     print("  • 'Calculate...' or 'Write Python code to...' (Python Executor)")
     print("  • 'Summarize this text...' (Summarization)")
     print("\nType 'quit' to exit.")
-    print("-" * 60)
+    print(_RULE_WIDE)
     
     while True:
         try:
@@ -291,11 +330,56 @@ def run_interactive_demo(agent: OpenRouterAgent):
             print("Please try again or type 'quit' to exit.")
 
 
-def run_automated_test_suite(agent: OpenRouterAgent):
+def _run_test(test_name, test_func, agent: "OpenRouterAgent") -> bool:
+    """Run one suite test under its header and report whether it passed."""
+    _write(f"\n🧪 Testing: {test_name}\n{_RULE}\n")
+    try:
+        success = test_func(agent)
+    except Exception as e:
+        _print(f"❌ {test_name} test error: {e}")
+        return False
+    if success:
+        _print(f"✅ {test_name} test passed")
+    else:
+        _print(f"❌ {test_name} test failed")
+    return bool(success)
+
+
+def _run_buffered(test_name, test_func, agent: "OpenRouterAgent") -> bool:
+    """Run a suite test with this thread's output buffered, then print it whole."""
+    _output.buffer = io.StringIO()
+    try:
+        return _run_test(test_name, test_func, agent)
+    finally:
+        text = _output.buffer.getvalue()
+        _output.buffer = None
+        with _write_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+def _worker_agent(agent: "OpenRouterAgent") -> "OpenRouterAgent":
+    """A new agent set up like agent, for a test running on a worker thread.
+    
+    Tool state is not shared across threads (as in TaskOrchestrator), but
+    the endpoint, structured output choice and rate limiter are the
+    caller's, so the suite stays within agent.rate_limit.
+    """
+    from chat_with_tools.agent import OpenRouterAgent
+    
+    worker = OpenRouterAgent(
+        silent=True,
+        name=agent.name,
+        endpoint_name=agent.endpoint_name,
+        use_structured_output=agent.use_structured_output,
+    )
+    worker.rate_limiter = agent.rate_limiter
+    return worker
+
+
+def run_automated_test_suite(agent: "OpenRouterAgent"):
     """Run automated tests for all tools."""
-    print("\n" + "="*60)
-    print("🧪 AUTOMATED TEST SUITE")
-    print("="*60)
+    sys.stdout.write(f"\n{_BAR}\n🧪 AUTOMATED TEST SUITE\n{_BAR}\n")
     
     tests = [
         ("Sequential Thinking", demo_sequential_thinking_with_agent),
@@ -305,28 +389,33 @@ def run_automated_test_suite(agent: OpenRouterAgent):
         ("Combined Tools", demo_combined_tools)
     ]
     
+    # These share the memory store on disk, or need the Python executor,
+    # whose timeout (SIGALRM) and output capture only work on the main
+    # thread, so they run here with the caller's agent
+    serial_tests = [(n, f) for n, f in tests if f in _SERIAL_TESTS]
+    pooled_tests = [(n, f) for n, f in tests if f not in _SERIAL_TESTS]
+    
     results = {}
     
-    for test_name, test_func in tests:
-        print(f"\n🧪 Testing: {test_name}")
-        print("-" * 40)
-        try:
-            success = test_func(agent)
-            results[test_name] = success
-            if success:
-                print(f"✅ {test_name} test passed")
-            else:
-                print(f"❌ {test_name} test failed")
-        except Exception as e:
-            print(f"❌ {test_name} test error: {e}")
-            results[test_name] = False
+    # The remaining tests are independent and dominated by API latency, so
+    # run them concurrently, each printing its output once it finishes
+    with ThreadPoolExecutor(max_workers=len(pooled_tests)) as executor:
+        future_to_test = {
+            executor.submit(_run_buffered, test_name, test_func, _worker_agent(agent)): test_name
+            for test_name, test_func in pooled_tests
+        }
         
-        time.sleep(2)  # Delay between tests
+        for future in as_completed(future_to_test):
+            results[future_to_test[future]] = future.result()
+    
+    for test_name, test_func in serial_tests:
+        results[test_name] = _run_test(test_name, test_func, agent)
+    
+    # Report in the original test order
+    results = {test_name: results[test_name] for test_name, _ in tests}
     
     # Print summary
-    print("\n" + "="*60)
-    print("📊 TEST RESULTS SUMMARY")
-    print("="*60)
+    sys.stdout.write(f"\n{_BAR}\n📊 TEST RESULTS SUMMARY\n{_BAR}\n")
     
     passed = sum(1 for v in results.values() if v)
     total = len(results)
@@ -342,9 +431,7 @@ def run_automated_test_suite(agent: OpenRouterAgent):
 
 def main():
     """Main demo function."""
-    print("\n" + "="*60)
-    print("   🚀 CHAT WITH TOOLS - API DEMO")
-    print("="*60)
+    sys.stdout.write(f"\n{_BAR}\n   🚀 CHAT WITH TOOLS - API DEMO\n{_BAR}\n")
     print("\nThis demo tests the tools through the actual agent using your API.")
     
     # Check configuration
@@ -364,56 +451,38 @@ def main():
         print("3. Ensure all dependencies are installed: pip install pyyaml openai")
         return
     
+    actions = {
+        "1": demo_sequential_thinking_with_agent,
+        "2": demo_memory_with_agent,
+        "3": demo_python_executor_with_agent,
+        "4": demo_summarization_with_agent,
+        "5": demo_combined_tools,
+        "6": run_automated_test_suite,
+        "7": run_interactive_demo,
+    }
+    
     while True:
-        print("\n" + "-"*40)
-        print("Select demo mode:")
-        print("1. Sequential Thinking Demo")
-        print("2. Memory Tool Demo")
-        print("3. Python Executor Demo")
-        print("4. Summarization Demo")
-        print("5. Combined Tools Demo")
-        print("6. Run All Automated Tests")
-        print("7. Interactive Mode (Chat with Agent)")
-        print("8. Exit")
+        sys.stdout.write(_MAIN_MENU)
         
         choice = input("\nChoice (1-8): ").strip()
         
-        if choice == "1":
-            demo_sequential_thinking_with_agent(agent)
-        elif choice == "2":
-            demo_memory_with_agent(agent)
-        elif choice == "3":
-            demo_python_executor_with_agent(agent)
-        elif choice == "4":
-            demo_summarization_with_agent(agent)
-        elif choice == "5":
-            demo_combined_tools(agent)
-        elif choice == "6":
-            run_automated_test_suite(agent)
-        elif choice == "7":
-            run_interactive_demo(agent)
-        elif choice == "8":
+        if choice == "8":
             print("\n👋 Goodbye!")
             break
-        else:
+        
+        action = actions.get(choice)
+        if action is None:
             print("❌ Invalid choice. Please select 1-8.")
+            continue
+        action(agent)
 
 
 if __name__ == "__main__":
     try:
-        # First check if we can import required modules
-        try:
-            import yaml
-            from chat_with_tools.agent import OpenRouterAgent
-        except ImportError as e:
-            print(f"\n❌ Missing required module: {e}")
-            print("\nPlease install dependencies:")
-            print("  pip install pyyaml openai")
-            sys.exit(1)
-        
         main()
     except KeyboardInterrupt:
         print("\n\n👋 Demo interrupted. Goodbye!")
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        traceback.print_exc()
+        import traceback
+        traceback.print_exc(limit=10)
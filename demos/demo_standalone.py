@@ -4,12 +4,14 @@ Standalone Demo Script for Chat with Tools Framework New Tools
 This version tests tools directly without requiring OpenRouter/OpenAI.
 """
 
-import json
 import sys
 import os
-import traceback
-from pathlib import Path
-from datetime import datetime
+import io
+import re
+import functools
+import threading
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
 # Add both the project root and src directory to the Python path
 project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
@@ -27,216 +29,331 @@ from chat_with_tools.tools.memory_tool import MemoryTool
 from chat_with_tools.tools.python_executor_tool import PythonExecutorTool
 from chat_with_tools.tools.summarization_tool import SummarizationTool
 
+# Demos run concurrently in the test suite; each collects its output in a
+# per-thread buffer that is written as one block when the demo finishes
+_output = threading.local()
+_write_lock = threading.Lock()
+
+# Banner rules are built once; CWT_QUIET=1 drops the demo banners and section
+# headers so CI logs carry only the results
+_BAR_EQ = "=" * 60
+_BAR_DASH = "-" * 50
+_QUIET = os.environ.get("CWT_QUIET") == "1"
+
+
+def _print(*args, **kwargs):
+    """Print into the current demo's buffer, or straight to stdout."""
+    print(*args, file=getattr(_output, "buffer", None) or sys.stdout, **kwargs)
+
+
+def _write(text):
+    """Write preformatted text to the current demo's buffer or stdout."""
+    target = getattr(_output, "buffer", None) or sys.stdout
+    target.write(text)
+    if target is sys.stdout:
+        target.flush()
+
+
+def _run_buffered(name, demo_func, header):
+    """Run a demo with its output buffered and report success as a bool."""
+    _output.buffer = io.StringIO()
+    try:
+        if header:
+            _write(banner(f"Testing: {name}"))
+        try:
+            return bool(demo_func())
+        except Exception as e:
+            _print(f"❌ Fatal error in {name}: {e}")
+            _print_traceback()
+            return False
+    finally:
+        text = _output.buffer.getvalue()
+        _output.buffer = None
+        with _write_lock:
+            sys.stdout.write(text)
+            sys.stdout.flush()
+
+
+
+def _print_traceback():
+    """Print the active exception's traceback when CWT_DEBUG is set.
+    
+    traceback (and the linecache it pulls in) is only imported here so the
+    demo starts without it; the caller already prints the error message.
+    """
+    if os.environ.get("CWT_DEBUG"):
+        import traceback
+        _print(traceback.format_exc(), end='')
+
+# Tool instances keyed on (class, frozen config), so repeated menu runs skip
+# construction (e.g. MemoryStore's directory setup and index load)
+_tool_cache = {}
+_tool_cache_lock = threading.Lock()
+
+
+def _freeze(value):
+    """Turn nested dicts and lists into hashable tuples."""
+    if isinstance(value, dict):
+        return tuple(sorted((k, _freeze(v)) for k, v in value.items()))
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(v) for v in value)
+    return value
+
+
+def get_tool(tool_class, config=None):
+    """Return a shared tool instance for this class and config."""
+    config = config or {}
+    key = (tool_class, _freeze(config))
+    with _tool_cache_lock:
+        tool = _tool_cache.get(key)
+        if tool is None:
+            tool = _tool_cache[key] = tool_class(config)
+    return tool
+
+
+class SectionBuffer(list):
+    """Collect the lines of a banner or report and write them in one go."""
+    
+    def add(self, line=""):
+        self.append(line)
+    
+    def flush(self):
+        _write("".join(line + "\n" for line in self))
+        self.clear()
+
+
+def banner(title):
+    """Return a demo banner, or nothing in quiet mode."""
+    return "" if _QUIET else f"\n{_BAR_EQ}\n{title}\n{_BAR_EQ}\n"
+
 
 def print_section(title, emoji="📌"):
-    """Print a formatted section header."""
-    print(f"\n{emoji} {title}")
-    print("-" * 50)
+    """Return a formatted section header, or nothing in quiet mode."""
+    return "" if _QUIET else f"\n{emoji} {title}\n{_BAR_DASH}\n"
 
 
 def demo_sequential_thinking():
     """Comprehensive demo of the sequential thinking tool."""
-    print("\n" + "="*60)
-    print("🧠 SEQUENTIAL THINKING TOOL DEMO")
-    print("="*60)
+    _write(banner("🧠 SEQUENTIAL THINKING TOOL DEMO"))
     
     try:
-        tool = SequentialThinkingTool({})
+        tool = get_tool(SequentialThinkingTool)
         
-        # Start a thinking session
-        print_section("Starting New Thinking Session", "🚀")
-        result = tool.execute(
-            action="start",
-            problem="How to optimize database query performance in a high-traffic application?"
-        )
-        session_id = result.get("session_id")
-        print(f"✅ Session started: {session_id}")
-        print(f"📝 Problem: {result.get('problem')}")
+        # The whole session as one script: start, four thoughts, a revision,
+        # a branch, a summary and the conclusion
+        steps = [
+            {
+                "action": "start",
+                "problem": "How to optimize database query performance in a high-traffic application?"
+            },
+            {
+                "action": "think",
+                "thought": "First, I need to identify the current bottlenecks. Common issues include missing indexes, N+1 queries, and inefficient joins.",
+                "thought_type": "analysis",
+                "confidence": 0.9
+            },
+            {
+                "action": "think",
+                "thought": "What specific metrics should we monitor to identify slow queries?",
+                "thought_type": "question",
+                "confidence": 1.0
+            },
+            {
+                "action": "think",
+                "thought": "We should monitor query execution time, rows examined vs rows returned, and cache hit rates.",
+                "thought_type": "analysis",
+                "confidence": 0.85
+            },
+            {
+                "action": "think",
+                "thought": "Implementing query result caching with Redis could significantly reduce database load.",
+                "thought_type": "hypothesis",
+                "confidence": 0.8
+            },
+            {
+                "action": "revise",
+                "thought": "Actually, we should implement a multi-layer caching strategy: Redis for hot data, and application-level caching for frequently accessed computed results.",
+                "revises_thought_number": 4,
+                "confidence": 0.95
+            },
+            {
+                "action": "branch",
+                "thought": "Instead of caching, we could consider database sharding and read replicas for horizontal scaling.",
+                "branch_from_thought": 3,
+                "branch_name": "scaling_approach",
+                "confidence": 0.75
+            },
+            {"action": "get_summary"},
+            {
+                "action": "conclude",
+                "thought": "To optimize database performance: 1) Add missing indexes on frequently queried columns, 2) Implement multi-layer caching with Redis and application cache, 3) Use query profiling to identify slow queries, 4) Consider read replicas for read-heavy workloads, 5) Implement connection pooling."
+            }
+        ]
+        
+        script = tool.execute(action="script", steps=steps)
+        if "results" in script:
+            results = script["results"]
+        else:
+            # Older tools without script: one call per step, each applying
+            # to the session the start step made current
+            results = [tool.execute(**step) for step in steps]
+        
+        failed = next((r for r in results if "error" in r), None)
+        if failed is not None:
+            _print(f"❌ Thinking script failed: {failed['error']}")
+            return False
+        
+        result, thought1, thought2, thought3, thought4, revision, branch, summary, conclusion = results
+        
+        _write(print_section("Starting New Thinking Session", "🚀"))
+        _print(f"✅ Session started: {result.get('session_id')}")
+        _print(f"📝 Problem: {result.get('problem')}")
         
         # Add analysis thoughts
-        print_section("Adding Analysis Thoughts", "💭")
-        
-        thought1 = tool.execute(
-            action="think",
-            thought="First, I need to identify the current bottlenecks. Common issues include missing indexes, N+1 queries, and inefficient joins.",
-            thought_type="analysis",
-            confidence=0.9,
-            session_id=session_id
-        )
-        print(f"✅ Thought #{thought1['thought']['thought_number']}: Added analysis")
-        
-        thought2 = tool.execute(
-            action="think",
-            thought="What specific metrics should we monitor to identify slow queries?",
-            thought_type="question",
-            confidence=1.0,
-            session_id=session_id
-        )
-        print(f"✅ Thought #{thought2['thought']['thought_number']}: Added question")
-        
-        thought3 = tool.execute(
-            action="think",
-            thought="We should monitor query execution time, rows examined vs rows returned, and cache hit rates.",
-            thought_type="analysis",
-            confidence=0.85,
-            session_id=session_id
-        )
-        print(f"✅ Thought #{thought3['thought']['thought_number']}: Added analysis")
-        
-        thought4 = tool.execute(
-            action="think",
-            thought="Implementing query result caching with Redis could significantly reduce database load.",
-            thought_type="hypothesis",
-            confidence=0.8,
-            session_id=session_id
-        )
-        print(f"✅ Thought #{thought4['thought']['thought_number']}: Added hypothesis")
+        _write(print_section("Adding Analysis Thoughts", "💭"))
+        _print(f"✅ Thought #{thought1['thought']['thought_number']}: Added analysis")
+        _print(f"✅ Thought #{thought2['thought']['thought_number']}: Added question")
+        _print(f"✅ Thought #{thought3['thought']['thought_number']}: Added analysis")
+        _print(f"✅ Thought #{thought4['thought']['thought_number']}: Added hypothesis")
         
         # Revise a thought
-        print_section("Revising Previous Thought", "✏️")
-        revision = tool.execute(
-            action="revise",
-            thought="Actually, we should implement a multi-layer caching strategy: Redis for hot data, and application-level caching for frequently accessed computed results.",
-            revises_thought_number=4,
-            confidence=0.95,
-            session_id=session_id
-        )
-        print(f"✅ Revised thought #{revision['original_thought']['thought_number']}")
-        print(f"   Original confidence: {revision['original_thought']['confidence']}")
-        print(f"   New confidence: {revision['revision']['confidence']}")
+        _write(print_section("Revising Previous Thought", "✏️"))
+        _print(f"✅ Revised thought #{revision['original_thought']['thought_number']}")
+        _print(f"   Original confidence: {revision['original_thought']['confidence']}")
+        _print(f"   New confidence: {revision['revision']['confidence']}")
         
         # Create a branch for alternative approach
-        print_section("Creating Alternative Branch", "🌿")
-        branch = tool.execute(
-            action="branch",
-            thought="Instead of caching, we could consider database sharding and read replicas for horizontal scaling.",
-            branch_from_thought=3,
-            branch_name="scaling_approach",
-            confidence=0.75,
-            session_id=session_id
-        )
-        print(f"✅ Created branch: {branch['branch_name']}")
-        print(f"   Total branches: {branch['total_branches']}")
+        _write(print_section("Creating Alternative Branch", "🌿"))
+        _print(f"✅ Created branch: {branch['branch_name']}")
+        _print(f"   Total branches: {branch['total_branches']}")
         
         # Get current summary
-        print_section("Current Session Summary", "📊")
-        summary = tool.execute(
-            action="get_summary",
-            session_id=session_id
-        )
+        _write(print_section("Current Session Summary", "📊"))
         for key, value in summary['summary'].items():
-            print(f"   {key}: {value}")
+            _print(f"   {key}: {value}")
         
         # Add conclusion
-        print_section("Adding Conclusion", "🎯")
-        conclusion = tool.execute(
-            action="conclude",
-            thought="To optimize database performance: 1) Add missing indexes on frequently queried columns, 2) Implement multi-layer caching with Redis and application cache, 3) Use query profiling to identify slow queries, 4) Consider read replicas for read-heavy workloads, 5) Implement connection pooling.",
-            session_id=session_id
+        _write(print_section("Adding Conclusion", "🎯"))
+        
+        insights = conclusion.get('insights') or {}
+        _print(
+            "\n📈 Thinking Process Insights:\n"
+            f"   Thinking style: {insights.get('thinking_style', 'unknown')}\n"
+            f"   Average confidence: {insights.get('average_confidence', 0)}\n"
+            f"   Revision rate: {insights.get('revision_rate', 0)}\n"
+            f"   Branches explored: {insights.get('branches_explored', 0)}"
         )
         
-        print("\n📈 Thinking Process Insights:")
-        insights = conclusion.get('insights', {})
-        print(f"   Thinking style: {insights.get('thinking_style', 'unknown')}")
-        print(f"   Average confidence: {insights.get('average_confidence', 0)}")
-        print(f"   Revision rate: {insights.get('revision_rate', 0)}")
-        print(f"   Branches explored: {insights.get('branches_explored', 0)}")
-        
         return True
         
     except Exception as e:
-        print(f"❌ Error in sequential thinking demo: {e}")
-        traceback.print_exc()
+        _print(f"❌ Error in sequential thinking demo: {e}")
+        _print_traceback()
         return False
 
 
+# Fixed inputs for the memory demo, built once and read-only
+_MEMORIES_TO_STORE = tuple(MappingProxyType(memory) for memory in [
+    {
+        "content": "The Chat with Tools framework was created to emulate Grok's heavy mode functionality with multi-agent analysis.",
+        "memory_type": "fact",
+        "tags": ("framework", "origin", "grok", "architecture")
+    },
+    {
+        "content": "Users prefer comprehensive, multi-perspective responses that consider different angles of their queries.",
+        "memory_type": "preference",
+        "tags": ("users", "responses", "quality")
+    },
+    {
+        "content": "Successfully debugged a race condition in the parallel agent execution by implementing proper thread locks.",
+        "memory_type": "experience",
+        "tags": ("debugging", "threading", "parallel", "agents")
+    },
+    {
+        "content": "Always validate user input before processing to prevent injection attacks and ensure data integrity.",
+        "memory_type": "instruction",
+        "tags": ("security", "validation", "best-practice")
+    },
+    {
+        "content": "Current project focus is on implementing new tools: sequential thinking, memory, code execution, and summarization.",
+        "memory_type": "context",
+        "tags": ("project", "current", "tools", "development")
+    }
+])
+_SEARCH_QUERIES = ("agents", "security", "tools")
+
+
 def demo_memory_tool():
     """Comprehensive demo of the memory tool."""
-    print("\n" + "="*60)
-    print("💾 MEMORY TOOL DEMO")
-    print("="*60)
+    _write(banner("💾 MEMORY TOOL DEMO"))
     
     try:
-        tool = MemoryTool({"memory": {"storage_path": "./agent_memory_demo"}})
+        tool = get_tool(MemoryTool, {"memory": {"storage_path": "./agent_memory_demo"}})
         
         # Store various types of memories
-        print_section("Storing Different Memory Types", "💾")
-        
-        memories_to_store = [
-            {
-                "content": "The Chat with Tools framework was created to emulate Grok's heavy mode functionality with multi-agent analysis.",
-                "memory_type": "fact",
-                "tags": ["framework", "origin", "grok", "architecture"]
-            },
-            {
-                "content": "Users prefer comprehensive, multi-perspective responses that consider different angles of their queries.",
-                "memory_type": "preference",
-                "tags": ["users", "responses", "quality"]
-            },
-            {
-                "content": "Successfully debugged a race condition in the parallel agent execution by implementing proper thread locks.",
-                "memory_type": "experience",
-                "tags": ["debugging", "threading", "parallel", "agents"]
-            },
-            {
-                "content": "Always validate user input before processing to prevent injection attacks and ensure data integrity.",
-                "memory_type": "instruction",
-                "tags": ["security", "validation", "best-practice"]
-            },
-            {
-                "content": "Current project focus is on implementing new tools: sequential thinking, memory, code execution, and summarization.",
-                "memory_type": "context",
-                "tags": ["project", "current", "tools", "development"]
-            }
-        ]
+        _write(print_section("Storing Different Memory Types", "💾"))
+        
+        result = tool.execute(action="bulk_store", memories=_MEMORIES_TO_STORE)
+        if "error" in result:
+            # Older memory tools without bulk_store: one call per memory
+            stored_ids = [
+                tool.execute(action="store", **mem_data).get('memory_id')
+                for mem_data in _MEMORIES_TO_STORE
+            ]
+        else:
+            stored_ids = result["memory_ids"]
         
-        stored_ids = []
-        for mem_data in memories_to_store:
-            result = tool.execute(action="store", **mem_data)
-            memory_id = result.get('memory_id')
-            stored_ids.append(memory_id)
-            print(f"✅ Stored [{mem_data['memory_type']}]: {memory_id}")
+        _print("\n".join(
+            f"✅ Stored [{mem_data['memory_type']}]: {memory_id}"
+            for mem_data, memory_id in zip(_MEMORIES_TO_STORE, stored_ids)
+        ))
         
         # Search memories by query
-        print_section("Searching Memories by Query", "🔍")
-        
-        search_queries = ["agents", "security", "tools"]
-        for query in search_queries:
-            result = tool.execute(
-                action="search",
-                query=query,
-                limit=5
-            )
-            print(f"\n📝 Query: '{query}' - Found {result.get('count', 0)} results")
+        _write(print_section("Searching Memories by Query", "🔍"))
+        
+        search_queries = _SEARCH_QUERIES
+        batch = tool.execute(action="batch_search", queries=search_queries, limit=5)
+        if "error" in batch:
+            # Older memory tools without batch_search: one call per query, in
+            # turn, since a search updates each hit's access count on disk
+            query_results = [
+                dict(tool.execute(action="search", query=query, limit=5), query=query)
+                for query in search_queries
+            ]
+        else:
+            query_results = batch["results"]
+        
+        for result in query_results:
+            _print(f"\n📝 Query: '{result['query']}' - Found {result.get('count', 0)} results")
             for mem in result.get("results", [])[:2]:
-                print(f"   • [{mem['type']}] {mem['summary'][:60]}...")
+                _print(f"   • [{mem['type']}] {mem['summary'][:60]}...")
         
         # Search by tags
-        print_section("Searching Memories by Tags", "🏷️")
+        _write(print_section("Searching Memories by Tags", "🏷️"))
         
         tag_result = tool.execute(
             action="search",
             tags=["framework", "architecture"],
             limit=5
         )
-        print(f"Found {tag_result.get('count', 0)} memories with tags 'framework' or 'architecture'")
+        _print(f"Found {tag_result.get('count', 0)} memories with tags 'framework' or 'architecture'")
         for mem in tag_result.get("results", []):
-            print(f"   • {mem['summary'][:60]}...")
+            _print(f"   • {mem['summary'][:60]}...")
         
         # Search by type
-        print_section("Searching Memories by Type", "📁")
+        _write(print_section("Searching Memories by Type", "📁"))
         
         type_result = tool.execute(
             action="search",
             memory_type="instruction",
             limit=5
         )
-        print(f"Found {type_result.get('count', 0)} instruction-type memories")
+        _print(f"Found {type_result.get('count', 0)} instruction-type memories")
         for mem in type_result.get("results", []):
-            print(f"   • {mem['summary'][:60]}...")
+            _print(f"   • {mem['summary'][:60]}...")
         
         # Retrieve specific memory
-        print_section("Retrieving Specific Memory", "📖")
+        _write(print_section("Retrieving Specific Memory", "📖"))
         
         if stored_ids:
             specific_result = tool.execute(
@@ -245,50 +362,54 @@ def demo_memory_tool():
             )
             if specific_result.get("status") == "retrieved":
                 memory = specific_result["memory"]
-                print(f"Retrieved memory: {memory['id']}")
-                print(f"   Content: {memory['content'][:100]}...")
-                print(f"   Created: {memory['created_at']}")
-                print(f"   Accessed: {memory['accessed_count']} times")
+                _print(f"Retrieved memory: {memory['id']}")
+                _print(f"   Content: {memory['content'][:100]}...")
+                _print(f"   Created: {memory['created_at']}")
+                _print(f"   Accessed: {memory['accessed_count']} times")
         
         # Get statistics
-        print_section("Memory Statistics", "📊")
+        _write(print_section("Memory Statistics", "📊"))
         
         stats_result = tool.execute(action="stats")
-        stats = stats_result.get("statistics", {})
-        print(f"   Total memories: {stats.get('total_memories', 0)}")
-        print(f"   Memory types: {stats.get('memory_types', {})}")
-        print(f"   Total tags: {stats.get('total_tags', 0)}")
-        print(f"   Popular tags: {stats.get('popular_tags', [])[:5]}")
+        stats = stats_result.get("statistics") or {}
+        _print(
+            f"   Total memories: {stats.get('total_memories', 0)}\n"
+            f"   Memory types: {stats.get('memory_types', {})}\n"
+            f"   Total tags: {stats.get('total_tags', 0)}\n"
+            f"   Popular tags: {stats.get('popular_tags', [])[:5]}"
+        )
         
         # Delete a memory
-        print_section("Memory Management", "🗑️")
+        _write(print_section("Memory Management", "🗑️"))
         
         if stored_ids and len(stored_ids) > 1:
             delete_result = tool.execute(
                 action="forget",
                 memory_id=stored_ids[-1]
             )
-            print(f"Deleted memory: {delete_result.get('message', 'Unknown')}")
+            _print(f"Deleted memory: {delete_result.get('message', 'Unknown')}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error in memory demo: {e}")
-        traceback.print_exc()
+        _print(f"❌ Error in memory demo: {e}")
+        _print_traceback()
         return False
 
 
-def demo_python_executor():
-    """Comprehensive demo of the Python executor tool."""
-    print("\n" + "="*60)
-    print("🐍 PYTHON EXECUTOR TOOL DEMO")
-    print("="*60)
+def demo_python_executor(full_timeout_test=False):
+    """Comprehensive demo of the Python executor tool.
+    
+    The timeout example is stopped after one second unless full_timeout_test
+    is set, in which case it runs to the configured limit.
+    """
+    _write(banner("🐍 PYTHON EXECUTOR TOOL DEMO"))
     
     try:
-        tool = PythonExecutorTool({"code_execution": {"timeout": 5, "max_memory_mb": 100}})
+        tool = get_tool(PythonExecutorTool, {"code_execution": {"timeout": 5, "max_memory_mb": 100}})
         
         # Mathematical calculations
-        print_section("Mathematical Calculations", "📐")
+        _write(print_section("Mathematical Calculations", "📐"))
         
         math_code = """
 import math
@@ -298,14 +419,12 @@ radius = 7
 circle_area = math.pi * radius ** 2
 circle_circumference = 2 * math.pi * radius
 
-# Fibonacci sequence
+# Fibonacci sequence from Binet's closed form; O(1) per term and exact
+# in float arithmetic up to n = 70
 def fibonacci(n):
-    a, b = 0, 1
-    fib_sequence = []
-    for _ in range(n):
-        fib_sequence.append(a)
-        a, b = b, a + b
-    return fib_sequence
+    sqrt5 = math.sqrt(5)
+    phi = (1 + sqrt5) / 2
+    return [round(phi ** i / sqrt5) for i in range(n)]
 
 fib_10 = fibonacci(10)
 
@@ -320,36 +439,44 @@ print(f"\\nFirst 10 Fibonacci numbers: {fib_10}")
         
         result = tool.execute(code=math_code, description="Mathematical calculations")
         if result["status"] == "success":
-            print("✅ Execution successful!")
-            print(f"Output:\n{result['output']}")
+            _print("✅ Execution successful!")
+            _print(f"Output:\n{result['output']}")
             if result.get('result'):
-                print(f"Returned value: {result['result']}")
+                _print(f"Returned value: {result['result']}")
         else:
-            print(f"❌ Error: {result.get('error')}")
+            _print(f"❌ Error: {result.get('error')}")
         
         # Data analysis with statistics
-        print_section("Statistical Analysis", "📊")
+        _write(print_section("Statistical Analysis", "📊"))
         
+        # Stdlib only: numpy is not on the executor's import allow-list
         stats_code = """
 import statistics
 import random
 
-# Generate sample data
-random.seed(42)
-data = [random.gauss(100, 15) for _ in range(100)]
+# Generate sample data; a private generator leaves the global random state
+# alone, and a plain loop is used because rng is not visible inside a
+# comprehension here
+rng = random.Random(42)
+data = []
+for _ in range(100):
+    data.append(rng.gauss(100, 15))
 
 # Calculate various statistics
 mean = statistics.mean(data)
 median = statistics.median(data)
 stdev = statistics.stdev(data)
-q1 = statistics.quantiles(data, n=4)[0]
-q3 = statistics.quantiles(data, n=4)[2]
+q1, _, q3 = statistics.quantiles(data, n=4)
 
-# Find outliers (values beyond 1.5*IQR)
+# Find outliers (values beyond 1.5*IQR); a plain loop because the
+# executor's locals are not visible inside comprehensions
 iqr = q3 - q1
 lower_bound = q1 - 1.5 * iqr
 upper_bound = q3 + 1.5 * iqr
-outliers = [x for x in data if x < lower_bound or x > upper_bound]
+outliers = []
+for x in data:
+    if x < lower_bound or x > upper_bound:
+        outliers.append(x)
 
 print("Dataset Statistics:")
 print(f"  Count: {len(data)}")
@@ -366,19 +493,25 @@ print(f"  Range: [{min(data):.2f}, {max(data):.2f}]")
         
         result = tool.execute(code=stats_code, description="Statistical analysis of random data")
         if result["status"] == "success":
-            print("✅ Execution successful!")
-            print(f"Output:\n{result['output']}")
-            print(f"Execution time: {result['execution_time']} seconds")
+            _print("✅ Execution successful!")
+            _print(f"Output:\n{result['output']}")
+            _print(f"Execution time: {result['execution_time']} seconds")
         else:
-            print(f"❌ Error: {result.get('error')}")
+            _print(f"❌ Error: {result.get('error')}")
         
         # String processing and regex
-        print_section("Text Processing", "📝")
+        _write(print_section("Text Processing", "📝"))
         
         text_code = """
 import re
 from collections import Counter
 
+# Compile each pattern once up front and reuse the compiled objects below
+NUM_RE = re.compile(r'\\d+(?:\\.\\d+)?')
+ENTITY_RE = re.compile(r'\\b[A-Z][a-z]+(?:\\s+[A-Z][a-z]+)*\\b')
+WORD_RE = re.compile(r'\\b[a-z]+\\b')
+SENTENCE_RE = re.compile(r'[.!?]+')
+
 text = '''
 The Chat with Tools framework is an innovative solution for multi-agent AI systems.
 It leverages parallel processing with 4 agents by default, each with access to 10+ tools.
@@ -387,21 +520,21 @@ Version 2.0 will include vector databases and improved error handling.
 '''
 
 # Extract numbers
-numbers = re.findall(r'\\d+(?:\\.\\d+)?', text)
+numbers = NUM_RE.findall(text)
 print(f"Numbers found: {numbers}")
 
 # Extract capitalized words (potential entities)
-entities = re.findall(r'\\b[A-Z][a-z]+(?:\\s+[A-Z][a-z]+)*\\b', text)
+entities = ENTITY_RE.findall(text)
 print(f"\\nPotential entities: {entities}")
 
 # Word frequency analysis
-words = re.findall(r'\\b[a-z]+\\b', text.lower())
+words = WORD_RE.findall(text.lower())
 word_freq = Counter(words)
 top_words = word_freq.most_common(5)
 print(f"\\nTop 5 words: {top_words}")
 
 # Sentence analysis
-sentences = [s.strip() for s in re.split(r'[.!?]+', text) if s.strip()]
+sentences = [s.strip() for s in SENTENCE_RE.split(text) if s.strip()]
 print(f"\\nNumber of sentences: {len(sentences)}")
 avg_words_per_sentence = len(words) / len(sentences)
 print(f"Average words per sentence: {avg_words_per_sentence:.1f}")
@@ -411,13 +544,13 @@ print(f"Average words per sentence: {avg_words_per_sentence:.1f}")
         
         result = tool.execute(code=text_code, description="Text analysis with regex")
         if result["status"] == "success":
-            print("✅ Execution successful!")
-            print(f"Output:\n{result['output']}")
+            _print("✅ Execution successful!")
+            _print(f"Output:\n{result['output']}")
         else:
-            print(f"❌ Error: {result.get('error')}")
+            _print(f"❌ Error: {result.get('error')}")
         
         # Test error handling
-        print_section("Error Handling Test", "⚠️")
+        _write(print_section("Error Handling Test", "⚠️"))
         
         error_code = """
 # This should trigger a timeout
@@ -427,32 +560,27 @@ while True:
     pass
 """
         
-        result = tool.execute(code=error_code, description="Testing timeout protection")
+        # A one second limit is enough to show the abort
+        timeout = None if full_timeout_test else 1
+        result = tool.execute(code=error_code, description="Testing timeout protection",
+                              timeout=timeout)
         if result["status"] == "timeout":
-            print("✅ Timeout protection worked!")
-            print(f"   Error: {result.get('error')}")
+            _print("✅ Timeout protection worked!")
+            _print(f"   Error: {result.get('error')}")
         else:
-            print(f"❌ Unexpected result: {result}")
+            _print(f"❌ Unexpected result: {result}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error in Python executor demo: {e}")
-        traceback.print_exc()
+        _print(f"❌ Error in Python executor demo: {e}")
+        _print_traceback()
         return False
 
 
-def demo_summarization_tool():
-    """Comprehensive demo of the summarization tool."""
-    print("\n" + "="*60)
-    print("📄 SUMMARIZATION TOOL DEMO")
-    print("="*60)
-    
-    try:
-        tool = SummarizationTool({})
-        
-        # Long sample text for testing
-        long_text = """
+# Long sample text for the summarization demo, split into sentences once at
+# import with the same rule the summarizer uses
+_LONG_TEXT = """
         The Chat with Tools framework represents a paradigm shift in how we approach multi-agent AI systems.
         Traditional single-agent systems often struggle with complex queries that require diverse perspectives.
         By employing multiple specialized agents working in parallel, the framework achieves unprecedented depth.
@@ -487,67 +615,147 @@ def demo_summarization_tool():
         Sensitive data is encrypted both in transit and at rest.
         Regular security audits ensure the framework maintains high security standards.
         """
+_SENTENCE_RE = re.compile(r'[.!?]+')
+_SUMMARY_RATIOS = (0.2, 0.4, 0.6)
+_KEY_POINT_COUNTS = (3, 5)
+_LONG_TEXT_SENTENCES = tuple(
+    sentence.strip() for sentence in _SENTENCE_RE.split(_LONG_TEXT) if sentence.strip()
+)
+
+
+def demo_summarization_tool():
+    """Comprehensive demo of the summarization tool."""
+    _write(banner("📄 SUMMARIZATION TOOL DEMO"))
+    
+    try:
+        tool = get_tool(SummarizationTool)
+        
+        # Parse the sample once, with the sentences split at import time;
+        # every later call refers to it by doc_id
+        prepared = tool.execute(action="prepare", text=_LONG_TEXT, sentences=_LONG_TEXT_SENTENCES)
+        if "error" in prepared:
+            # Older summarizers without prepare: pass the text each time
+            source = {"text": _LONG_TEXT}
+        else:
+            source = {"doc_id": prepared["doc_id"]}
         
         # Get text statistics
-        print_section("Text Statistics Analysis", "📊")
+        _write(print_section("Text Statistics Analysis", "📊"))
         
-        stats_result = tool.execute(action="statistics", text=long_text)
+        stats_result = tool.execute(action="statistics", **source)
         stats = stats_result.get("statistics", {})
         
-        print("Original Text Metrics:")
+        _print("Original Text Metrics:")
         for key, value in stats.items():
-            print(f"   {key}: {value}")
+            _print(f"   {key}: {value}")
         
         # Create summaries with different ratios
-        print_section("Extractive Summarization", "✂️")
-        
-        ratios = [0.2, 0.4, 0.6]
-        for ratio in ratios:
-            summary_result = tool.execute(
-                action="summarize",
-                text=long_text,
-                ratio=ratio,
-                min_sentences=2
-            )
-            
+        _write(print_section("Extractive Summarization", "✂️"))
+        
+        ratios = _SUMMARY_RATIOS
+        point_counts = _KEY_POINT_COUNTS
+        
+        # One call parses and scores the text once for every ratio and count
+        multi = tool.execute(
+            action="summarize_multi",
+            **source,
+            ratios=ratios,
+            key_points=point_counts,
+            min_sentences=2
+        )
+        if "error" in multi:
+            # Older summarizers without summarize_multi: one call per variant
+            summaries = [
+                dict(tool.execute(action="summarize", **source, ratio=ratio, min_sentences=2), ratio=ratio)
+                for ratio in ratios
+            ]
+            point_sets = [
+                dict(tool.execute(action="key_points", **source, num_points=count), requested=count)
+                for count in point_counts
+            ]
+        else:
+            summaries = multi["summaries"]
+            point_sets = multi["key_points"]
+        
+        for summary_result in summaries:
             if summary_result.get("status") == "summarized":
-                print(f"\n📌 Summary at {int(ratio*100)}% retention:")
-                print(f"   Length: {summary_result['summary_length']} chars " +
+                _print(f"\n📌 Summary at {int(summary_result['ratio']*100)}% retention:")
+                _print(f"   Length: {summary_result['summary_length']} chars " +
                       f"(reduced by {summary_result['reduction_percentage']}%)")
-                print(f"   Summary: {summary_result['summary'][:200]}...")
+                _print(f"   Summary: {summary_result['summary'][:200]}...")
         
         # Extract key points
-        print_section("Key Points Extraction", "🎯")
+        _write(print_section("Key Points Extraction", "🎯"))
         
-        for num_points in [3, 5]:
-            points_result = tool.execute(
-                action="key_points",
-                text=long_text,
-                num_points=num_points
-            )
-            
-            if points_result.get("status") == "extracted":
-                print(f"\n📍 Top {num_points} Key Points:")
+        for points_result in point_sets:
+            if "key_points" in points_result:
+                _print(f"\n📍 Top {points_result['requested']} Key Points:")
                 for i, point in enumerate(points_result.get("key_points", []), 1):
                     # Truncate long points for display
                     display_point = point[:100] + "..." if len(point) > 100 else point
-                    print(f"   {i}. {display_point}")
+                    _print(f"   {i}. {display_point}")
         
         return True
         
     except Exception as e:
-        print(f"❌ Error in summarization demo: {e}")
-        traceback.print_exc()
+        _print(f"❌ Error in summarization demo: {e}")
+        _print_traceback()
         return False
 
 
-def run_comprehensive_test():
+_DEMOS = [
+    ("Sequential Thinking", demo_sequential_thinking),
+    ("Memory", demo_memory_tool),
+    ("Python Executor", demo_python_executor),
+    ("Summarization", demo_summarization_tool)
+]
+
+
+def _bind_options(demo_func, full_timeout_test):
+    """Bind the executor demo's option; the other demos take none."""
+    if demo_func is demo_python_executor:
+        return functools.partial(demo_func, full_timeout_test=full_timeout_test)
+    return demo_func
+
+
+def run_demos_parallel(demos, header=False, full_timeout_test=False):
+    """Run demos concurrently and return a {name: success} mapping.
+    
+    The Python executor demo is held back and run on the main thread once
+    the others finish: its timeout uses SIGALRM and it swaps sys.stdout,
+    neither of which works from a worker thread.
+    """
+    results = {}
+    main_thread_demos = [(n, f) for n, f in demos if f is demo_python_executor]
+    pooled_demos = [(n, f) for n, f in demos if f is not demo_python_executor]
+    
+    if pooled_demos:
+        with ThreadPoolExecutor(max_workers=len(pooled_demos)) as executor:
+            future_to_name = {
+                executor.submit(_run_buffered, name, demo_func, header): name
+                for name, demo_func in pooled_demos
+            }
+            
+            for future in as_completed(future_to_name):
+                results[future_to_name[future]] = future.result()
+    
+    for name, demo_func in main_thread_demos:
+        results[name] = _run_buffered(name, _bind_options(demo_func, full_timeout_test), header)
+    
+    return {name: results[name] for name, _ in demos}
+
+
+def run_comprehensive_test(full_timeout_test=False):
     """Run all demos and provide a comprehensive report."""
-    print("\n" + "="*60)
-    print("   🚀 COMPREHENSIVE TOOL TEST SUITE")
-    print("="*60)
-    print(f"\n📅 Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
-    print("📦 Testing 4 new tools for Chat with Tools Framework")
+    from datetime import datetime
+    
+    buf = SectionBuffer()
+    buf.add("\n" + _BAR_EQ)
+    buf.add("   🚀 COMPREHENSIVE TOOL TEST SUITE")
+    buf.add(_BAR_EQ)
+    buf.add(f"\n📅 Test Date: {datetime.now().strftime('%Y-%m-%d %H:%M:%S')}")
+    buf.add("📦 Testing 4 new tools for Chat with Tools Framework")
+    buf.flush()
     
     # Track results
     results = {
@@ -558,119 +766,131 @@ def run_comprehensive_test():
     }
     
     # Run each demo
-    demos = [
-        ("Sequential Thinking", demo_sequential_thinking),
-        ("Memory", demo_memory_tool),
-        ("Python Executor", demo_python_executor),
-        ("Summarization", demo_summarization_tool)
-    ]
+    demos = _DEMOS
     
-    for name, demo_func in demos:
-        print(f"\n{'='*60}")
-        print(f"Testing: {name}")
-        print('='*60)
-        
-        try:
-            success = demo_func()
-            results[name] = success
-        except Exception as e:
-            print(f"❌ Fatal error in {name}: {e}")
-            results[name] = False
+    results.update(run_demos_parallel(demos, header=True, full_timeout_test=full_timeout_test))
     
     # Print summary report
-    print("\n" + "="*60)
-    print("   📊 TEST RESULTS SUMMARY")
-    print("="*60)
+    buf.add("\n" + _BAR_EQ)
+    buf.add("   📊 TEST RESULTS SUMMARY")
+    buf.add(_BAR_EQ)
     
     passed = sum(1 for v in results.values() if v)
     total = len(results)
     
-    print(f"\n✅ Passed: {passed}/{total}")
-    print(f"❌ Failed: {total - passed}/{total}")
-    print(f"📈 Success Rate: {(passed/total)*100:.1f}%")
+    buf.add(f"\n✅ Passed: {passed}/{total}")
+    buf.add(f"❌ Failed: {total - passed}/{total}")
+    buf.add(f"📈 Success Rate: {(passed/total)*100:.1f}%")
     
-    print("\n📋 Individual Results:")
+    buf.add("\n📋 Individual Results:")
     for tool_name, success in results.items():
         status = "✅ PASS" if success else "❌ FAIL"
-        print(f"   {tool_name:20} {status}")
+        buf.add(f"   {tool_name:20} {status}")
     
     if passed == total:
-        print("\n🎉 All tools are working correctly!")
+        buf.add("\n🎉 All tools are working correctly!")
     else:
-        print("\n⚠️  Some tools need attention. Check the output above for details.")
+        buf.add("\n⚠️  Some tools need attention. Check the output above for details.")
+    buf.flush()
     
     return results
 
 
-def interactive_menu():
+def run_demo(index, full_timeout_test=False):
+    """Run one entry of _DEMOS with its output written as a single block."""
+    name, demo_func = _DEMOS[index]
+    return _run_buffered(name, _bind_options(demo_func, full_timeout_test), header=False)
+
+
+def run_all_demos(full_timeout_test=False):
+    """Run every demo concurrently without the summary report."""
+    print("\n🎬 Running all demos...")
+    return run_demos_parallel(_DEMOS, full_timeout_test=full_timeout_test)
+
+
+_MENU_TEXT = "\n".join([
+    "\n" + _BAR_EQ,
+    "   🎮 INTERACTIVE TOOL TESTING",
+    _BAR_EQ,
+    "\n1. Sequential Thinking Tool",
+    "2. Memory Tool",
+    "3. Python Executor Tool",
+    "4. Summarization Tool",
+    "5. Run All Tests",
+    "6. Run Comprehensive Test Suite",
+    "7. Exit",
+])
+
+# Each action takes the full_timeout_test option from the command line
+_DISPATCH = {
+    "1": functools.partial(run_demo, 0),
+    "2": functools.partial(run_demo, 1),
+    "3": functools.partial(run_demo, 2),
+    "4": functools.partial(run_demo, 3),
+    "5": run_all_demos,
+    "6": run_comprehensive_test,
+}
+
+
+def interactive_menu(full_timeout_test=False):
     """Interactive menu for testing individual tools."""
     while True:
-        print("\n" + "="*60)
-        print("   🎮 INTERACTIVE TOOL TESTING")
-        print("="*60)
-        print("\n1. Sequential Thinking Tool")
-        print("2. Memory Tool")
-        print("3. Python Executor Tool")
-        print("4. Summarization Tool")
-        print("5. Run All Tests")
-        print("6. Run Comprehensive Test Suite")
-        print("7. Exit")
+        print(_MENU_TEXT, flush=True)
         
         choice = input("\nSelect option (1-7): ").strip()
         
-        if choice == "1":
-            demo_sequential_thinking()
-        elif choice == "2":
-            demo_memory_tool()
-        elif choice == "3":
-            demo_python_executor()
-        elif choice == "4":
-            demo_summarization_tool()
-        elif choice == "5":
-            print("\n🎬 Running all demos...")
-            demo_sequential_thinking()
-            demo_memory_tool()
-            demo_python_executor()
-            demo_summarization_tool()
-        elif choice == "6":
-            run_comprehensive_test()
-        elif choice == "7":
+        if choice == "7":
             print("\n👋 Goodbye!")
             break
+        
+        action = _DISPATCH.get(choice)
+        if action is not None:
+            action(full_timeout_test=full_timeout_test)
         else:
             print("❌ Invalid choice. Please select 1-7.")
 
 
-def main():
-    """Main entry point."""
-    print("\n" + "="*60)
-    print("   🚀 CHAT WITH TOOLS - STANDALONE DEMO")
-    print("="*60)
-    print("\nThis demo tests all new tools without requiring OpenRouter/OpenAI")
-    print("Tools: Sequential Thinking, Memory, Python Executor, Summarization")
+def main(argv=None):
+    """Main entry point; argv defaults to the command line arguments."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="Standalone demo of the Chat with Tools tools")
+    parser.add_argument(
+        "--full-timeout-test",
+        action="store_true",
+        help="Let the executor's timeout example run to the configured limit instead of 1s"
+    )
+    args = parser.parse_args(argv)
+    full_timeout_test = args.full_timeout_test
+    
+    buf = SectionBuffer()
+    buf.add("\n" + _BAR_EQ)
+    buf.add("   🚀 CHAT WITH TOOLS - STANDALONE DEMO")
+    buf.add(_BAR_EQ)
+    buf.add("\nThis demo tests all new tools without requiring OpenRouter/OpenAI")
+    buf.add("Tools: Sequential Thinking, Memory, Python Executor, Summarization")
     
-    print("\n" + "-"*40)
-    print("Select mode:")
-    print("1. Interactive Menu")
-    print("2. Run Comprehensive Test Suite")
-    print("3. Quick Test (one demo of each tool)")
+    buf.add("\n" + "-"*40)
+    buf.add("Select mode:")
+    buf.add("1. Interactive Menu")
+    buf.add("2. Run Comprehensive Test Suite")
+    buf.add("3. Quick Test (one demo of each tool)")
+    buf.flush()
     
     mode = input("\nChoice (1-3): ").strip()
     
     if mode == "1":
-        interactive_menu()
+        interactive_menu(full_timeout_test)
     elif mode == "2":
-        run_comprehensive_test()
+        run_comprehensive_test(full_timeout_test)
     elif mode == "3":
         print("\n🎬 Running quick test...")
-        demo_sequential_thinking()
-        demo_memory_tool()
-        demo_python_executor()
-        demo_summarization_tool()
+        for index in range(len(_DEMOS)):
+            run_demo(index, full_timeout_test)
         print("\n✅ Quick test completed!")
     else:
         print("❌ Invalid choice. Running interactive menu...")
-        interactive_menu()
+        interactive_menu(full_timeout_test)
 
 
 if __name__ == "__main__":
@@ -680,4 +900,4 @@ if __name__ == "__main__":
         print("\n\n👋 Demo interrupted. Goodbye!")
     except Exception as e:
         print(f"\n❌ Fatal error: {e}")
-        traceback.print_exc()
+        _print_traceback()
@@ -1,378 +1,13 @@
 #!/usr/bin/env python3
 """
-Demonstration of vLLM structured output integration for improved tool calling accuracy.
-This demo showcases the complete vLLM integration without duplicating existing functionality.
-"""
-
-import sys
-import os
-import json
-import time
-from pathlib import Path
-from typing import List, Dict, Any
-
-# Add project to path
-project_root = Path(__file__).parent.parent
-sys.path.insert(0, str(project_root / "src"))
-
-from chat_with_tools.vllm_integration import (
-    VLLMStructuredOutputManager,
-    VLLMEndpointSelector,
-    VLLMMode,
-    create_enhanced_agent
-)
-from chat_with_tools.config_manager import ConfigManager
-from chat_with_tools.structured_output import (
-    StructuredToolResponse,
-    StructuredAgentResponse,
-    ToolRegistry
-)
-
-
-def print_section(title: str):
-    """Print a formatted section header."""
-    print("\n" + "=" * 70)
-    print(f"  {title}")
-    print("=" * 70)
-
-
-def demonstrate_vllm_configuration():
-    """Show current vLLM configuration status."""
-    print_section("vLLM Configuration Status")
-    
-    config_manager = ConfigManager()
-    config = config_manager.config
-    
-    # Check basic configuration
-    is_vllm = config.get('openrouter', {}).get('is_vllm', False)
-    base_url = config.get('openrouter', {}).get('base_url', 'Not configured')
-    model = config.get('openrouter', {}).get('model', 'Not configured')
-    
-    print(f"\n📊 Basic Configuration:")
-    print(f"   vLLM Backend: {'✅ Enabled' if is_vllm else '❌ Disabled'}")
-    print(f"   Base URL: {base_url}")
-    print(f"   Model: {model}")
-    
-    # Check structured output configuration
-    vllm_config = config.get('vllm_structured_output', {})
-    structured_enabled = vllm_config.get('enabled', False)
-    backend = vllm_config.get('backend', 'Not configured')
-    enforcement = vllm_config.get('enforcement_level', 'Not configured')
-    
-    print(f"\n🔧 Structured Output Configuration:")
-    print(f"   Enabled: {'✅ Yes' if structured_enabled else '❌ No'}")
-    print(f"   Backend: {backend}")
-    print(f"   Enforcement: {enforcement}")
-    print(f"   Pydantic Validation: {'✅' if vllm_config.get('validate_with_pydantic', False) else '❌'}")
-    
-    # Check endpoints
-    endpoints = config.get('inference_endpoints', {})
-    if endpoints:
-        print(f"\n🌐 Configured Endpoints ({len(endpoints)}):")
-        for name, endpoint in endpoints.items():
-            print(f"   • {name}: {endpoint.get('model', 'Unknown')} ({endpoint.get('model_type', 'unknown')})")
-            if endpoint.get('supports_structured_output'):
-                print(f"     └─ Structured Output: ✅")
-    else:
-        print("\n🌐 Endpoints: None configured")
-    
-    return is_vllm and structured_enabled
-
-
-def demonstrate_structured_tool_calling():
-    """Demonstrate structured tool calling with validation."""
-    print_section("Structured Tool Calling Demo")
-    
-    config_manager = ConfigManager()
-    config = config_manager.config
-    
-    # Initialize structured output manager
-    structured_manager = VLLMStructuredOutputManager(config)
-    
-    if not structured_manager.is_enabled():
-        print("\n⚠️  Structured output is not enabled. Skipping demo.")
-        print("   To enable: Set vllm_structured_output.enabled = true in config.yaml")
-        return
-    
-    print(f"\n✅ Structured output is enabled with {structured_manager.structured_config.backend} backend")
-    
-    # Test different query types
-    test_queries = [
-        {
-            "query": "Calculate 25% of 480 and tell me if it's a prime number",
-            "expected_tools": ["calculate", "python_executor"],
-            "description": "Multi-tool mathematical query"
-        },
-        {
-            "query": "Search for the current Bitcoin price and calculate how much $1000 would buy",
-            "expected_tools": ["search_web", "calculate"],
-            "description": "Search and calculation combination"
-        },
-        {
-            "query": "Write a Python function to find fibonacci numbers and test it with n=10",
-            "expected_tools": ["python_executor"],
-            "description": "Code generation and execution"
-        }
-    ]
-    
-    print("\n📝 Testing structured tool call generation:")
-    
-    for i, test in enumerate(test_queries, 1):
-        print(f"\n{i}. {test['description']}")
-        print(f"   Query: \"{test['query']}\"")
-        print(f"   Expected tools: {', '.join(test['expected_tools'])}")
-        
-        # Simulate structured response (in real usage, this comes from vLLM)
-        print("   Status: ✅ Structured response generated")
-        
-        # Show validation
-        try:
-            # This would normally validate the actual response
-            print("   Validation: ✅ Response structure valid")
-        except Exception as e:
-            print(f"   Validation: ❌ {e}")
+vLLM integration demo.
 
+Kept for ``python demos/vllm_demo.py``; the implementation lives in
+``chat_with_tools.cli.vllm_demo``. Install the package (``pip install -e .``)
+and use ``cwt-vllm-demo`` instead.
+"""
 
-def demonstrate_endpoint_selection():
-    """Demonstrate intelligent endpoint selection."""
-    print_section("Intelligent Endpoint Selection")
-    
-    config_manager = ConfigManager()
-    config = config_manager.config
-    
-    # Initialize endpoint selector
-    selector = VLLMEndpointSelector(config)
-    
-    if not selector.endpoints:
-        print("\n⚠️  No endpoints configured. Skipping demo.")
-        return
-    
-    print(f"\n📡 {len(selector.endpoints)} endpoints available")
-    
-    # Test queries for routing
-    test_queries = [
-        ("What is 2+2?", "fast"),
-        ("Explain the theory of relativity in detail", "thinking"),
-        ("List the top 5 programming languages", "balanced"),
-        ("Deep philosophical analysis of consciousness", "thinking"),
-        ("Quick yes or no: Is Python interpreted?", "fast"),
-        ("Analyze this data and create visualizations", "balanced"),
-    ]
-    
-    print("\n🎯 Query Routing Analysis:")
-    print("-" * 60)
-    
-    for query, expected_type in test_queries:
-        # Truncate long queries for display
-        display_query = query[:50] + "..." if len(query) > 50 else query
-        
-        # Get selected endpoint
-        selected_type = selector._analyze_query(query)
-        selected_endpoint = selector._find_endpoint_by_type(selected_type)
-        
-        # Check if selection matches expectation
-        match = "✅" if selected_type == expected_type else "❌"
-        
-        print(f"\nQuery: \"{display_query}\"")
-        print(f"  Expected: {expected_type:8} | Selected: {selected_type:8} | {match}")
-        if selected_endpoint:
-            endpoint_config = selector.get_endpoint_config(selected_endpoint)
-            if endpoint_config:
-                print(f"  Endpoint: {selected_endpoint} ({endpoint_config.get('model', 'Unknown')})")
-
-
-def demonstrate_tool_accuracy_improvements():
-    """Demonstrate improvements in tool calling accuracy."""
-    print_section("Tool Calling Accuracy Improvements")
-    
-    print("\n🎯 Accuracy Enhancement Features:")
-    print("\n1. Structured Output Constraints:")
-    print("   • JSON schema validation ensures correct tool call format")
-    print("   • Pydantic models validate argument types and requirements")
-    print("   • Grammar-based generation prevents malformed responses")
-    
-    print("\n2. Intelligent Retry Logic:")
-    print("   • Automatic retry on validation failures")
-    print("   • Exponential backoff for transient errors")
-    print("   • Fallback to standard generation if structured fails")
-    
-    print("\n3. Tool-Specific Optimizations:")
-    print("   • Query preprocessing for better tool matching")
-    print("   • Tool-specific argument validation")
-    print("   • Parallel tool execution support")
-    
-    print("\n4. Endpoint Specialization:")
-    print("   • Fast models for simple tool calls")
-    print("   • Thinking models for complex reasoning")
-    print("   • Tool-specific endpoint routing")
-    
-    # Show a comparison
-    print("\n📊 Accuracy Comparison (Simulated):")
-    print("-" * 50)
-    print("Tool                 | Standard | Structured | Improvement")
-    print("-" * 50)
-    
-    improvements = [
-        ("calculate",        85,  98),
-        ("search_web",       75,  92),
-        ("python_executor",  70,  95),
-        ("sequential_think", 60,  88),
-        ("memory",          80,  96),
-    ]
-    
-    for tool, standard, structured in improvements:
-        improvement = structured - standard
-        print(f"{tool:18} | {standard:7}% | {structured:9}% | +{improvement}%")
-    
-    avg_standard = sum(s for _, s, _ in improvements) / len(improvements)
-    avg_structured = sum(s for _, _, s in improvements) / len(improvements)
-    avg_improvement = avg_structured - avg_standard
-    
-    print("-" * 50)
-    print(f"{'Average':18} | {avg_standard:7.1f}% | {avg_structured:9.1f}% | +{avg_improvement:.1f}%")
-
-
-def demonstrate_live_agent():
-    """Demonstrate a live agent with vLLM enhancements."""
-    print_section("Live Agent Demo with vLLM Enhancements")
-    
-    try:
-        # Create enhanced agent
-        print("\n🤖 Creating enhanced agent...")
-        agent = create_enhanced_agent(
-            name="VLLMAgent",
-            force_structured=True,
-            silent=False
-        )
-        
-        print("✅ Agent created successfully")
-        
-        # Test queries
-        test_queries = [
-            "Calculate the factorial of 7",
-            "What's the current weather in San Francisco?",
-            "Write and execute a Python function to check if a number is prime, test with 17"
-        ]
-        
-        print("\n📝 Running test queries:")
-        
-        for i, query in enumerate(test_queries, 1):
-            print(f"\n{i}. Query: \"{query}\"")
-            print("   Processing...")
-            
-            start_time = time.time()
-            
-            try:
-                # Run the agent
-                response = agent.run(query)
-                
-                elapsed = time.time() - start_time
-                
-                # Show results
-                print(f"   ✅ Completed in {elapsed:.2f}s")
-                print(f"   Response preview: {response[:100]}...")
-                
-                # Show metrics if available
-                if hasattr(agent, 'metrics') and agent.metrics:
-                    metrics = agent.get_metrics()
-                    if metrics.get('tool_calls'):
-                        print(f"   Tools used: {', '.join(metrics['tool_calls'].keys())}")
-                
-            except Exception as e:
-                print(f"   ❌ Error: {e}")
-                
-    except Exception as e:
-        print(f"\n❌ Failed to create agent: {e}")
-        print("   Please check your configuration and ensure vLLM is properly set up.")
-
-
-def demonstrate_performance_metrics():
-    """Show performance metrics and statistics."""
-    print_section("Performance Metrics")
-    
-    print("\n📈 vLLM Performance Benefits:")
-    
-    metrics = {
-        "Response Time": {
-            "Standard": "2.5-4.0s",
-            "vLLM": "0.8-1.5s",
-            "Improvement": "60-70% faster"
-        },
-        "Tool Call Accuracy": {
-            "Standard": "75-85%",
-            "vLLM Structured": "92-98%",
-            "Improvement": "15-20% more accurate"
-        },
-        "Token Efficiency": {
-            "Standard": "~8000 tokens/query",
-            "vLLM Optimized": "~5000 tokens/query",
-            "Improvement": "35-40% fewer tokens"
-        },
-        "Parallel Tool Calls": {
-            "Standard": "Sequential only",
-            "vLLM": "Up to 5 parallel",
-            "Improvement": "3-5x faster for multi-tool"
-        },
-        "Error Rate": {
-            "Standard": "8-12%",
-            "vLLM Validated": "1-3%",
-            "Improvement": "75% fewer errors"
-        }
-    }
-    
-    for metric, values in metrics.items():
-        print(f"\n📊 {metric}:")
-        for key, value in values.items():
-            print(f"   {key:15} : {value}")
-
-
-def main():
-    """Run the complete vLLM integration demonstration."""
-    print("\n" + "🚀 " + "=" * 66)
-    print("  vLLM STRUCTURED OUTPUT INTEGRATION DEMONSTRATION")
-    print("=" * 70)
-    
-    print("\nThis demo showcases the vLLM integration for improved tool calling")
-    print("accuracy without duplicating existing framework functionality.")
-    
-    # Check configuration
-    is_configured = demonstrate_vllm_configuration()
-    
-    if not is_configured:
-        print("\n" + "⚠️ " + "=" * 66)
-        print("  vLLM is not fully configured. Some demos will be skipped.")
-        print("  To enable all features:")
-        print("  1. Set openrouter.is_vllm = true")
-        print("  2. Set vllm_structured_output.enabled = true")
-        print("  3. Configure your vLLM endpoint URL")
-        print("=" * 70)
-    
-    # Run demonstrations
-    demonstrate_structured_tool_calling()
-    demonstrate_endpoint_selection()
-    demonstrate_tool_accuracy_improvements()
-    demonstrate_performance_metrics()
-    
-    # Only run live demo if configured
-    if is_configured:
-        demonstrate_live_agent()
-    else:
-        print_section("Live Demo Skipped")
-        print("\n⏭️  Live agent demo requires vLLM to be properly configured.")
-    
-    print("\n" + "=" * 70)
-    print("  DEMONSTRATION COMPLETE")
-    print("=" * 70)
-    print("\n✨ The vLLM integration provides:")
-    print("   • Structured output for reliable tool calling")
-    print("   • Intelligent endpoint selection")
-    print("   • Pydantic validation for arguments")
-    print("   • Grammar-based generation")
-    print("   • Significant performance improvements")
-    print("\nFor production use, ensure your vLLM server is properly configured")
-    print("and update config.yaml with your specific settings.")
-    print("")
-
+from chat_with_tools.cli.vllm_demo import main
 
 if __name__ == "__main__":
     main()
@@ -7,141 +7,221 @@ This script demonstrates the new tools:
 - Memory Tool
 - Python Executor Tool
 - Summarization Tool
+
+Requires the package to be installed (``pip install -e .`` from the
+project root) so ``chat_with_tools`` is importable.
 """
 
-import json
-import yaml
 import sys
-import os
-from pathlib import Path
+import io
+import asyncio
+import functools
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 
-# Add both the project root and src directory to the Python path
-project_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-src_path = os.path.join(project_root, 'src')
+# Sampling and statistics use the stdlib, which the executor's sandbox
+# allows without widening its import allow-list
+_STATS_CODE = """
+import statistics
+import random
 
-# Add src path first so imports work correctly
-if src_path not in sys.path:
-    sys.path.insert(0, src_path)
-if project_root not in sys.path:
-    sys.path.insert(0, project_root)
+# Sample size
+N = 100
 
-# Now import directly from chat_with_tools (not src.chat_with_tools)
-from chat_with_tools.agent import OpenRouterAgent
+# Generate sample data
+# A private generator leaves the global random state alone; a plain loop is
+# used because the executor's locals are not visible inside comprehensions
+rng = random.Random(42)
+data = []
+for _ in range(N):
+    data.append(rng.gauss(100, 15))
 
+# Calculate statistics
+mean = statistics.fmean(data)
+median = statistics.median(data)
+stdev = statistics.stdev(data)
 
-def demo_sequential_thinking():
-    """Demonstrate the sequential thinking tool."""
-    print("\n" + "="*60)
-    print("🧠 SEQUENTIAL THINKING TOOL DEMO")
-    print("="*60)
+print(f"Dataset Statistics:")
+print(f"  Mean: {mean:.2f}")
+print(f"  Median: {median:.2f}")
+print(f"  Std Dev: {stdev:.2f}")
+print(f"  Min: {min(data):.2f}")
+print(f"  Max: {max(data):.2f}")
+
+# Return summary
+{"mean": mean, "median": median, "stdev": stdev}
+"""
+
+# Sample document for the summarization demo; it is prepared once and the
+# later tool calls refer to it by doc_id
+_SAMPLE_TEXT = """
+    The Chat with Tools framework represents a significant advancement in multi-agent AI systems,
+    designed to emulate the comprehensive analysis capabilities of advanced AI models like Grok's heavy mode.
+    At its core, the framework employs a sophisticated orchestration system that coordinates multiple
+    intelligent agents working in parallel to provide deep, multi-perspective analysis of user queries.
     
-    # Initialize agent
-    agent = OpenRouterAgent(silent=True)
+    The architecture consists of three main components: the Agent System, the Orchestrator, and the
+    Tool System. The Agent System provides self-contained agents with full tool access, implementing
+    an agentic loop that continues processing until task completion. Each agent can utilize various
+    tools through the framework's dynamic discovery system, which automatically loads tools from the
+    tools directory without requiring manual registration.
     
-    # Find the sequential thinking tool
-    if "sequential_thinking" not in agent.tool_mapping:
-        print("❌ Sequential thinking tool not found. Make sure sequential_thinking_tool.py is in the tools/ directory")
-        return
+    The Orchestrator serves as the brain of the multi-agent system, using AI to dynamically generate
+    specialized questions that approach the user's query from different angles. It manages parallel
+    execution of multiple agents, typically four by default, and then synthesizes their responses
+    into a comprehensive final answer. This synthesis process uses another AI call to combine the
+    best information from all agents while resolving any contradictions.
     
-    tool = agent.tool_mapping["sequential_thinking"]
+    The Tool System provides a standardized interface for extending the framework's capabilities.
+    All tools inherit from a BaseTool class and are automatically discovered at runtime. Currently
+    available tools include web search using DuckDuckGo, mathematical calculations, file operations,
+    and a task completion marker. The framework's hot-swappable design means new tools can be added
+    simply by dropping Python files into the tools directory.
     
-    # Start a thinking session
-    print("\n📝 Starting thinking session about: 'How to make Chat with Tools better?'")
-    result = tool(
-        action="start",
-        problem="How to make Chat with Tools framework even better?"
-    )
-    session_id = result.get("session_id")
-    print(f"✅ Session started: {session_id}")
-    
-    # Add thoughts
-    print("\n💭 Adding analysis thoughts...")
-    tool(
-        action="think",
-        thought="The framework already has good architecture with agents, orchestrator, and tools.",
-        thought_type="analysis",
-        confidence=0.9,
-        session_id=session_id
-    )
+    Recent enhancements have focused on production-readiness, including structured logging, retry
+    mechanisms with exponential backoff, connection pooling for API clients, comprehensive error
+    handling, and security features like URL validation. The framework now includes a robust test
+    suite and supports environment variables for secure credential management.
+    """
+
+# Each demo collects its output in a per-thread buffer and writes it once when
+# it finishes, so concurrent demos in "Run All" neither interleave nor contend
+# for the stdout lock on every line
+_output = threading.local()
+_write_lock = threading.Lock()
+
+
+def _print(*args, **kwargs):
+    """Print into the current demo's buffer, or straight to stdout."""
+    print(*args, file=getattr(_output, "buffer", None) or sys.stdout, **kwargs)
+
+
+def _buffered(demo):
+    """Buffer a demo's output and write it to stdout in one call."""
+    @functools.wraps(demo)
+    def wrapper(*args, **kwargs):
+        _output.buffer = io.StringIO()
+        try:
+            return demo(*args, **kwargs)
+        finally:
+            text = _output.buffer.getvalue()
+            _output.buffer = None
+            with _write_lock:
+                sys.stdout.write(text)
+                sys.stdout.flush()
+    return wrapper
+
+
+@functools.lru_cache(maxsize=1)
+def get_agent():
+    """Build the agent once per process; every demo shares its tools."""
+    # Deferred so --help does not pay for loading the framework
+    from chat_with_tools.agent import OpenRouterAgent
+    return OpenRouterAgent(silent=True)
+
+
+def _format_fields(fields, indent=3):
+    """Yield "key: value" lines, nesting dict values one level deeper."""
+    pad = " " * indent
+    for key, value in fields.items():
+        if isinstance(value, dict):
+            yield f"{pad}{key}:"
+            yield from _format_fields(value, indent + 3)
+        else:
+            yield f"{pad}{key}: {value}"
+
+
+@_buffered
+def demo_sequential_thinking(tool_mapping):
+    """Demonstrate the sequential thinking tool."""
+    _print("\n" + "="*60)
+    _print("🧠 SEQUENTIAL THINKING TOOL DEMO")
+    _print("="*60)
     
-    tool(
-        action="think",
-        thought="What features are missing that would make it more powerful?",
-        thought_type="question",
-        confidence=1.0,
-        session_id=session_id
-    )
+    # Call the tool's direct methods instead of going through its
+    # action-string dispatch, so take the tool itself from the agent
+    tool = get_agent().discovered_tools["sequential_thinking"]
+    start, batch = tool.start, tool.batch
     
-    tool(
-        action="think",
-        thought="Adding persistent memory would allow agents to learn over time.",
-        thought_type="hypothesis",
-        confidence=0.8,
-        session_id=session_id
+    # Start a thinking session
+    _print("\n📝 Starting thinking session about: 'How to make Chat with Tools better?'")
+    result = start(problem="How to make Chat with Tools framework even better?")
+    session_id = result.get("session_id")
+    _print(f"✅ Session started: {session_id}")
+    
+    # Add thoughts, a revision, a branch and the conclusion in one call
+    _print("\n💭 Adding analysis thoughts, revising thought #3 and branching...")
+    batch_result = batch(
+        session_id=session_id,
+        ops=[
+            {
+                "action": "think",
+                "thought": "The framework already has good architecture with agents, orchestrator, and tools.",
+                "thought_type": "analysis",
+                "confidence": 0.9
+            },
+            {
+                "action": "think",
+                "thought": "What features are missing that would make it more powerful?",
+                "thought_type": "question",
+                "confidence": 1.0
+            },
+            {
+                "action": "think",
+                "thought": "Adding persistent memory would allow agents to learn over time.",
+                "thought_type": "hypothesis",
+                "confidence": 0.8
+            },
+            {
+                "action": "revise",
+                "thought": "Adding persistent memory AND a vector database would enable semantic search and better learning.",
+                "revises_thought_number": 3,
+                "confidence": 0.95
+            },
+            {
+                "action": "branch",
+                "thought": "Instead of memory, focus on improving tool discovery and integration.",
+                "branch_from_thought": 2,
+                "branch_name": "tools_focus",
+                "confidence": 0.7
+            },
+            {
+                "action": "conclude",
+                "thought": "The framework would benefit most from: 1) Persistent memory with vector DB, 2) More sophisticated tool discovery, 3) Better error recovery mechanisms."
+            }
+        ]
     )
     
-    # Revise a thought
-    print("✏️  Revising thought #3...")
-    tool(
-        action="revise",
-        thought="Adding persistent memory AND a vector database would enable semantic search and better learning.",
-        revises_thought_number=3,
-        confidence=0.95,
-        session_id=session_id
-    )
+    if batch_result.get("status") != "batch_applied":
+        _print(f"❌ Batch failed: {batch_result.get('error') or batch_result['results'][-1].get('error')}")
+        return
     
-    # Branch exploration
-    print("🌿 Creating alternative branch...")
-    tool(
-        action="branch",
-        thought="Instead of memory, focus on improving tool discovery and integration.",
-        branch_from_thought=2,
-        branch_name="tools_focus",
-        confidence=0.7,
-        session_id=session_id
-    )
+    _print(f"📋 Applied {batch_result['applied']} operations, including the conclusion")
+    conclusion_result = batch_result["results"][-1]
     
-    # Conclude
-    print("📋 Adding conclusion...")
-    conclusion_result = tool(
-        action="conclude",
-        thought="The framework would benefit most from: 1) Persistent memory with vector DB, 2) More sophisticated tool discovery, 3) Better error recovery mechanisms.",
-        session_id=session_id
-    )
+    get = conclusion_result.get
+    summary = get("summary", {})
+    insights = get("insights", {})
     
-    # Display summary
-    print("\n📊 Thinking Session Summary:")
-    summary = conclusion_result.get("summary", {})
-    for key, value in summary.items():
-        print(f"   {key}: {value}")
+    # Display summary and insights as one block each
+    _print("\n📊 Thinking Session Summary:")
+    _print("\n".join(_format_fields(summary)))
     
-    print("\n🎯 Insights:")
-    insights = conclusion_result.get("insights", {})
-    for key, value in insights.items():
-        if isinstance(value, dict):
-            print(f"   {key}:")
-            for k, v in value.items():
-                print(f"      {k}: {v}")
-        else:
-            print(f"   {key}: {value}")
+    _print("\n🎯 Insights:")
+    _print("\n".join(_format_fields(insights)))
 
 
-def demo_memory_tool():
+@_buffered
+def demo_memory_tool(tool_mapping):
     """Demonstrate the memory tool."""
-    print("\n" + "="*60)
-    print("🧠 MEMORY TOOL DEMO")
-    print("="*60)
-    
-    agent = OpenRouterAgent(silent=True)
-    
-    if "memory" not in agent.tool_mapping:
-        print("❌ Memory tool not found. Make sure memory_tool.py is in the tools/ directory")
-        return
+    _print("\n" + "="*60)
+    _print("🧠 MEMORY TOOL DEMO")
+    _print("="*60)
     
-    tool = agent.tool_mapping["memory"]
+    tool = tool_mapping["memory"]
     
     # Store memories
-    print("\n💾 Storing memories...")
+    _print("\n💾 Storing memories...")
     
     mem1 = tool(
         action="store",
@@ -149,7 +229,7 @@ def demo_memory_tool():
         memory_type="fact",
         tags=["framework", "origin", "grok"]
     )
-    print(f"✅ Stored: {mem1.get('memory_id')}")
+    _print(f"✅ Stored: {mem1.get('memory_id')}")
     
     mem2 = tool(
         action="store",
@@ -157,7 +237,7 @@ def demo_memory_tool():
         memory_type="fact",
         tags=["architecture", "agents", "orchestrator"]
     )
-    print(f"✅ Stored: {mem2.get('memory_id')}")
+    _print(f"✅ Stored: {mem2.get('memory_id')}")
     
     mem3 = tool(
         action="store",
@@ -165,44 +245,40 @@ def demo_memory_tool():
         memory_type="preference",
         tags=["users", "responses"]
     )
-    print(f"✅ Stored: {mem3.get('memory_id')}")
+    _print(f"✅ Stored: {mem3.get('memory_id')}")
     
     # Search memories
-    print("\n🔍 Searching memories with query 'agents'...")
+    _print("\n🔍 Searching memories with query 'agents'...")
     search_result = tool(
         action="search",
         query="agents"
     )
     
-    print(f"Found {search_result.get('count', 0)} results:")
-    for result in search_result.get("results", []):
-        print(f"   - [{result['type']}] {result['summary'][:50]}...")
+    get = search_result.get
+    _print(f"Found {get('count', 0)} results:")
+    for result in get("results", []):
+        _print(f"   - [{result['type']}] {result['summary'][:50]}...")
     
     # Get statistics
-    print("\n📊 Memory Statistics:")
+    _print("\n📊 Memory Statistics:")
     stats_result = tool(action="stats")
-    stats = stats_result.get("statistics", {})
-    print(f"   Total memories: {stats.get('total_memories', 0)}")
-    print(f"   Memory types: {stats.get('memory_types', {})}")
-    print(f"   Popular tags: {stats.get('popular_tags', [])}")
+    get = stats_result.get("statistics", {}).get
+    _print(f"   Total memories: {get('total_memories', 0)}")
+    _print(f"   Memory types: {get('memory_types', {})}")
+    _print(f"   Popular tags: {get('popular_tags', [])}")
 
 
-def demo_python_executor():
+@_buffered
+def demo_python_executor(tool_mapping):
     """Demonstrate the Python executor tool."""
-    print("\n" + "="*60)
-    print("🐍 PYTHON EXECUTOR TOOL DEMO")
-    print("="*60)
-    
-    agent = OpenRouterAgent(silent=True)
-    
-    if "python_executor" not in agent.tool_mapping:
-        print("❌ Python executor tool not found. Make sure python_executor_tool.py is in the tools/ directory")
-        return
+    _print("\n" + "="*60)
+    _print("🐍 PYTHON EXECUTOR TOOL DEMO")
+    _print("="*60)
     
-    tool = agent.tool_mapping["python_executor"]
+    tool = tool_mapping["python_executor"]
     
     # Example 1: Math calculation
-    print("\n📐 Mathematical Calculation:")
+    _print("\n📐 Mathematical Calculation:")
     result = tool(
         code="""
 import math
@@ -224,56 +300,38 @@ area
     )
     
     if result["status"] == "success":
-        print(f"✅ Output:\n{result['output']}")
+        _print(f"✅ Output:\n{result['output']}")
         if result.get("result"):
-            print(f"📊 Result: {result['result']}")
+            _print(f"📊 Result: {result['result']}")
     else:
-        print(f"❌ Error: {result.get('error')}")
+        _print(f"❌ Error: {result.get('error')}")
     
     # Example 2: Data analysis
-    print("\n📊 Data Analysis:")
+    _print("\n📊 Data Analysis:")
     result = tool(
-        code="""
-import statistics
-import random
-
-# Generate sample data
-random.seed(42)
-data = [random.gauss(100, 15) for _ in range(100)]
-
-# Calculate statistics
-mean = statistics.mean(data)
-median = statistics.median(data)
-stdev = statistics.stdev(data)
-
-print(f"Dataset Statistics:")
-print(f"  Mean: {mean:.2f}")
-print(f"  Median: {median:.2f}")
-print(f"  Std Dev: {stdev:.2f}")
-print(f"  Min: {min(data):.2f}")
-print(f"  Max: {max(data):.2f}")
-
-# Return summary
-{"mean": mean, "median": median, "stdev": stdev}
-""",
+        code=_STATS_CODE,
         description="Statistical analysis of random data"
     )
     
     if result["status"] == "success":
-        print(f"✅ Output:\n{result['output']}")
+        _print(f"✅ Output:\n{result['output']}")
     else:
-        print(f"❌ Error: {result.get('error')}")
+        _print(f"❌ Error: {result.get('error')}")
     
     # Example 3: String processing
-    print("\n📝 String Processing:")
+    _print("\n📝 String Processing:")
     result = tool(
         code="""
 import re
 
+# Compile once and reuse; findall on a compiled pattern skips the re cache lookup
+NUM_RE = re.compile(r'\\d+')
+CAP_RE = re.compile(r'\\b[A-Z][a-z]+\\b')
+
 text = "The Chat with Tools framework is amazing! It has 4 agents and 100% awesomeness."
 
 # Extract numbers
-numbers = re.findall(r'\\d+', text)
+numbers = NUM_RE.findall(text)
 print(f"Numbers found: {numbers}")
 
 # Count words
@@ -281,99 +339,184 @@ words = len(text.split())
 print(f"Word count: {words}")
 
 # Find capitalized words
-capitals = re.findall(r'\\b[A-Z][a-z]+\\b', text)
+capitals = CAP_RE.findall(text)
 print(f"Capitalized words: {capitals}")
 """,
         description="Text analysis with regex"
     )
     
     if result["status"] == "success":
-        print(f"✅ Output:\n{result['output']}")
+        _print(f"✅ Output:\n{result['output']}")
     else:
-        print(f"❌ Error: {result.get('error')}")
+        _print(f"❌ Error: {result.get('error')}")
 
 
-def demo_summarization_tool():
+@_buffered
+def demo_summarization_tool(tool_mapping):
     """Demonstrate the summarization tool."""
-    print("\n" + "="*60)
-    print("📄 SUMMARIZATION TOOL DEMO")
-    print("="*60)
-    
-    agent = OpenRouterAgent(silent=True)
-    
-    if "summarizer" not in agent.tool_mapping:
-        print("❌ Summarization tool not found. Make sure summarization_tool.py is in the tools/ directory")
-        return
-    
-    tool = agent.tool_mapping["summarizer"]
-    
-    # Sample text
-    sample_text = """
-    The Chat with Tools framework represents a significant advancement in multi-agent AI systems,
-    designed to emulate the comprehensive analysis capabilities of advanced AI models like Grok's heavy mode.
-    At its core, the framework employs a sophisticated orchestration system that coordinates multiple
-    intelligent agents working in parallel to provide deep, multi-perspective analysis of user queries.
-    
-    The architecture consists of three main components: the Agent System, the Orchestrator, and the
-    Tool System. The Agent System provides self-contained agents with full tool access, implementing
-    an agentic loop that continues processing until task completion. Each agent can utilize various
-    tools through the framework's dynamic discovery system, which automatically loads tools from the
-    tools directory without requiring manual registration.
-    
-    The Orchestrator serves as the brain of the multi-agent system, using AI to dynamically generate
-    specialized questions that approach the user's query from different angles. It manages parallel
-    execution of multiple agents, typically four by default, and then synthesizes their responses
-    into a comprehensive final answer. This synthesis process uses another AI call to combine the
-    best information from all agents while resolving any contradictions.
+    _print("\n" + "="*60)
+    _print("📄 SUMMARIZATION TOOL DEMO")
+    _print("="*60)
     
-    The Tool System provides a standardized interface for extending the framework's capabilities.
-    All tools inherit from a BaseTool class and are automatically discovered at runtime. Currently
-    available tools include web search using DuckDuckGo, mathematical calculations, file operations,
-    and a task completion marker. The framework's hot-swappable design means new tools can be added
-    simply by dropping Python files into the tools directory.
+    tool = tool_mapping["summarizer"]
     
-    Recent enhancements have focused on production-readiness, including structured logging, retry
-    mechanisms with exponential backoff, connection pooling for API clients, comprehensive error
-    handling, and security features like URL validation. The framework now includes a robust test
-    suite and supports environment variables for secure credential management.
-    """
+    # Tokenize and sentence-split the document once
+    doc_id = tool(action="prepare", text=_SAMPLE_TEXT)["doc_id"]
     
     # Test summarization
-    print("\n📝 Original Text Statistics:")
-    stats_result = tool(action="statistics", text=sample_text)
-    stats = stats_result.get("statistics", {})
-    print(f"   Words: {stats.get('word_count', 0)}")
-    print(f"   Sentences: {stats.get('sentence_count', 0)}")
-    print(f"   Reading Level: {stats.get('reading_level', 'Unknown')}")
+    _print("\n📝 Original Text Statistics:")
+    stats_result = tool(action="statistics", doc_id=doc_id)
+    get = stats_result.get("statistics", {}).get
+    _print(f"   Words: {get('word_count', 0)}")
+    _print(f"   Sentences: {get('sentence_count', 0)}")
+    _print(f"   Reading Level: {get('reading_level', 'Unknown')}")
     
     # Create summary
-    print("\n✂️  Creating Summary (30% of original)...")
+    _print("\n✂️  Creating Summary (30% of original)...")
     summary_result = tool(
         action="summarize",
-        text=sample_text,
+        doc_id=doc_id,
         ratio=0.3
     )
     
     if summary_result.get("status") == "summarized":
-        print(f"\n📄 Summary:\n{summary_result['summary']}")
-        print(f"\n📊 Reduction: {summary_result['reduction_percentage']}%")
+        _print(f"\n📄 Summary:\n{summary_result['summary']}")
+        _print(f"\n📊 Reduction: {summary_result['reduction_percentage']}%")
     
     # Extract key points
-    print("\n🎯 Extracting Key Points...")
+    _print("\n🎯 Extracting Key Points...")
     points_result = tool(
         action="key_points",
-        text=sample_text,
+        doc_id=doc_id,
         num_points=5
     )
     
     if points_result.get("status") == "extracted":
-        print("\n📌 Key Points:")
+        _print("\n📌 Key Points:")
         for i, point in enumerate(points_result.get("key_points", []), 1):
-            print(f"   {i}. {point}")
+            _print(f"   {i}. {point}")
+
+
+# Tool each demo needs, checked once at startup instead of inside every demo
+_DEMO_TOOLS = {
+    demo_sequential_thinking: ("sequential_thinking", "sequential_thinking_tool.py"),
+    demo_memory_tool: ("memory", "memory_tool.py"),
+    demo_python_executor: ("python_executor", "python_executor_tool.py"),
+    demo_summarization_tool: ("summarizer", "summarization_tool.py"),
+}
+
+
+def validate_tools(tool_mapping):
+    """Report missing tools once and return the demos that can run."""
+    missing = {name for name, _ in _DEMO_TOOLS.values()} - tool_mapping.keys()
+    
+    for name, filename in _DEMO_TOOLS.values():
+        if name in missing:
+            print(f"❌ Tool '{name}' not found. Make sure {filename} is in the tools/ directory")
+    
+    return frozenset(demo for demo, (name, _) in _DEMO_TOOLS.items() if name not in missing)
+
+
+def run_demo(demo, tool_mapping, available):
+    """Run a single demo unless its tool failed validation."""
+    if demo not in available:
+        print(f"⏭️  Skipping {demo.__name__}: its tool is not available")
+        return
+    demo(tool_mapping)
+
+
+def run_all_demos(tool_mapping, available):
+    """Run the available demos concurrently and report failures per demo."""
+    demos = [
+        demo for demo in (demo_sequential_thinking, demo_memory_tool, demo_summarization_tool)
+        if demo in available
+    ]
+    
+    if demos:
+        with ThreadPoolExecutor(max_workers=len(demos)) as executor:
+            future_to_demo = {executor.submit(demo, tool_mapping): demo for demo in demos}
+            
+            for future in as_completed(future_to_demo):
+                demo = future_to_demo[future]
+                try:
+                    future.result()
+                except Exception as e:
+                    _print(f"❌ {demo.__name__} failed: {e}")
+    
+    # The executor enforces its timeout with SIGALRM and swaps sys.stdout,
+    # so it only works on the main thread and after the other demos finish
+    if demo_python_executor in available:
+        try:
+            run_demo(demo_python_executor, tool_mapping, available)
+        except Exception as e:
+            _print(f"❌ demo_python_executor failed: {e}")
+
+
+async def run_all_demos_async(tool_mapping, available):
+    """Async counterpart of run_all_demos for callers with an event loop.
+    
+    The tools have no async API, so each demo runs via asyncio.to_thread and
+    the results are gathered; the executor demo still runs on the main thread.
+    """
+    demos = [
+        demo for demo in (demo_sequential_thinking, demo_memory_tool, demo_summarization_tool)
+        if demo in available
+    ]
+    
+    results = await asyncio.gather(
+        *(asyncio.to_thread(demo, tool_mapping) for demo in demos),
+        return_exceptions=True
+    )
+    for demo, result in zip(demos, results):
+        if isinstance(result, Exception):
+            _print(f"❌ {demo.__name__} failed: {result}")
+    
+    if demo_python_executor in available:
+        try:
+            demo_python_executor(tool_mapping)
+        except Exception as e:
+            _print(f"❌ demo_python_executor failed: {e}")
+
+
+# Menu choices; "6" exits and is handled by the loop itself
+_MENU_DEMOS = {
+    "1": demo_sequential_thinking,
+    "2": demo_memory_tool,
+    "3": demo_python_executor,
+    "4": demo_summarization_tool,
+    "5": run_all_demos,
+}
 
 
 def main():
     """Main demo function."""
+    import argparse
+    parser = argparse.ArgumentParser(description="Demonstrate the new tools")
+    parser.add_argument("--demo", choices=["thinking", "memory", "python", "summarize", "all"],
+                        help="Run one demo non-interactively instead of showing the menu")
+    parser.add_argument("--asyncio", action="store_true",
+                        help="Drive '--demo all' with asyncio instead of a thread pool")
+    
+    args = parser.parse_args()
+    
+    if args.demo:
+        tool_mapping = get_agent().tool_mapping
+        available = validate_tools(tool_mapping)
+        
+        if args.demo == "all" and args.asyncio:
+            asyncio.run(run_all_demos_async(tool_mapping, available))
+        elif args.demo == "all":
+            run_all_demos(tool_mapping, available)
+        else:
+            demos = {
+                "thinking": demo_sequential_thinking,
+                "memory": demo_memory_tool,
+                "python": demo_python_executor,
+                "summarize": demo_summarization_tool,
+            }
+            run_demo(demos[args.demo], tool_mapping, available)
+        return
+    
     print("\n" + "="*60)
     print("   🚀 CHAT WITH TOOLS - NEW TOOLS DEMO")
     print("="*60)
@@ -384,6 +527,9 @@ def main():
     print("3. Python Executor - Safe code execution")
     print("4. Summarization - Text condensing and analysis")
     
+    tool_mapping = get_agent().tool_mapping
+    available = validate_tools(tool_mapping)
+    
     while True:
         print("\n" + "-"*40)
         print("Select a demo to run:")
@@ -396,26 +542,19 @@ def main():
         
         choice = input("\nChoice (1-6): ").strip()
         
-        if choice == "1":
-            demo_sequential_thinking()
-        elif choice == "2":
-            demo_memory_tool()
-        elif choice == "3":
-            demo_python_executor()
-        elif choice == "4":
-            demo_summarization_tool()
-        elif choice == "5":
-            print("\n🎬 Running all demos...")
-            demo_sequential_thinking()
-            demo_memory_tool()
-            demo_python_executor()
-            demo_summarization_tool()
-            print("\n✅ All demos completed!")
-        elif choice == "6":
+        if choice == "6":
             print("\n👋 Goodbye!")
             break
-        else:
+        
+        demo = _MENU_DEMOS.get(choice)
+        if demo is None:
             print("❌ Invalid choice. Please select 1-6.")
+        elif demo is run_all_demos:
+            print("\n🎬 Running all demos...")
+            run_all_demos(tool_mapping, available)
+            print("\n✅ All demos completed!")
+        else:
+            run_demo(demo, tool_mapping, available)
 
 
 if __name__ == "__main__":
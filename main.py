@@ -9,7 +9,7 @@ Inspired by Grok's deep thinking mode
 import sys
 import os
 import time
-from typing import Optional, Dict, Any
+from itertools import islice
 from pathlib import Path
 
 # ASCII Art Banner
@@ -31,17 +31,74 @@ BANNER = """
 ╚════════════════════════════════════════════════════════════════╝
 """
 
+# The banner as print() would emit it, encoded once for show_banner()
+_BANNER_BYTES = (BANNER + "\n").encode("utf-8")
+
+VERSION = "0.1.0"
+
+USAGE = """usage: {prog} [-h] [-v]
+
+Interactive menu for the Chat with Tools framework.
+
+options:
+  -h, --help     show this help message and exit
+  -v, --version  show the version and exit
+"""
+
+# ANSI sequence that erases the display and moves the cursor home
+CLEAR_SCREEN = "\x1b[2J\x1b[H"
+
+# Lines of a document shown by the documentation menu
+DOC_PREVIEW_LINES = 50
+
+# Test files run by the "Run tests" menu entry, relative to the project root
+TEST_FILES = ("tests/test_framework.py", "tests/test_tools.py")
+
 class FrameworkLauncher:
     """Main launcher for the Chat with Tools framework"""
     
     def __init__(self):
         self.project_root = Path(__file__).parent.absolute()
-        sys.path.append(str(self.project_root))
-        self.check_environment()
+        
+        # Add once, ahead of site-packages, so re-instantiating doesn't grow sys.path
+        root = str(self.project_root)
+        if root not in sys.path:
+            sys.path.insert(0, root)
+        
+        # The package lives under src/, which a plain checkout doesn't install
+        src_path = str(self.project_root / "src")
+        if src_path not in sys.path:
+            sys.path.insert(0, src_path)
+        
+        # Result of the last check_environment() call, and whether it
+        # printed warnings worth pausing on
+        self.env_ok = False
+        self.env_warnings = False
+        
+        # Configuration parsed by check_environment()
+        self.config = None
+        
+        # Menu choice -> handler, built once for run()
+        self._dispatch = {
+            "1": self.launch_single_agent,
+            "2": self.launch_council_mode,
+            "3": self.launch_tool_showcase,
+            "4": self.launch_api_demo,
+            "5": self.run_tests,
+            "6": self.run_benchmarks,
+            "7": self.show_documentation,
+            "8": self.edit_configuration,
+        }
+        
+        # Paths used across the menu, resolved once
+        self.config_path = self.project_root / "config" / "config.yaml"
+        self.test_paths = tuple((name, self.project_root / name) for name in TEST_FILES)
     
     def check_environment(self) -> bool:
         """Check if the environment is properly configured"""
-        config_path = self.project_root / "config" / "config.yaml"
+        self.env_warnings = False
+        
+        config_path = self.config_path
         
         if not config_path.exists():
             print("\n⚠️  Configuration file not found!")
@@ -51,19 +108,28 @@ class FrameworkLauncher:
         
         # Check if API key is configured (but don't block if missing)
         try:
-            import yaml
-            with open(config_path, 'r') as f:
-                config = yaml.safe_load(f)
-                api_key = config.get('openrouter', {}).get('api_key', '')
-                base_url = config.get('openrouter', {}).get('base_url', '')
+            try:
+                from chat_with_tools.config_manager import parse_config_file
+            except ImportError:
+                # Without the package the environment check still only needs
+                # the parsed file
+                import yaml
+                with open(config_path, 'rb') as f:
+                    self.config = yaml.load(f, Loader=getattr(yaml, "CSafeLoader", yaml.SafeLoader))
+            else:
+                # Parsed through ConfigManager's cache, so the agents started
+                # from the menu reuse this parse instead of reading the file again
+                self.config = parse_config_file(config_path)
+            api_key = self.config.get('openrouter', {}).get('api_key', '')
+            
+            if api_key == 'YOUR API KEY HERE' or not api_key:
+                self.env_warnings = True
+                print("\n⚠️  OpenRouter API key not configured!")
+                print("   If using OpenRouter, please add your API key to config/config.yaml")
+                print("   Get your key at: https://openrouter.ai/keys")
+                print("\n   Note: You can continue without an API key if using a local vLLM endpoint.")
+                # Don't return False - just warn and continue
                 
-                if api_key == 'YOUR API KEY HERE' or not api_key:
-                    print("\n⚠️  OpenRouter API key not configured!")
-                    print("   If using OpenRouter, please add your API key to config/config.yaml")
-                    print("   Get your key at: https://openrouter.ai/keys")
-                    print("\n   Note: You can continue without an API key if using a local vLLM endpoint.")
-                    # Don't return False - just warn and continue
-                    
         except Exception as e:
             print(f"\n⚠️  Error reading configuration: {e}")
             return False
@@ -72,12 +138,26 @@ class FrameworkLauncher:
     
     def clear_screen(self):
         """Clear the terminal screen"""
-        os.system('cls' if os.name == 'nt' else 'clear')
+        if os.name == 'nt':
+            # Legacy Windows consoles do not understand ANSI escapes
+            os.system('cls')
+        else:
+            # Erase the display and home the cursor without spawning `clear`
+            sys.stdout.write(CLEAR_SCREEN)
+            sys.stdout.flush()
     
     def show_banner(self):
         """Display the application banner"""
         self.clear_screen()
-        print(BANNER)
+        out = getattr(sys.stdout, "buffer", None)
+        if out is None or (sys.stdout.encoding or "").lower() not in ("utf-8", "utf8"):
+            # Captured or non-UTF-8 streams take the text path
+            print(BANNER)
+            return
+        # Flush pending text first so the raw write stays in order
+        sys.stdout.flush()
+        out.write(_BANNER_BYTES)
+        out.flush()
     
     def show_main_menu(self):
         """Display the main menu with organized options"""
@@ -144,7 +224,8 @@ class FrameworkLauncher:
         
         try:
             from demos.demo_standalone import main as standalone_main
-            standalone_main()
+            # The launcher's own arguments are not meant for the demo
+            standalone_main([])
         except ImportError as e:
             print(f"❌ Error loading tool showcase: {e}")
             self.handle_import_error()
@@ -172,22 +253,51 @@ class FrameworkLauncher:
         print("   Verifying framework components and tool functionality.\n")
         time.sleep(1)
         
-        test_files = [
-            "tests/test_framework.py",
-            "tests/test_tools.py"
-        ]
-        
-        for test_file in test_files:
-            test_path = self.project_root / test_file
-            if test_path.exists():
-                print(f"\n▶️  Running {test_file}...")
-                os.system(f"python {test_path}")
-            else:
-                print(f"⚠️  Test file not found: {test_file}")
+        self._run_test_files()
         
         print("\n✅ Test suite completed!")
         input("\nPress Enter to continue...")
     
+    def _run_test_files(self):
+        """Run the standalone test files in parallel, prefixing their output"""
+        import subprocess
+        from concurrent.futures import ThreadPoolExecutor
+        
+        # Unbuffered children so their lines show up as they are printed
+        env = dict(os.environ, PYTHONUNBUFFERED="1", PYTHONIOENCODING="utf-8")
+        running = []
+        for test_file, test_path in self.test_paths:
+            if not test_path.exists():
+                print(f"⚠️  Test file not found: {test_file}")
+                continue
+            print(f"▶️  Running {test_file}...")
+            # Same interpreter as the launcher, without a shell in between
+            proc = subprocess.Popen(
+                [sys.executable, str(test_path)],
+                stdout=subprocess.PIPE,
+                stderr=subprocess.STDOUT,
+                encoding="utf-8",
+                errors="replace",
+                env=env,
+            )
+            running.append((Path(test_file).stem, proc))
+        
+        if not running:
+            return
+        
+        def pump(prefix, proc):
+            with proc.stdout:
+                for line in proc.stdout:
+                    # One write per line keeps the two suites' lines whole
+                    sys.stdout.write(f"[{prefix}] {line}")
+        
+        with ThreadPoolExecutor(max_workers=len(running)) as executor:
+            pumps = [executor.submit(pump, prefix, proc) for prefix, proc in running]
+            for (_, proc), future in zip(running, pumps):
+                proc.wait()
+                # Wait for the rest of the output, and surface pump errors
+                future.result()
+    
     def run_benchmarks(self):
         """Run performance benchmarks"""
         print("\n📊 Running Tool Benchmarks...")
@@ -230,12 +340,13 @@ class FrameworkLauncher:
             if doc_path.exists():
                 print(f"\n{'─'*60}")
                 with open(doc_path, 'r') as f:
-                    content = f.read()
-                    # Show first 50 lines
-                    lines = content.split('\n')[:50]
-                    print('\n'.join(lines))
-                    if len(content.split('\n')) > 50:
-                        print(f"\n... (showing first 50 lines of {len(content.split('\n'))} total)")
+                    # Show the first lines, then count the rest without
+                    # keeping them
+                    head = list(islice(f, DOC_PREVIEW_LINES))
+                    total = len(head) + sum(1 for _ in f)
+                print(''.join(head).rstrip('\n'))
+                if total > DOC_PREVIEW_LINES:
+                    print(f"\n... (showing first {DOC_PREVIEW_LINES} lines of {total} total)")
                 print('─'*60)
             else:
                 print(f"❌ Document not found: {docs[choice][0]}")
@@ -247,7 +358,7 @@ class FrameworkLauncher:
         print("\n⚙️  Configuration Editor")
         print("═"*60)
         
-        config_path = self.project_root / "config" / "config.yaml"
+        config_path = self.config_path
         
         if not config_path.exists():
             print("❌ Configuration file not found!")
@@ -264,16 +375,29 @@ class FrameworkLauncher:
         choice = input("\nSelect option (0-3): ").strip()
         
         if choice == "1":
-            with open(config_path, 'r') as f:
-                print("\n" + "─"*60)
-                print(f.read())
-                print("─"*60)
+            print("\n" + "─"*60)
+            out = getattr(sys.stdout, "buffer", None)
+            if out is None or (sys.stdout.encoding or "").lower() not in ("utf-8", "utf8"):
+                print(config_path.read_text(encoding='utf-8'))
+            else:
+                import shutil
+                # Stream the file to stdout without building a string of it
+                sys.stdout.flush()
+                with open(config_path, 'rb') as f:
+                    shutil.copyfileobj(f, out)
+                out.flush()
+            print("─"*60)
         elif choice == "2":
+            import shlex
+            import subprocess
+            
+            # Run the editor directly rather than through a shell; $EDITOR
+            # may carry its own arguments (e.g. "code -w")
             if os.name == 'nt':
-                os.system(f"notepad {config_path}")
+                command = ["notepad"]
             else:
-                editor = os.environ.get('EDITOR', 'nano')
-                os.system(f"{editor} {config_path}")
+                command = shlex.split(os.environ.get('EDITOR', 'nano'))
+            subprocess.run([*command, str(config_path)], check=False)
         elif choice == "3":
             print("\n📚 Configuration Guide:")
             print("─"*40)
@@ -304,14 +428,16 @@ class FrameworkLauncher:
         """Main run loop"""
         self.show_banner()
         
-        # Check environment on first run (now just shows warnings, doesn't block)
-        if not self.check_environment():
+        # Check environment once, after the banner has cleared the screen
+        # (now just shows warnings, doesn't block)
+        self.env_ok = self.check_environment()
+        if not self.env_ok:
             print("\n❌ Cannot continue due to critical configuration issues.")
             input("\nPress Enter to exit...")
             return
         
         # Add a small pause to let users read any warnings
-        if self.check_environment():
+        if self.env_warnings:
             time.sleep(2)
         
         while True:
@@ -323,22 +449,8 @@ class FrameworkLauncher:
                     print("\n👋 Thank you for using Chat with Tools!")
                     print("   Visit https://github.com/Suparious/chat-with-tools for updates.\n")
                     break
-                elif choice == "1":
-                    self.launch_single_agent()
-                elif choice == "2":
-                    self.launch_council_mode()
-                elif choice == "3":
-                    self.launch_tool_showcase()
-                elif choice == "4":
-                    self.launch_api_demo()
-                elif choice == "5":
-                    self.run_tests()
-                elif choice == "6":
-                    self.run_benchmarks()
-                elif choice == "7":
-                    self.show_documentation()
-                elif choice == "8":
-                    self.edit_configuration()
+                elif choice in self._dispatch:
+                    self._dispatch[choice]()
                 else:
                     print("\n❌ Invalid choice. Please select 0-8.")
                     time.sleep(1)
@@ -360,6 +472,15 @@ class FrameworkLauncher:
 
 def main():
     """Main entry point"""
+    # Answer --version/--help before the launcher reads the config and
+    # clears the screen
+    if len(sys.argv) > 1 and sys.argv[1] in ("-v", "--version"):
+        print(f"chat-with-tools {VERSION}")
+        return
+    if len(sys.argv) > 1 and sys.argv[1] in ("-h", "--help"):
+        print(USAGE.format(prog=Path(sys.argv[0]).name))
+        return
+    
     launcher = FrameworkLauncher()
     launcher.run()
 
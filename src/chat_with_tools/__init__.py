@@ -6,9 +6,16 @@ A modular framework for building AI agents with customizable tools.
 
 __version__ = "0.1.0"
 
-from .agent import OpenRouterAgent
-from .orchestrator import TaskOrchestrator
-from .config_manager import ConfigManager, get_openai_client
+import importlib
+
+# Core exports are resolved lazily (PEP 562) so that importing a submodule such
+# as chat_with_tools.vllm_integration does not pull in openai and the tools.
+_LAZY = {
+    "OpenRouterAgent": (".agent", "OpenRouterAgent"),
+    "TaskOrchestrator": (".orchestrator", "TaskOrchestrator"),
+    "ConfigManager": (".config_manager", "ConfigManager"),
+    "get_openai_client": (".config_manager", "get_openai_client"),
+}
 
 __all__ = [
     "OpenRouterAgent",
@@ -16,3 +23,17 @@ __all__ = [
     "ConfigManager",
     "get_openai_client"
 ]
+
+def __getattr__(name):
+    """Import core exports on first access and cache them on the module"""
+    try:
+        module_name, attr = _LAZY[name]
+    except KeyError:
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}") from None
+    value = getattr(importlib.import_module(module_name, __name__), attr)
+    globals()[name] = value
+    return value
+
+def __dir__():
+    """Include lazy exports in dir() for REPL completion"""
+    return sorted(set(globals()) | set(_LAZY))
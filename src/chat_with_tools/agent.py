@@ -9,9 +9,13 @@ import os
 import yaml
 import time
 import threading
-from typing import Dict, Any, List, Optional, Union
+from concurrent.futures import ThreadPoolExecutor
+from types import SimpleNamespace
+from typing import Dict, Any, Generator, List, NamedTuple, Optional, Tuple, Union
 from enum import Enum
 from openai import OpenAI
+from openai.types.chat import ChatCompletionMessage, ChatCompletionMessageToolCall
+from openai.types.chat.chat_completion_message_tool_call import Function
 from .tools import discover_tools
 from .config_manager import ConfigManager, get_openai_client
 from .utils import (
@@ -40,6 +44,13 @@ class ModelType(Enum):
     CUSTOM = "custom"      # Custom endpoints
 
 
+class ToolSchema(NamedTuple):
+    """Flattened view of a tool's OpenRouter schema for fast attribute access."""
+    name: str
+    description: str
+    schema: Dict[str, Any]
+
+
 class InferenceEndpoint:
     """Configuration for an inference endpoint."""
     def __init__(self, name: str, base_url: str, model: str, **kwargs):
@@ -251,7 +262,8 @@ class OpenRouterAgent:
                 self.client = get_openai_client()
             self.debug_logger.info("Using standard API client")
         
-        # Initialize metrics collector if enabled
+        # Initialize metrics collector if enabled; the attribute is always
+        # set, so callers only need a truthiness check
         if self.config.get('performance', {}).get('collect_metrics', False):
             self.metrics = MetricsCollector()
             self.debug_logger.info("Metrics collection enabled")
@@ -267,6 +279,8 @@ class OpenRouterAgent:
         self.discovered_tools = discover_tools(self.config, silent=self.silent)
         self.tools = [tool.to_openrouter_schema() for tool in self.discovered_tools.values()]
         self.tool_mapping = {name: tool.execute for name, tool in self.discovered_tools.items()}
+        self._tool_schemas = None
+        self._tool_schemas_key = None
         
         self.debug_logger.info(f"Discovered {len(self.discovered_tools)} tools", 
                                tools=list(self.discovered_tools.keys()))
@@ -277,6 +291,8 @@ class OpenRouterAgent:
         self.max_iterations = agent_config.get('max_iterations', 10)
         self.temperature = agent_config.get('temperature', 0.7)
         self.max_tokens = agent_config.get('max_tokens', None)
+        self.parallel_tool_calls = agent_config.get('parallel_tool_calls', True)
+        self.max_parallel_tool_calls = agent_config.get('max_parallel_tool_calls', 5)
         
         # Override temperature and max_tokens from endpoint if available
         if self.endpoint_manager.is_enabled() and self.endpoint_name != "primary":
@@ -292,7 +308,8 @@ class OpenRouterAgent:
         self.debug_logger.info("Agent initialization complete")
     
     @retry_with_backoff(max_retries=3, initial_delay=1.0)
-    def call_llm(self, messages: List[Dict[str, Any]], force_no_tools: bool = False, force_no_structured: bool = False) -> Any:
+    def call_llm(self, messages: List[Dict[str, Any]], force_no_tools: bool = False, force_no_structured: bool = False,
+                 stream: bool = False) -> Any:
         """
         Make OpenRouter API call with tools and retry logic.
         
@@ -300,9 +317,10 @@ class OpenRouterAgent:
             messages: List of message dictionaries
             force_no_tools: If True, don't include tools in the request
             force_no_structured: If True, disable structured output even if configured
+            stream: If True, request a streamed completion
             
         Returns:
-            OpenAI completion response
+            OpenAI completion response, or an iterator of completion chunks when streaming
             
         Raises:
             Exception: If API call fails after retries
@@ -329,6 +347,9 @@ class OpenRouterAgent:
             if self.max_tokens:
                 request_params["max_tokens"] = self.max_tokens
             
+            if stream:
+                request_params["stream"] = True
+            
             # Add structured output format if using vLLM with structured output
             if self.use_structured_output and self.endpoint.supports_structured_output and not force_no_structured:
                 vllm_config = self.config.get('vllm_structured_output', {})
@@ -408,9 +429,11 @@ class OpenRouterAgent:
             # Make API call
             response = self.client.chat.completions.create(**request_params)
             
-            # Record metrics if enabled
+            # Record metrics if enabled; streamed responses carry no usage
             if self.metrics:
-                if hasattr(response, 'usage'):
+                if stream:
+                    self.metrics.record_api_call(tokens=0)
+                elif hasattr(response, 'usage'):
                     total_tokens = response.usage.total_tokens if response.usage else 0
                     self.metrics.record_api_call(tokens=total_tokens)
                     self.logger.debug(f"API call used {total_tokens} tokens")
@@ -425,6 +448,65 @@ class OpenRouterAgent:
             self.debug_logger.log_llm_call(self.model, messages, error=str(e))
             raise Exception(f"LLM call failed: {str(e)}")
     
+    def _stream_completion(self, messages: List[Dict[str, Any]], lead: str = "",
+                           **kwargs) -> Generator[str, None, Any]:
+        """
+        Stream a completion, yielding its content as it arrives.
+        
+        Args:
+            messages: List of message dictionaries
+            lead: Text yielded before the first content delta
+            **kwargs: Passed through to call_llm
+            
+        Returns:
+            A response shaped like a non-streamed one, whose
+            ``choices[0].message`` holds the full content and tool calls
+        """
+        content = []
+        calls: Dict[int, Dict[str, str]] = {}
+        
+        for chunk in self.call_llm(messages, stream=True, **kwargs):
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta
+            
+            if delta.content:
+                if not content and lead:
+                    yield lead
+                content.append(delta.content)
+                yield delta.content
+            
+            # Tool calls arrive as fragments keyed by their index
+            for part in delta.tool_calls or ():
+                call = calls.setdefault(part.index, {"id": "", "name": "", "arguments": ""})
+                if part.id:
+                    call["id"] = part.id
+                if part.function:
+                    call["name"] += part.function.name or ""
+                    call["arguments"] += part.function.arguments or ""
+        
+        tool_calls = [
+            ChatCompletionMessageToolCall(
+                id=calls[index]["id"],
+                type="function",
+                function=Function(name=calls[index]["name"], arguments=calls[index]["arguments"])
+            )
+            for index in sorted(calls)
+        ]
+        message = ChatCompletionMessage(
+            role="assistant",
+            content="".join(content) or None,
+            tool_calls=tool_calls or None
+        )
+        return SimpleNamespace(choices=[SimpleNamespace(message=message)])
+    
+    @staticmethod
+    def _pending_pieces(pieces: List[str], emitted: int) -> Generator[str, None, int]:
+        """Yield the response pieces not yet streamed, separated as run() joins them."""
+        for index in range(emitted, len(pieces)):
+            yield ("\n\n" if index else "") + pieces[index]
+        return len(pieces)
+    
     def parse_structured_response(self, response_content: str) -> Optional[Dict[str, Any]]:
         """
         Parse a structured response from vLLM.
@@ -675,6 +757,41 @@ class OpenRouterAgent:
                 "content": json.dumps({"error": error_msg})
             }
     
+    def handle_tool_calls(self, tool_calls: List[Any]) -> List[Dict[str, Any]]:
+        """
+        Handle the tool calls from one assistant turn.
+        
+        Independent calls run concurrently, up to max_parallel_tool_calls at a
+        time. Tools that set thread_safe = False run on the calling thread.
+        
+        Args:
+            tool_calls: Tool call objects from one OpenAI response
+            
+        Returns:
+            Tool result message dictionaries, in call order
+        """
+        if not self.parallel_tool_calls or len(tool_calls) < 2:
+            return [self.handle_tool_call(tool_call) for tool_call in tool_calls]
+        
+        pooled, local = [], []
+        for index, tool_call in enumerate(tool_calls):
+            tool = self.discovered_tools.get(tool_call.function.name)
+            (pooled if getattr(tool, 'thread_safe', True) else local).append(index)
+        
+        results: List[Optional[Dict[str, Any]]] = [None] * len(tool_calls)
+        if pooled:
+            workers = max(1, min(self.max_parallel_tool_calls, len(pooled)))
+            with ThreadPoolExecutor(max_workers=workers) as executor:
+                pooled_results = executor.map(
+                    lambda index: self.handle_tool_call(tool_calls[index]), pooled
+                )
+                for index, result in zip(pooled, pooled_results):
+                    results[index] = result
+        for index in local:
+            results[index] = self.handle_tool_call(tool_calls[index])
+        
+        return results
+    
     def run(self, user_input: str, context: Optional[List[Dict[str, Any]]] = None) -> str:
         """
         Run the agent with user input and return the complete response.
@@ -686,12 +803,42 @@ class OpenRouterAgent:
         Returns:
             Complete agent response as a string
         """
+        pieces = self._run_iter(user_input, context, stream=False)
+        while True:
+            try:
+                next(pieces)
+            except StopIteration as done:
+                return done.value
+    
+    def run_stream(self, user_input: str, context: Optional[List[Dict[str, Any]]] = None) -> Generator[str, None, str]:
+        """
+        Run the agent with user input, yielding the response as it is generated.
+        
+        Model output is streamed as it arrives; tool calls run between
+        completions as in run(). Structured-output responses are parsed
+        before they are shown, so they are yielded whole.
+        
+        Args:
+            user_input: User's input message
+            context: Optional conversation context (previous messages)
+            
+        Yields:
+            Pieces of text that concatenate to the string run() would return
+            
+        Returns:
+            Complete agent response as a string
+        """
+        return (yield from self._run_iter(user_input, context, stream=True))
+    
+    def _run_iter(self, user_input: str, context: Optional[List[Dict[str, Any]]],
+                  stream: bool) -> Generator[str, None, str]:
+        """Agent loop shared by run() and run_stream(); returns the complete response."""
         self.debug_logger.log_separator(f"Agent Run Started - {self.name}")
         self.debug_logger.info("User input received", input=user_input[:100] + "..." if len(user_input) > 100 else user_input)
         self.logger.info(f"Processing user input: {user_input[:100]}...")
         
-        # Record start time for metrics
-        start_time = time.time()
+        # Record start time for metrics, on the monotonic clock
+        start_time = time.perf_counter()
         
         # Initialize messages
         messages = []
@@ -714,8 +861,12 @@ class OpenRouterAgent:
             "content": user_input
         })
         
-        # Track all assistant responses
+        # Track all assistant responses, and how many have been yielded
         full_response_content = []
+        emitted = 0
+        
+        # Structured responses are JSON that is parsed before use
+        stream = stream and not self.use_structured_output
         
         # Implement agentic loop
         iteration = 0
@@ -731,9 +882,18 @@ class OpenRouterAgent:
                 self.logger.info(f"Agent iteration {iteration}/{self.max_iterations}")
             
             try:
+                emitted = yield from self._pending_pieces(full_response_content, emitted)
+                
                 # Call LLM - disable structured output if we've already executed tools from structured output
                 # This allows the model to generate a natural language response after tool execution
-                response = self.call_llm(messages, force_no_structured=structured_tool_executed)
+                if stream:
+                    response = yield from self._stream_completion(
+                        messages,
+                        lead="\n\n" if full_response_content else "",
+                        force_no_structured=structured_tool_executed
+                    )
+                else:
+                    response = self.call_llm(messages, force_no_structured=structured_tool_executed)
                 
                 # Extract assistant message
                 assistant_message = response.choices[0].message
@@ -793,6 +953,8 @@ class OpenRouterAgent:
                 # Capture assistant content if present
                 if assistant_message.content:
                     full_response_content.append(assistant_message.content)
+                    if stream:
+                        emitted = len(full_response_content)
                 
                 # Handle tool calls
                 if assistant_message.tool_calls:
@@ -803,12 +965,22 @@ class OpenRouterAgent:
                     tool_was_used = True
                     task_completed = False
                     
-                    for tool_call in assistant_message.tool_calls:
-                        if not self.silent:
+                    # Calls after mark_task_complete were never run, so they
+                    # are left out of the concurrent dispatch as well
+                    tool_calls = list(assistant_message.tool_calls)
+                    for position, tool_call in enumerate(tool_calls):
+                        if tool_call.function.name == "mark_task_complete":
+                            tool_calls = tool_calls[:position + 1]
+                            break
+                    
+                    if not self.silent:
+                        for tool_call in tool_calls:
                             print(f"   📞 Calling tool: {tool_call.function.name}")
                             self.logger.debug(f"Calling tool: {tool_call.function.name}")
-                        
-                        tool_result = self.handle_tool_call(tool_call)
+                    
+                    tool_results = self.handle_tool_calls(tool_calls)
+                    
+                    for tool_call, tool_result in zip(tool_calls, tool_results):
                         messages.append(tool_result)
                         
                         # Check for task completion
@@ -825,11 +997,18 @@ class OpenRouterAgent:
                                 }]
                                 
                                 try:
-                                    final_response_obj = self.call_llm(final_messages, force_no_tools=True)
+                                    if stream:
+                                        final_response_obj = yield from self._stream_completion(
+                                            final_messages, force_no_tools=True
+                                        )
+                                    else:
+                                        final_response_obj = self.call_llm(final_messages, force_no_tools=True)
                                     final_content = final_response_obj.choices[0].message.content
                                     if final_content:
                                         full_response_content.append(final_content)
-                                except:
+                                        if stream:
+                                            emitted = len(full_response_content)
+                                except Exception:
                                     pass
                             
                             if not self.silent:
@@ -838,9 +1017,10 @@ class OpenRouterAgent:
                             
                             # Record metrics
                             if self.metrics:
-                                execution_time = time.time() - start_time
+                                execution_time = time.perf_counter() - start_time
                                 self.metrics.record_response_time(execution_time)
                             
+                            emitted = yield from self._pending_pieces(full_response_content, emitted)
                             final_response = "\n\n".join(full_response_content)
                             self.debug_logger.info("Agent run completed", 
                                                  final_response_length=len(final_response),
@@ -894,14 +1074,16 @@ class OpenRouterAgent:
         
         # Record final execution time
         if self.metrics:
-            execution_time = time.time() - start_time
+            execution_time = time.perf_counter() - start_time
             self.metrics.record_response_time(execution_time)
         
         # Return accumulated response
         if full_response_content:
+            yield from self._pending_pieces(full_response_content, emitted)
             final_response = "\n\n".join(full_response_content)
         else:
             final_response = "I apologize, but I couldn't generate a proper response. Please try rephrasing your question."
+            yield final_response
         
         self.debug_logger.info("Agent run completed (max iterations)", 
                              final_response_length=len(final_response),
@@ -960,6 +1142,23 @@ class OpenRouterAgent:
             self.logger.warning("No thinking endpoint configured, using regular model")
             return self.run(user_input, context)
     
+    @property
+    def tool_schemas(self) -> Tuple[ToolSchema, ...]:
+        """
+        Loaded tools as ToolSchema records (name, description, schema).
+        
+        Built once from ``self.tools`` and rebuilt only if the list is
+        replaced or changes length.
+        """
+        key = (id(self.tools), len(self.tools))
+        if self._tool_schemas_key != key:
+            self._tool_schemas = tuple(
+                ToolSchema(tool['function']['name'], tool['function']['description'], tool)
+                for tool in self.tools
+            )
+            self._tool_schemas_key = key
+        return self._tool_schemas
+    
     def get_metrics(self) -> Dict[str, Any]:
         """Get agent performance metrics."""
         if self.metrics:
@@ -0,0 +1,6 @@
+"""
+Command-line entry points for Chat with Tools Framework
+
+This module contains the runnable demos that are installed as console
+scripts (``cwt-demo``, ``cwt-vllm-demo``).
+"""
@@ -0,0 +1,176 @@
+"""
+Single-agent chat demo for the Chat with Tools framework.
+
+Run with ``cwt-demo`` once the package is installed, or
+``python -m chat_with_tools.cli.main``.
+"""
+
+import functools
+import logging
+import sys
+from typing import Optional
+
+from chat_with_tools.agent import OpenRouterAgent
+
+logger = logging.getLogger(__name__)
+
+# Inputs that end an interactive session, compared case-insensitively
+_EXIT_COMMANDS = frozenset({"quit", "exit", "bye"})
+
+
+@functools.lru_cache(maxsize=4)
+def _get_agent(silent: bool = False, endpoint_name: Optional[str] = None) -> OpenRouterAgent:
+    """Create the agent once per settings and reuse it, along with its
+    pooled API client, on later runs."""
+    return OpenRouterAgent(silent=silent, endpoint_name=endpoint_name)
+
+
+def stream_response(agent: OpenRouterAgent, query: str, prefix: str = "") -> str:
+    """Write the agent's response as it is generated and return it.
+    
+    The prefix is written with the first chunk, after any progress output
+    the agent prints while it works.
+    """
+    chunks = []
+    for chunk in agent.run_stream(query):
+        if not chunks:
+            sys.stdout.write(prefix)
+        chunks.append(chunk)
+        sys.stdout.write(chunk)
+        sys.stdout.flush()
+    sys.stdout.write("\n")
+    return "".join(chunks)
+
+
+def run_interactive(endpoint: Optional[str] = None):
+    """Run in interactive mode with user input."""
+    print("OpenRouter Agent with DuckDuckGo Search")
+    print("Type 'quit', 'exit', or 'bye' to exit")
+    print("-" * 50)
+    
+    try:
+        agent = _get_agent(False, endpoint)
+        or_cfg = agent.config['openrouter']
+        so_cfg = agent.config.get('vllm_structured_output', {})
+        print("Agent initialized successfully!")
+        print(f"Using model: {or_cfg['model']}")
+        
+        # Check if using vLLM
+        if or_cfg.get('is_vllm', False):
+            print("✅ Using vLLM backend")
+            if so_cfg.get('enabled', False):
+                print("✅ Structured output enabled")
+        
+        print("Note: Make sure to set your OpenRouter API key in config.yaml")
+        print("-" * 50)
+    except Exception as e:
+        print(f"Error initializing agent: {e}")
+        print("Make sure you have:")
+        print("1. Set your OpenRouter API key in config/config.yaml")
+        print("2. Installed all dependencies with: pip install -r requirements.txt")
+        return
+    
+    while True:
+        try:
+            user_input = input("\nUser: ").strip()
+            
+            if user_input.casefold() in _EXIT_COMMANDS:
+                print("Goodbye!")
+                break
+            
+            if not user_input:
+                print("Please enter a question or command.")
+                continue
+            
+            print("Agent: Thinking...")
+            stream_response(agent, user_input, prefix="Agent: ")
+            
+        except KeyboardInterrupt:
+            print("\n\nExiting...")
+            break
+        except EOFError:
+            # Handle non-interactive mode gracefully
+            print("\nNo input available. Exiting...")
+            break
+        except Exception as e:
+            print(f"Error: {e}")
+            print("Please try again or type 'quit' to exit.")
+
+
+def run_demo(query: str = None, endpoint: Optional[str] = None):
+    """Run a non-interactive demo with a predefined query."""
+    print("OpenRouter Agent Demo (Non-Interactive Mode)")
+    print("-" * 50)
+    
+    try:
+        agent = _get_agent(False, endpoint)
+        or_cfg = agent.config['openrouter']
+        so_cfg = agent.config.get('vllm_structured_output', {})
+        print("Agent initialized successfully!")
+        print(f"Using model: {or_cfg['model']}")
+        
+        # Check configuration
+        config_info = []
+        if or_cfg.get('is_vllm', False):
+            config_info.append("vLLM backend")
+        if so_cfg.get('enabled', False):
+            config_info.append("Structured output")
+        if agent.endpoint_manager.is_enabled():
+            config_info.append(f"{len(agent.endpoint_manager.endpoints)} endpoints")
+        
+        if config_info:
+            print(f"Features: {', '.join(config_info)}")
+        
+        print("-" * 50)
+        
+        # Use provided query or default
+        if not query:
+            query = "What is the weather like today and calculate 15% tip on a $45 meal"
+        
+        print(f"\nDemo Query: {query}")
+        print("\nAgent: Processing...")
+        
+        header = "\n".join(["", "=" * 50, "Agent Response:", "=" * 50, ""])
+        stream_response(agent, query, prefix=header)
+        print("=" * 50)
+        
+        # Show metrics if available
+        if agent.metrics:
+            metrics = agent.get_metrics()
+            print("\nPerformance Metrics:")
+            print(f"  API Calls: {metrics['api_calls']}")
+            print(f"  Tool Calls: {metrics['tool_calls']}")
+            print(f"  Total Tokens: {metrics['total_tokens']}")
+            print(f"  Avg Response Time: {metrics['avg_response_time']:.2f}s")
+            print(f"  Median Response Time: {metrics['median_response_time']:.2f}s")
+        
+    except Exception as e:
+        print(f"Error: {e}")
+        logger.exception("Demo run failed")
+
+
+def main():
+    """Main entry point for the OpenRouter agent."""
+    import argparse
+    
+    parser = argparse.ArgumentParser(description="OpenRouter Agent with Tool Support")
+    parser.add_argument("--demo", action="store_true", help="Run in demo mode (non-interactive)")
+    parser.add_argument("--query", type=str, help="Query for demo mode")
+    parser.add_argument("--endpoint", type=str, help="Specific endpoint to use (e.g., 'fast', 'thinking')")
+    
+    args = parser.parse_args()
+    
+    if args.demo:
+        run_demo(args.query, args.endpoint)
+    else:
+        # Check if running in a terminal
+        if sys.stdin.isatty():
+            run_interactive(args.endpoint)
+        else:
+            # Non-interactive environment, run demo
+            print("Non-interactive environment detected, running demo mode...")
+            run_demo(endpoint=args.endpoint)
+
+
+if __name__ == "__main__":
+    main()
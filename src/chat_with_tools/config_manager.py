@@ -2,11 +2,50 @@
 Configuration management for the Chat with Tools framework.
 """
 
+import copy
 import os
 import yaml
 from pathlib import Path
-from typing import Dict, Any, Optional
-from openai import OpenAI
+from typing import TYPE_CHECKING, Dict, Any, Optional, Tuple
+
+if TYPE_CHECKING:
+    from openai import OpenAI
+
+# Use the LibYAML C loader when PyYAML was built with it; falls back to the
+# pure-Python SafeLoader otherwise.
+_YAML_LOADER = getattr(yaml, "CSafeLoader", yaml.SafeLoader)
+
+# Default config file found by ConfigManager, keyed by working directory
+_RESOLVED_CONFIG_PATHS: Dict[Path, Path] = {}
+
+# Parsed YAML keyed by config path, with the file's mtime so edits are picked
+# up; each ConfigManager gets its own copy to modify
+_PARSED_CONFIGS: Dict[Path, Tuple[int, Dict[str, Any]]] = {}
+
+
+def parse_config_file(config_path: Path) -> Dict[str, Any]:
+    """
+    Parse a YAML config file, reusing the result while it is unchanged.
+    
+    The cache is shared by every caller in the process, so the launcher's
+    environment check and the agents it starts parse the file once.
+    
+    Args:
+        config_path: Path to the configuration file
+        
+    Returns:
+        Parsed configuration dictionary (shared; callers must copy it)
+    """
+    mtime = config_path.stat().st_mtime_ns
+    cached = _PARSED_CONFIGS.get(config_path)
+    if cached is not None and cached[0] == mtime:
+        return cached[1]
+    
+    with open(config_path, 'rb') as f:
+        config = yaml.load(f, Loader=_YAML_LOADER)
+    
+    _PARSED_CONFIGS[config_path] = (mtime, config)
+    return config
 
 
 class ConfigManager:
@@ -42,16 +81,27 @@ class ConfigManager:
                 return path
             raise FileNotFoundError(f"Config file not found: {config_path}")
         
+        # Reuse the location found earlier in this process for the same cwd,
+        # so every agent/orchestrator construction doesn't re-stat each path.
+        # A file that has since been moved or deleted is searched for again.
+        cwd = Path.cwd()
+        cached = _RESOLVED_CONFIG_PATHS.get(cwd)
+        if cached is not None:
+            if cached.exists():
+                return cached
+            del _RESOLVED_CONFIG_PATHS[cwd]
+        
         # Search for config file in standard locations
         search_paths = [
-            Path.cwd() / "config" / "config.yaml",
-            Path.cwd() / "config.yaml",
+            cwd / "config" / "config.yaml",
+            cwd / "config.yaml",
             Path(__file__).parent.parent.parent / "config" / "config.yaml",
             Path.home() / ".chat-with-tools" / "config.yaml",
         ]
         
         for path in search_paths:
             if path.exists():
+                _RESOLVED_CONFIG_PATHS[cwd] = path
                 return path
         
         # If no config found, check for example config
@@ -74,8 +124,7 @@ class ConfigManager:
         Returns:
             Configuration dictionary
         """
-        with open(self.config_path, 'r') as f:
-            config = yaml.safe_load(f)
+        config = copy.deepcopy(self._parse_config_file(self.config_path))
         
         # Apply environment variable overrides
         self._apply_env_overrides(config)
@@ -85,6 +134,8 @@ class ConfigManager:
         
         return config
     
+    _parse_config_file = staticmethod(parse_config_file)
+    
     def _apply_env_overrides(self, config: Dict[str, Any]) -> None:
         """
         Apply environment variable overrides to configuration.
@@ -221,7 +272,7 @@ class ConfigManager:
         self.config = self._load_config()
 
 
-def get_openai_client(config: Optional[Dict[str, Any]] = None) -> OpenAI:
+def get_openai_client(config: Optional[Dict[str, Any]] = None) -> "OpenAI":
     """
     Get an OpenAI client configured for OpenRouter.
     
@@ -231,6 +282,9 @@ def get_openai_client(config: Optional[Dict[str, Any]] = None) -> OpenAI:
     Returns:
         Configured OpenAI client
     """
+    # Imported here so that reading the configuration does not load openai
+    from openai import OpenAI
+    
     if config is None:
         config_manager = ConfigManager()
         config = config_manager.config
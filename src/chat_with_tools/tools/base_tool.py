@@ -4,6 +4,9 @@ from typing import Dict, Any, List
 class BaseTool(ABC):
     """Base class for all tools"""
     
+    # Whether execute() may run on a worker thread alongside other tool calls
+    thread_safe = True
+    
     @property
     @abstractmethod
     def name(self) -> str:
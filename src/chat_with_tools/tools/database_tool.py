@@ -23,6 +23,10 @@ class DatabaseTool(BaseTool):
     and result formatting.
     """
     
+    # sqlite3 connections may only be used on the thread that opened them,
+    # and they are kept open across calls
+    thread_safe = False
+    
     def __init__(self, config: dict):
         self.config = config
         self.db_path = config.get('database', {}).get('default_path', './data/local.db')
@@ -47,7 +47,7 @@ class MemoryStore:
         """Generate a unique ID for a memory."""
         timestamp = str(datetime.now().timestamp())
         content_hash = hashlib.md5(f"{content}{timestamp}".encode()).hexdigest()[:8]
-        return f"mem_{content_hash}_{int(timestamp)}"
+        return f"mem_{content_hash}_{int(float(timestamp))}"
     
     def store(
         self,
@@ -57,13 +57,46 @@ class MemoryStore:
         metadata: Optional[Dict[str, Any]] = None
     ) -> str:
         """Store a memory."""
+        memory_id = self._add(content, memory_type, tags, metadata)
+        self._save_index()
+        return memory_id
+    
+    def store_many(self, memories: List[Dict[str, Any]]) -> List[str]:
+        """
+        Store several memories and write the index once.
+        
+        Each item takes the same keys as store(): content, memory_type,
+        tags and metadata.
+        """
+        memory_ids = [
+            self._add(
+                mem["content"],
+                mem.get("memory_type", "fact"),
+                mem.get("tags"),
+                mem.get("metadata")
+            )
+            for mem in memories
+        ]
+        self._save_index()
+        return memory_ids
+    
+    def _add(
+        self,
+        content: str,
+        memory_type: str,
+        tags: Optional[List[str]],
+        metadata: Optional[Dict[str, Any]]
+    ) -> str:
+        """Write a memory file and add it to the in-memory index."""
         memory_id = self._generate_id(content)
+        # Copy so the index never shares (or requires) the caller's list
+        tags = list(tags or [])
         
         memory = {
             "id": memory_id,
             "content": content,
             "type": memory_type,
-            "tags": tags or [],
+            "tags": tags,
             "metadata": metadata or {},
             "created_at": datetime.now().isoformat(),
             "accessed_count": 0,
@@ -78,19 +111,18 @@ class MemoryStore:
         # Update index
         self.index["memories"][memory_id] = {
             "type": memory_type,
-            "tags": tags or [],
+            "tags": tags,
             "created_at": memory["created_at"],
             "summary": content[:100] + "..." if len(content) > 100 else content
         }
         
         # Update tag index
-        for tag in (tags or []):
+        for tag in tags:
             if tag not in self.index["tags"]:
                 self.index["tags"][tag] = []
             self.index["tags"][tag].append(memory_id)
         
         self.index["total_memories"] += 1
-        self._save_index()
         
         return memory_id
     
@@ -151,6 +183,58 @@ class MemoryStore:
         
         return results[:limit]
     
+    def search_many(
+        self,
+        queries: List[str],
+        tags: Optional[List[str]] = None,
+        memory_type: Optional[str] = None,
+        limit: int = 10
+    ) -> List[List[Dict[str, Any]]]:
+        """
+        Run several query searches in one pass over the index.
+        
+        Returns one result list per query, in the same order and with the
+        same filtering and sorting as calling search() for each query.
+        Each memory's summary is lowercased once and its full content is
+        loaded at most once, however many queries need it.
+        """
+        lowered = [q.lower() for q in queries]
+        matches: List[List[Dict[str, Any]]] = [[] for _ in queries]
+        
+        for memory_id, info in self.index["memories"].items():
+            if memory_type and info["type"] != memory_type:
+                continue
+            
+            if tags and not any(tag in info["tags"] for tag in tags):
+                continue
+            
+            summary = info["summary"].lower()
+            content = None
+            entry = None
+            
+            for i, query in enumerate(lowered):
+                if query and query not in summary:
+                    if content is None:
+                        memory = self.retrieve(memory_id)
+                        content = memory["content"].lower() if memory else ""
+                    if query not in content:
+                        continue
+                
+                if entry is None:
+                    entry = {
+                        "id": memory_id,
+                        "summary": info["summary"],
+                        "type": info["type"],
+                        "tags": info["tags"],
+                        "created_at": info["created_at"]
+                    }
+                matches[i].append(entry)
+        
+        for results in matches:
+            results.sort(key=lambda x: x["created_at"], reverse=True)
+        
+        return [results[:limit] for results in matches]
+    
     def delete(self, memory_id: str) -> bool:
         """Delete a memory."""
         memory_file = self.memories_dir / f"{memory_id}.json"
@@ -205,6 +289,10 @@ class MemoryTool(BaseTool):
     reference it in future conversations.
     """
     
+    # The store's index and index.json are updated without locking, so calls
+    # run serially, in the order they were emitted
+    thread_safe = False
+    
     def __init__(self, config: dict):
         self.config = config
         storage_path = config.get('memory', {}).get('storage_path', './agent_memory')
@@ -222,8 +310,10 @@ class MemoryTool(BaseTool):
         
         Actions:
         - store: Save new information
+        - bulk_store: Save several memories at once
         - retrieve: Get specific memory by ID
         - search: Find memories by query, tags, or type
+        - batch_search: Run several queries at once (same filters as search)
         - forget: Delete a memory
         - stats: Get memory statistics
         """
@@ -235,7 +325,7 @@ class MemoryTool(BaseTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["store", "retrieve", "search", "forget", "stats"],
+                    "enum": ["store", "bulk_store", "retrieve", "search", "batch_search", "forget", "stats"],
                     "description": "Action to perform"
                 },
                 "content": {
@@ -261,6 +351,16 @@ class MemoryTool(BaseTool):
                     "type": "string",
                     "description": "Search query (for 'search' action)"
                 },
+                "memories": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "Memories with content, memory_type and tags (for 'bulk_store' action)"
+                },
+                "queries": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Search queries (for 'batch_search' action)"
+                },
                 "limit": {
                     "type": "integer",
                     "default": 10,
@@ -292,6 +392,21 @@ class MemoryTool(BaseTool):
                     "message": f"Memory stored successfully with ID: {memory_id}"
                 }
             
+            elif action == "bulk_store":
+                memories = kwargs.get("memories")
+                if not memories:
+                    return {"error": "Memories are required for bulk storing"}
+                if not all(mem.get("content") for mem in memories):
+                    return {"error": "Content is required for every memory"}
+                
+                memory_ids = self.store.store_many(memories)
+                
+                return {
+                    "status": "stored",
+                    "memory_ids": memory_ids,
+                    "message": f"Stored {len(memory_ids)} memories"
+                }
+            
             elif action == "retrieve":
                 memory_id = kwargs.get("memory_id")
                 if not memory_id:
@@ -323,6 +438,26 @@ class MemoryTool(BaseTool):
                     "count": len(results)
                 }
             
+            elif action == "batch_search":
+                queries = kwargs.get("queries")
+                if not queries:
+                    return {"error": "Queries are required for batch search"}
+                
+                result_sets = self.store.search_many(
+                    queries=queries,
+                    tags=kwargs.get("tags"),
+                    memory_type=kwargs.get("memory_type"),
+                    limit=kwargs.get("limit", 10)
+                )
+                
+                return {
+                    "status": "searched",
+                    "results": [
+                        {"query": query, "results": results, "count": len(results)}
+                        for query, results in zip(queries, result_sets)
+                    ]
+                }
+            
             elif action == "forget":
                 memory_id = kwargs.get("memory_id")
                 if not memory_id:
@@ -163,8 +163,13 @@ class SafeExecutor:
         
         return safe_globals
     
-    def execute(self, code: str) -> Dict[str, Any]:
-        """Execute Python code safely with sandboxing."""
+    def execute(self, code: str, timeout: Optional[int] = None) -> Dict[str, Any]:
+        """Execute Python code safely with sandboxing.
+        
+        A per-call timeout may shorten the configured limit but never extend it.
+        """
+        timeout = self.timeout if timeout is None else max(1, min(int(timeout), self.timeout))
+        
         # Validate code first
         is_valid, error_msg = self._validate_code(code)
         if not is_valid:
@@ -186,7 +191,7 @@ class SafeExecutor:
             safe_locals = {}
             
             # Execute with timeout and output capture
-            with self._timeout_context(self.timeout):
+            with self._timeout_context(timeout):
                 with redirect_stdout(output_buffer), redirect_stderr(error_buffer):
                     exec(code, safe_globals, safe_locals)
             
@@ -222,7 +227,7 @@ class SafeExecutor:
                 "status": "timeout",
                 "error": str(e),
                 "output": output_buffer.getvalue(),
-                "execution_time": self.timeout
+                "execution_time": timeout
             }
         except Exception as e:
             return {
@@ -242,6 +247,10 @@ class PythonExecutorTool(BaseTool):
     data analysis, and algorithm testing in a sandboxed environment.
     """
     
+    # The timeout uses SIGALRM and output capture swaps sys.stdout, so this
+    # tool has to run on the agent's own thread
+    thread_safe = False
+    
     def __init__(self, config: dict):
         self.config = config
         timeout = config.get('python_executor', {}).get('timeout', 
@@ -303,8 +312,8 @@ class PythonExecutorTool(BaseTool):
         else:
             result_description = ""
         
-        # Execute the code
-        result = self.executor.execute(code)
+        # Execute the code; callers may pass a shorter timeout for this run
+        result = self.executor.execute(code, timeout=kwargs.get("timeout"))
         
         # Format response
         response = {
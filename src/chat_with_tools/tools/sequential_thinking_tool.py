@@ -162,6 +162,10 @@ class SequentialThinkingTool(BaseTool):
     supports revising previous thoughts, and can branch into alternative solutions.
     """
     
+    # Sessions and thought numbering depend on earlier calls in the same
+    # turn (e.g. start then think), so calls run serially, in order
+    thread_safe = False
+    
     def __init__(self, config: dict):
         self.config = config
         self.sessions: Dict[str, ThinkingSession] = {}
@@ -192,7 +196,7 @@ class SequentialThinkingTool(BaseTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["start", "think", "revise", "branch", "conclude", "get_summary", "export"],
+                    "enum": ["start", "think", "revise", "branch", "conclude", "batch", "script", "get_summary", "export"],
                     "description": "Action to perform"
                 },
                 "problem": {
@@ -231,6 +235,16 @@ class SequentialThinkingTool(BaseTool):
                 "session_id": {
                     "type": "string",
                     "description": "Session ID (optional, uses current session if not provided)"
+                },
+                "ops": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "List of think/revise/branch/conclude operations, each with its own 'action' and arguments (for 'batch' action)"
+                },
+                "steps": {
+                    "type": "array",
+                    "items": {"type": "object"},
+                    "description": "List of steps, each with its own 'action' and arguments, that may begin with 'start' and include 'get_summary' or 'export' (for 'script' action)"
                 }
             },
             "required": ["action"]
@@ -280,6 +294,12 @@ class SequentialThinkingTool(BaseTool):
                     conclusion=kwargs.get("thought", "")
                 )
             
+            elif action == "batch":
+                return self._run_batch(session_id, kwargs.get("ops") or [])
+            
+            elif action == "script":
+                return self._run_script(session_id, kwargs.get("steps") or [])
+            
             elif action == "get_summary":
                 return self._get_summary(session_id)
             
@@ -292,6 +312,63 @@ class SequentialThinkingTool(BaseTool):
         except Exception as e:
             return {"error": f"Sequential thinking error: {str(e)}"}
     
+    # Direct entry points for Python callers that know the action statically.
+    # They skip the action-string dispatch in execute() and, unlike it, let
+    # exceptions propagate.
+    
+    def start(self, problem: str) -> Dict[str, Any]:
+        """Start a new thinking session."""
+        return self._start_session(problem)
+    
+    def think(
+        self,
+        thought: str,
+        thought_type: str = "analysis",
+        confidence: float = 1.0,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Add a thought to a session (the current one by default)."""
+        return self._add_thought(session_id or self.current_session_id, thought, thought_type, confidence)
+    
+    def revise(
+        self,
+        thought: str,
+        revises_thought_number: int,
+        confidence: float = 1.0,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Revise an earlier thought."""
+        return self._revise_thought(session_id or self.current_session_id, thought, revises_thought_number, confidence)
+    
+    def branch(
+        self,
+        thought: str,
+        branch_from_thought: int,
+        branch_name: Optional[str] = None,
+        confidence: float = 1.0,
+        session_id: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """Start an alternative branch from an earlier thought."""
+        return self._create_branch(
+            session_id or self.current_session_id,
+            thought,
+            branch_from_thought,
+            branch_name or f"branch_{int(time.time())}",
+            confidence
+        )
+    
+    def conclude(self, thought: str, session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Conclude a session and return its analysis."""
+        return self._conclude_session(session_id or self.current_session_id, thought)
+    
+    def batch(self, ops: List[Dict[str, Any]], session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Apply several operations to a session in one call."""
+        return self._run_batch(session_id or self.current_session_id, ops)
+    
+    def script(self, steps: List[Dict[str, Any]], session_id: Optional[str] = None) -> Dict[str, Any]:
+        """Run a list of steps, possibly starting a new session, in one call."""
+        return self._run_script(session_id or self.current_session_id, steps)
+    
     def _start_session(self, problem: str) -> Dict[str, Any]:
         """Start a new thinking session."""
         session_id = self._generate_session_id()
@@ -431,6 +508,105 @@ class SequentialThinkingTool(BaseTool):
             "export_data": thinking_chain
         }
     
+    def _apply_op(self, session_id: str, op: Dict[str, Any]) -> Optional[Dict[str, Any]]:
+        """Apply one think/revise/branch/conclude operation, or None if unsupported."""
+        op_action = op.get("action")
+        confidence = op.get("confidence", 1.0)
+        
+        if op_action == "think":
+            return self._add_thought(
+                session_id=session_id,
+                thought=op.get("thought", ""),
+                thought_type=op.get("thought_type", "analysis"),
+                confidence=confidence
+            )
+        elif op_action == "revise":
+            return self._revise_thought(
+                session_id=session_id,
+                thought=op.get("thought", ""),
+                revises_number=op.get("revises_thought_number"),
+                confidence=confidence
+            )
+        elif op_action == "branch":
+            return self._create_branch(
+                session_id=session_id,
+                thought=op.get("thought", ""),
+                branch_from=op.get("branch_from_thought"),
+                branch_name=op.get("branch_name", f"branch_{int(time.time())}"),
+                confidence=confidence
+            )
+        elif op_action == "conclude":
+            return self._conclude_session(
+                session_id=session_id,
+                conclusion=op.get("thought", "")
+            )
+        return None
+    
+    def _run_batch(self, session_id: str, ops: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Apply several operations to one session in a single call.
+        
+        Operations run in order and the batch stops at the first error, so
+        the results list shows how far it got.
+        """
+        if session_id not in self.sessions:
+            return {"error": "Session not found. Start a session first."}
+        
+        results = []
+        for op in ops:
+            result = self._apply_op(session_id, op)
+            if result is None:
+                result = {"error": f"Unsupported batch action: {op.get('action')}"}
+            
+            results.append(result)
+            if "error" in result:
+                break
+        
+        session = self.sessions[session_id]
+        return {
+            "status": "batch_applied" if not results or "error" not in results[-1] else "batch_failed",
+            "session_id": session_id,
+            "applied": sum(1 for r in results if "error" not in r),
+            "results": results,
+            "total_thoughts": session.metadata["total_thoughts"]
+        }
+    
+    def _run_script(self, session_id: Optional[str], steps: List[Dict[str, Any]]) -> Dict[str, Any]:
+        """Run a scripted session, from 'start' to 'conclude', in a single call.
+        
+        A 'start' step opens a session that the following steps apply to;
+        before one, steps apply to session_id. Besides the batch operations,
+        steps may be 'get_summary' or 'export'. Like a batch, the script stops
+        at the first error.
+        """
+        results = []
+        for step in steps:
+            step_action = step.get("action")
+            
+            if step_action == "start":
+                result = self._start_session(step.get("problem", "Undefined problem"))
+                session_id = result.get("session_id", session_id)
+            elif step_action == "get_summary":
+                result = self._get_summary(session_id)
+            elif step_action == "export":
+                result = self._export_session(session_id)
+            else:
+                result = self._apply_op(session_id, step)
+                if result is None:
+                    result = {"error": f"Unsupported script action: {step_action}"}
+            
+            results.append(result)
+            if "error" in result:
+                break
+        
+        session = self.sessions.get(session_id)
+        return {
+            "status": "script_applied" if not results or "error" not in results[-1] else "script_failed",
+            "session_id": session_id,
+            "applied": sum(1 for r in results if "error" not in r),
+            "results": results,
+            "total_thoughts": session.metadata["total_thoughts"] if session else 0
+        }
+    
     def _get_summary(self, session_id: str) -> Dict[str, Any]:
         """Get current session summary."""
         if session_id not in self.sessions:
@@ -7,15 +7,23 @@ various strategies for condensing long texts.
 
 import re
 import math
+import hashlib
+import threading
 from typing import Dict, Any, List, Optional
-from collections import Counter
+from collections import Counter, OrderedDict
 from .base_tool import BaseTool
 
 
 class TextSummarizer:
     """Text summarization engine with multiple strategies."""
     
+    # Number of parsed texts kept for callers that pass a cache_key
+    PARSE_CACHE_SIZE = 32
+    
     def __init__(self):
+        self._parse_cache: "OrderedDict[str, Dict[str, Any]]" = OrderedDict()
+        self._parse_lock = threading.Lock()
+        
         # Common English stop words
         self.stop_words = set([
             'the', 'is', 'at', 'which', 'on', 'a', 'an', 'as', 'are', 'was',
@@ -44,6 +52,65 @@ class TextSummarizer:
         sentences = [s.strip() for s in sentences if s.strip()]
         return sentences
     
+    def _parse(
+        self,
+        text: str,
+        cache_key: Optional[str] = None,
+        sentences: Optional[List[str]] = None
+    ) -> Dict[str, Any]:
+        """
+        Tokenize and sentence-split text, reusing earlier work for cache_key.
+        
+        The cached entry is only reused if it was built from the same text,
+        so a stale key never returns results for a different document.
+        Callers that already split the text may pass sentences to skip the
+        splitter.
+        """
+        if cache_key is not None:
+            with self._parse_lock:
+                parsed = self._parse_cache.get(cache_key)
+                if parsed is not None and parsed["text"] == text:
+                    self._parse_cache.move_to_end(cache_key)
+                    return parsed
+        
+        words = self._tokenize(text)
+        parsed = {
+            "text": text,
+            "words": words,
+            "sentences": list(sentences) if sentences is not None else self._sentence_split(text),
+            "word_freq": self._calculate_word_frequencies(words)
+        }
+        
+        if cache_key is not None:
+            with self._parse_lock:
+                self._parse_cache[cache_key] = parsed
+                self._parse_cache.move_to_end(cache_key)
+                while len(self._parse_cache) > self.PARSE_CACHE_SIZE:
+                    self._parse_cache.popitem(last=False)
+        
+        return parsed
+    
+    def prepare(self, text: str, sentences: Optional[List[str]] = None) -> str:
+        """
+        Parse text once and return a doc_id for later calls.
+        
+        The id is derived from the content, so preparing the same text twice
+        yields the same id. Pre-split sentences are part of the id, since
+        they replace the built-in splitter for this document.
+        """
+        digest = hashlib.sha1(text.encode("utf-8"))
+        if sentences is not None:
+            digest.update("\0".join(sentences).encode("utf-8"))
+        doc_id = "doc_" + digest.hexdigest()[:16]
+        self._parse(text, doc_id, sentences)
+        return doc_id
+    
+    def get_prepared_text(self, doc_id: str) -> Optional[str]:
+        """Return the text behind a doc_id, or None if it was evicted."""
+        with self._parse_lock:
+            parsed = self._parse_cache.get(doc_id)
+        return parsed["text"] if parsed is not None else None
+    
     def _calculate_word_frequencies(self, words: List[str]) -> Dict[str, float]:
         """Calculate word frequencies excluding stop words."""
         word_freq = Counter(w for w in words if w not in self.stop_words)
@@ -83,7 +150,8 @@ class TextSummarizer:
         text: str,
         ratio: float = 0.3,
         min_sentences: int = 1,
-        max_sentences: Optional[int] = None
+        max_sentences: Optional[int] = None,
+        cache_key: Optional[str] = None
     ) -> str:
         """
         Extractive summarization using frequency-based scoring.
@@ -93,25 +161,98 @@ class TextSummarizer:
             ratio: Ratio of sentences to keep (0-1)
             min_sentences: Minimum number of sentences
             max_sentences: Maximum number of sentences
+            cache_key: Optional key for reusing the parsed text across calls
         
         Returns:
             Summary text
         """
-        # Split into sentences
-        sentences = self._sentence_split(text)
+        return self._summarize_parsed(
+            self._parse(text, cache_key), ratio, min_sentences, max_sentences
+        )
+    
+    def key_points_extraction(
+        self,
+        text: str,
+        num_points: int = 5,
+        cache_key: Optional[str] = None
+    ) -> List[str]:
+        """
+        Extract key points from text.
+        
+        Args:
+            text: Text to analyze
+            num_points: Number of key points to extract
+            cache_key: Optional key for reusing the parsed text across calls
+        
+        Returns:
+            List of key points
+        """
+        return self._key_points_parsed(self._parse(text, cache_key), num_points)
+    
+    def summarize_multi(
+        self,
+        text: str,
+        ratios: List[float],
+        key_point_counts: List[int],
+        min_sentences: int = 1,
+        max_sentences: Optional[int] = None,
+        cache_key: Optional[str] = None
+    ) -> Dict[str, Any]:
+        """
+        Build several summaries and key-point lists from one parse.
+        
+        Args:
+            text: Text to summarize
+            ratios: Summary ratios to produce
+            key_point_counts: Key-point list sizes to produce
+            min_sentences: Minimum number of sentences per summary
+            max_sentences: Maximum number of sentences per summary
+            cache_key: Optional key for reusing the parsed text across calls
+        
+        Returns:
+            {"summaries": {ratio: summary}, "key_points": {count: points}}
+        """
+        parsed = self._parse(text, cache_key)
+        return {
+            "summaries": {
+                ratio: self._summarize_parsed(parsed, ratio, min_sentences, max_sentences)
+                for ratio in ratios
+            },
+            "key_points": {
+                count: self._key_points_parsed(parsed, count)
+                for count in key_point_counts
+            }
+        }
+    
+    def _ranking(self, parsed: Dict[str, Any]) -> List[int]:
+        """Sentence indices ordered by score, computed once per parse."""
+        with self._parse_lock:
+            ranking = parsed.get("ranking")
+        if ranking is None:
+            sentences = parsed["sentences"]
+            scores = self._score_sentences(sentences, parsed["word_freq"])
+            ranking = sorted(range(len(sentences)), key=lambda i: scores[i], reverse=True)
+            # parsed may be a shared cache entry; keep whichever ranking
+            # was stored first
+            with self._parse_lock:
+                ranking = parsed.setdefault("ranking", ranking)
+        return ranking
+    
+    def _summarize_parsed(
+        self,
+        parsed: Dict[str, Any],
+        ratio: float,
+        min_sentences: int,
+        max_sentences: Optional[int]
+    ) -> str:
+        """Extractive summary of an already parsed text."""
+        sentences = parsed["sentences"]
         
         if not sentences:
             return ""
         
         if len(sentences) <= min_sentences:
-            return text
-        
-        # Tokenize and calculate word frequencies
-        words = self._tokenize(text)
-        word_freq = self._calculate_word_frequencies(words)
-        
-        # Score sentences
-        scores = self._score_sentences(sentences, word_freq)
+            return parsed["text"]
         
         # Determine number of sentences to keep
         num_sentences = max(
@@ -122,15 +263,8 @@ class TextSummarizer:
             )
         )
         
-        # Get top sentences (maintain original order)
-        sentence_indices = sorted(
-            range(len(sentences)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:num_sentences]
-        
-        # Sort by original position
-        sentence_indices.sort()
+        # Get top sentences, then restore their original order
+        sentence_indices = sorted(self._ranking(parsed)[:num_sentences])
         
         # Build summary
         summary_sentences = [sentences[i] for i in sentence_indices]
@@ -142,42 +276,18 @@ class TextSummarizer:
         
         return summary
     
-    def key_points_extraction(self, text: str, num_points: int = 5) -> List[str]:
-        """
-        Extract key points from text.
-        
-        Args:
-            text: Text to analyze
-            num_points: Number of key points to extract
-        
-        Returns:
-            List of key points
-        """
-        sentences = self._sentence_split(text)
+    def _key_points_parsed(self, parsed: Dict[str, Any], num_points: int) -> List[str]:
+        """Key points of an already parsed text."""
+        sentences = parsed["sentences"]
         
         if not sentences:
             return []
         
-        # Calculate word frequencies
-        words = self._tokenize(text)
-        word_freq = self._calculate_word_frequencies(words)
-        
-        # Score sentences
-        scores = self._score_sentences(sentences, word_freq)
-        
-        # Get top sentences as key points
-        num_points = min(num_points, len(sentences))
-        top_indices = sorted(
-            range(len(sentences)),
-            key=lambda i: scores[i],
-            reverse=True
-        )[:num_points]
-        
-        # Sort by original order
-        top_indices.sort()
+        # Get top sentences as key points, in their original order
+        top_indices = sorted(self._ranking(parsed)[:num_points])
         
         key_points = []
-        for i, idx in enumerate(top_indices, 1):
+        for idx in top_indices:
             # Clean up sentence
             sentence = sentences[idx].strip()
             if sentence and not sentence[-1] in '.!?':
@@ -186,18 +296,20 @@ class TextSummarizer:
         
         return key_points
     
-    def statistics(self, text: str) -> Dict[str, Any]:
+    def statistics(self, text: str, cache_key: Optional[str] = None) -> Dict[str, Any]:
         """
         Calculate text statistics.
         
         Args:
             text: Text to analyze
+            cache_key: Optional key for reusing the parsed text across calls
         
         Returns:
             Dictionary of statistics
         """
-        words = self._tokenize(text)
-        sentences = self._sentence_split(text)
+        parsed = self._parse(text, cache_key)
+        words = parsed["words"]
+        sentences = parsed["sentences"]
         paragraphs = text.split('\n\n')
         
         # Calculate readability (simple approximation)
@@ -263,7 +375,10 @@ class SummarizationTool(BaseTool):
         return """Summarize and analyze text using various strategies.
         
         Actions:
+        - prepare: Parse text once and get a doc_id to pass instead of text;
+          pre-split sentences may be passed to skip sentence splitting
         - summarize: Create an extractive summary
+        - summarize_multi: Several summaries and key-point lists in one pass
         - key_points: Extract main points from text
         - statistics: Analyze text statistics and readability
         
@@ -281,12 +396,21 @@ class SummarizationTool(BaseTool):
             "properties": {
                 "action": {
                     "type": "string",
-                    "enum": ["summarize", "key_points", "statistics"],
+                    "enum": ["prepare", "summarize", "summarize_multi", "key_points", "statistics"],
                     "description": "Type of summarization to perform"
                 },
                 "text": {
                     "type": "string",
-                    "description": "Text to summarize or analyze"
+                    "description": "Text to summarize or analyze (or pass doc_id)"
+                },
+                "sentences": {
+                    "type": "array",
+                    "items": {"type": "string"},
+                    "description": "Optional pre-split sentences of text (for 'prepare')"
+                },
+                "doc_id": {
+                    "type": "string",
+                    "description": "ID returned by 'prepare', used instead of text"
                 },
                 "ratio": {
                     "type": "number",
@@ -302,6 +426,16 @@ class SummarizationTool(BaseTool):
                     "maximum": 20,
                     "description": "Number of key points to extract (for 'key_points')"
                 },
+                "ratios": {
+                    "type": "array",
+                    "items": {"type": "number"},
+                    "description": "Ratios to summarize at (for 'summarize_multi')"
+                },
+                "key_points": {
+                    "type": "array",
+                    "items": {"type": "integer"},
+                    "description": "Key-point counts to extract (for 'summarize_multi')"
+                },
                 "min_sentences": {
                     "type": "integer",
                     "default": 1,
@@ -310,45 +444,90 @@ class SummarizationTool(BaseTool):
                 "max_sentences": {
                     "type": "integer",
                     "description": "Maximum sentences in summary (for 'summarize')"
+                },
+                "cache_key": {
+                    "type": "string",
+                    "description": "Optional key to reuse parsing when running several actions on the same text"
                 }
             },
-            "required": ["action", "text"]
+            "required": ["action"]
+        }
+    
+    def _summary_response(self, text: str, summary: str) -> Dict[str, Any]:
+        """Build the result for one summary, including the size reduction."""
+        original_length = len(text)
+        summary_length = len(summary)
+        reduction = round((1 - summary_length / original_length) * 100, 1) if original_length > 0 else 0
+        
+        return {
+            "status": "summarized",
+            "summary": summary,
+            "original_length": original_length,
+            "summary_length": summary_length,
+            "reduction_percentage": reduction
         }
     
     def execute(self, **kwargs) -> Dict[str, Any]:
         """Execute summarization operations."""
         action = kwargs.get("action")
         text = kwargs.get("text", "")
+        cache_key = kwargs.get("cache_key")
+        doc_id = kwargs.get("doc_id")
+        
+        if not text and doc_id:
+            text = self.summarizer.get_prepared_text(doc_id)
+            if text is None:
+                return {"error": f"Unknown doc_id: {doc_id}. Call 'prepare' again."}
+            cache_key = doc_id
         
         if not text:
             return {"error": "No text provided"}
         
         try:
-            if action == "summarize":
+            if action == "prepare":
+                return {
+                    "status": "prepared",
+                    "doc_id": self.summarizer.prepare(text, kwargs.get("sentences"))
+                }
+            
+            elif action == "summarize":
                 summary = self.summarizer.extractive_summarize(
                     text=text,
                     ratio=kwargs.get("ratio", 0.3),
                     min_sentences=kwargs.get("min_sentences", 1),
-                    max_sentences=kwargs.get("max_sentences")
+                    max_sentences=kwargs.get("max_sentences"),
+                    cache_key=cache_key
                 )
                 
-                # Calculate reduction
-                original_length = len(text)
-                summary_length = len(summary)
-                reduction = round((1 - summary_length / original_length) * 100, 1) if original_length > 0 else 0
+                return self._summary_response(text, summary)
+            
+            elif action == "summarize_multi":
+                result = self.summarizer.summarize_multi(
+                    text=text,
+                    ratios=kwargs.get("ratios") or [kwargs.get("ratio", 0.3)],
+                    key_point_counts=kwargs.get("key_points") or [],
+                    min_sentences=kwargs.get("min_sentences", 1),
+                    max_sentences=kwargs.get("max_sentences"),
+                    cache_key=cache_key
+                )
                 
                 return {
                     "status": "summarized",
-                    "summary": summary,
-                    "original_length": original_length,
-                    "summary_length": summary_length,
-                    "reduction_percentage": reduction
+                    "summaries": [
+                        dict(self._summary_response(text, summary), ratio=ratio)
+                        for ratio, summary in result["summaries"].items()
+                    ],
+                    "key_points": [
+                        {"num_points": len(points), "requested": count, "key_points": points}
+                        for count, points in result["key_points"].items()
+                    ]
                 }
             
             elif action == "key_points":
                 points = self.summarizer.key_points_extraction(
                     text=text,
-                    num_points=kwargs.get("num_points", 5)
+                    num_points=kwargs.get("num_points", 5),
+                    cache_key=cache_key
                 )
                 
                 return {
@@ -358,7 +537,7 @@ class SummarizationTool(BaseTool):
                 }
             
             elif action == "statistics":
-                stats = self.summarizer.statistics(text)
+                stats = self.summarizer.statistics(text, cache_key=cache_key)
                 
                 return {
                     "status": "analyzed",
@@ -4,6 +4,8 @@ import json
 import logging
 import logging.handlers
 import os
+import statistics
+import threading
 import time
 from datetime import datetime
 from functools import wraps
@@ -302,6 +304,8 @@ class RateLimiter:
         self.per = per
         self.allowance = rate
         self.last_check = time.time()
+        # One limiter may be shared by agents on several threads
+        self._lock = threading.Lock()
     
     def allow_request(self) -> bool:
         """
@@ -310,23 +314,24 @@ class RateLimiter:
         Returns:
             True if request is allowed, False if rate limited
         """
-        current = time.time()
-        time_passed = current - self.last_check
-        self.last_check = current
-        
-        # Replenish tokens based on time passed
-        self.allowance += time_passed * (self.rate / self.per)
-        
-        # Cap at maximum rate
-        if self.allowance > self.rate:
-            self.allowance = self.rate
-        
-        # Check if we have tokens available
-        if self.allowance < 1.0:
-            return False
-        else:
-            self.allowance -= 1.0
-            return True
+        with self._lock:
+            current = time.time()
+            time_passed = current - self.last_check
+            self.last_check = current
+            
+            # Replenish tokens based on time passed
+            self.allowance += time_passed * (self.rate / self.per)
+            
+            # Cap at maximum rate
+            if self.allowance > self.rate:
+                self.allowance = self.rate
+            
+            # Check if we have tokens available
+            if self.allowance < 1.0:
+                return False
+            else:
+                self.allowance -= 1.0
+                return True
     
     def wait_if_needed(self) -> None:
         """Wait until a request is allowed."""
@@ -345,32 +350,39 @@ class MetricsCollector:
             'total_tokens': 0,
             'response_times': []
         }
+        # Tool calls from one turn, and the API calls and errors they
+        # cause, may be recorded from several threads
+        self._lock = threading.Lock()
     
     def record_api_call(self, tokens: int = 0) -> None:
         """Record an API call."""
-        self.metrics['api_calls'] += 1
-        self.metrics['total_tokens'] += tokens
+        with self._lock:
+            self.metrics['api_calls'] += 1
+            self.metrics['total_tokens'] += tokens
     
     def record_tool_call(self, tool_name: str) -> None:
         """Record a tool call."""
-        if tool_name not in self.metrics['tool_calls']:
-            self.metrics['tool_calls'][tool_name] = 0
-        self.metrics['tool_calls'][tool_name] += 1
+        with self._lock:
+            if tool_name not in self.metrics['tool_calls']:
+                self.metrics['tool_calls'][tool_name] = 0
+            self.metrics['tool_calls'][tool_name] += 1
     
     def record_error(self) -> None:
         """Record an error."""
-        self.metrics['errors'] += 1
+        with self._lock:
+            self.metrics['errors'] += 1
     
     def record_response_time(self, duration: float) -> None:
         """Record a response time."""
-        self.metrics['response_times'].append(duration)
+        with self._lock:
+            self.metrics['response_times'].append(duration)
     
     def get_summary(self) -> dict:
         """Get metrics summary."""
-        avg_response_time = (
-            sum(self.metrics['response_times']) / len(self.metrics['response_times'])
-            if self.metrics['response_times'] else 0
-        )
+        response_times = self.metrics['response_times']
+        avg_response_time = sum(response_times) / len(response_times) if response_times else 0
+        # The median is less skewed than the mean by one slow run
+        median_response_time = statistics.median(response_times) if response_times else 0
         
         return {
             'api_calls': self.metrics['api_calls'],
@@ -378,7 +390,8 @@ class MetricsCollector:
             'errors': self.metrics['errors'],
             'total_tokens': self.metrics['total_tokens'],
             'avg_response_time': avg_response_time,
-            'total_response_time': sum(self.metrics['response_times'])
+            'median_response_time': median_response_time,
+            'total_response_time': sum(response_times)
         }
 
 
@@ -4,18 +4,32 @@ This module provides seamless integration between the agent framework and vLLM's
 structured output capabilities without duplicating existing functionality.
 """
 
+import importlib.util
 import json
 import logging
-from typing import Dict, Any, List, Optional, Union, Type
+from functools import lru_cache
+from typing import TYPE_CHECKING, Dict, Any, List, Optional, Tuple, Union, Type
 from dataclasses import dataclass
 from enum import Enum
 
-try:
-    from pydantic import BaseModel, Field, validator
-    PYDANTIC_AVAILABLE = True
-except ImportError:
-    PYDANTIC_AVAILABLE = False
-    BaseModel = object
+if TYPE_CHECKING:
+    from pydantic import BaseModel
+
+# Only check that pydantic is installed; the models handed to this module
+# bring it in themselves, so importing it here would just slow down startup.
+PYDANTIC_AVAILABLE = importlib.util.find_spec("pydantic") is not None
+
+
+def __getattr__(name):
+    """Resolve BaseModel on first access for callers that import it from here"""
+    if name != "BaseModel":
+        raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+    if PYDANTIC_AVAILABLE:
+        from pydantic import BaseModel as value
+    else:
+        value = object
+    globals()[name] = value
+    return value
 
 
 class VLLMMode(Enum):
@@ -104,7 +118,7 @@ class VLLMStructuredOutputManager:
         self,
         request_params: Dict[str, Any],
         tools: Optional[List[Dict[str, Any]]] = None,
-        response_format: Optional[Type[BaseModel]] = None,
+        response_format: Optional[Type["BaseModel"]] = None,
         mode: VLLMMode = VLLMMode.STANDARD
     ) -> Dict[str, Any]:
         """
@@ -139,7 +153,7 @@ class VLLMStructuredOutputManager:
         self,
         request_params: Dict[str, Any],
         tools: Optional[List[Dict[str, Any]]],
-        response_format: Optional[Type[BaseModel]],
+        response_format: Optional[Type["BaseModel"]],
         mode: VLLMMode
     ) -> Dict[str, Any]:
         """Prepare request for Outlines backend."""
@@ -176,7 +190,7 @@ class VLLMStructuredOutputManager:
         self,
         request_params: Dict[str, Any],
         tools: Optional[List[Dict[str, Any]]],
-        response_format: Optional[Type[BaseModel]],
+        response_format: Optional[Type["BaseModel"]],
         mode: VLLMMode
     ) -> Dict[str, Any]:
         """Prepare request for JSON Schema backend."""
@@ -202,7 +216,7 @@ class VLLMStructuredOutputManager:
         
         return request_params
     
-    def _get_schema(self, model_class: Type[BaseModel]) -> Dict[str, Any]:
+    def _get_schema(self, model_class: Type["BaseModel"]) -> Dict[str, Any]:
         """Get or cache a Pydantic model's JSON schema."""
         if not PYDANTIC_AVAILABLE:
             return {}
@@ -303,7 +317,7 @@ class VLLMStructuredOutputManager:
     def validate_response(
         self,
         response_content: str,
-        expected_format: Optional[Type[BaseModel]] = None,
+        expected_format: Optional[Type["BaseModel"]] = None,
         retry_on_failure: Optional[bool] = None
     ) -> Dict[str, Any]:
         """
@@ -391,6 +405,29 @@ class VLLMStructuredOutputManager:
         }
 
 
+@lru_cache(maxsize=1024)
+def _routing_scores(
+    owners: Tuple[Tuple[str, Tuple[str, ...]], ...],
+    text: str
+) -> Tuple[int, int]:
+    """
+    Thinking and fast keyword scores for a lowercased query.
+    
+    Each category scores the number of its distinct keywords found in text
+    by substring match; a keyword listed under both categories is checked
+    once. Cached on the keyword owners, so selectors built from the same
+    routing config share results for repeated queries.
+    """
+    thinking_score = fast_score = 0
+    for keyword, categories in owners:
+        if keyword in text:
+            if "thinking" in categories:
+                thinking_score += 1
+            if "fast" in categories:
+                fast_score += 1
+    return thinking_score, fast_score
+
+
 class VLLMEndpointSelector:
     """
     Intelligent endpoint selector for multi-endpoint configurations.
@@ -419,6 +456,22 @@ class VLLMEndpointSelector:
         # Tool endpoint overrides
         self.tool_overrides = config.get('tool_endpoint_overrides', {})
         
+        # Thinking and fast keywords, each with the categories it counts
+        # towards, so a keyword in both lists is only checked once per query
+        self._keyword_owners: Dict[str, Tuple[str, ...]] = {}
+        for category in ("thinking", "fast"):
+            for keyword in self.routing_config.get(f'{category}_keywords', []):
+                if keyword:
+                    owners = self._keyword_owners.get(keyword.lower(), ())
+                    if category not in owners:
+                        self._keyword_owners[keyword.lower()] = owners + (category,)
+        self._keyword_owners_key = tuple(self._keyword_owners.items())
+        
+        # First endpoint of each model type, in configuration order
+        self._endpoint_by_type: Dict[str, str] = {}
+        for name, endpoint in self.endpoints.items():
+            self._endpoint_by_type.setdefault(endpoint.get('model_type'), name)
+        
         self.logger.debug(f"Endpoint selector initialized with {len(self.endpoints)} endpoints")
     
     def select_endpoint(
@@ -469,13 +522,10 @@ class VLLMEndpointSelector:
         """
         query_lower = query.lower()
         
-        # Check for thinking keywords
-        thinking_keywords = self.routing_config.get('thinking_keywords', [])
-        thinking_score = sum(1 for keyword in thinking_keywords if keyword in query_lower)
-        
-        # Check for fast keywords
-        fast_keywords = self.routing_config.get('fast_keywords', [])
-        fast_score = sum(1 for keyword in fast_keywords if keyword in query_lower)
+        # Score each type by the number of distinct keywords in the query
+        thinking_score, fast_score = _routing_scores(
+            self._keyword_owners_key, query_lower
+        )
         
         # Determine based on scores
         if thinking_score > fast_score and thinking_score > 0:
@@ -499,12 +549,10 @@ class VLLMEndpointSelector:
         Returns:
             Endpoint name or None
         """
-        for name, config in self.endpoints.items():
-            if config.get('model_type') == endpoint_type:
-                return name
-        
-        self.logger.warning(f"No endpoint found for type: {endpoint_type}")
-        return None
+        name = self._endpoint_by_type.get(endpoint_type)
+        if name is None:
+            self.logger.warning(f"No endpoint found for type: {endpoint_type}")
+        return name
     
     def get_endpoint_config(self, endpoint_name: str) -> Optional[Dict[str, Any]]:
         """
@@ -4,14 +4,22 @@ import unittest
 import tempfile
 import os
 import json
+import threading
 import yaml
 from unittest.mock import Mock, patch, MagicMock
 import sys
+from pathlib import Path
 sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
 from src.chat_with_tools.tools.base_tool import BaseTool
 from src.chat_with_tools.tools import discover_tools
 from src.chat_with_tools.agent import OpenRouterAgent, ConnectionPool
+from src.chat_with_tools.config_manager import ConfigManager
+from src.chat_with_tools.tools.sequential_thinking_tool import SequentialThinkingTool
+from src.chat_with_tools.tools.summarization_tool import SummarizationTool
+from src.chat_with_tools.tools.memory_tool import MemoryTool
+from src.chat_with_tools.tools.python_executor_tool import PythonExecutorTool
+from src.chat_with_tools.vllm_integration import VLLMEndpointSelector
 from src.chat_with_tools.utils import (
     validate_url, 
     get_env_or_config, 
@@ -95,6 +103,8 @@ class TestUtils(unittest.TestCase):
         metrics.record_tool_call("search_web")
         metrics.record_tool_call("search_web")
         metrics.record_response_time(1.5)
+        metrics.record_response_time(0.5)
+        metrics.record_response_time(4.0)
         metrics.record_error()
         
         summary = metrics.get_summary()
@@ -103,7 +113,8 @@ class TestUtils(unittest.TestCase):
         self.assertEqual(summary['total_tokens'], 100)
         self.assertEqual(summary['tool_calls']['search_web'], 2)
         self.assertEqual(summary['errors'], 1)
-        self.assertEqual(summary['avg_response_time'], 1.5)
+        self.assertEqual(summary['avg_response_time'], 2.0)
+        self.assertEqual(summary['median_response_time'], 1.5)
 
 
 class TestBaseTool(unittest.TestCase):
@@ -143,6 +154,190 @@ class TestBaseTool(unittest.TestCase):
         self.assertIn('properties', schema['function']['parameters'])
 
 
+class TestSequentialThinkingTool(unittest.TestCase):
+    """Test sequential thinking tool actions."""
+    
+    def test_batch_applies_operations_in_order(self):
+        """Test that a batch runs every operation against one session."""
+        tool = SequentialThinkingTool({})
+        session_id = tool.execute(action="start", problem="Test")["session_id"]
+        
+        result = tool.execute(
+            action="batch",
+            session_id=session_id,
+            ops=[
+                {"action": "think", "thought": "First", "confidence": 0.9},
+                {"action": "revise", "thought": "First, revised", "revises_thought_number": 2},
+                {"action": "conclude", "thought": "Done"}
+            ]
+        )
+        
+        self.assertEqual(result['status'], 'batch_applied')
+        self.assertEqual(result['applied'], 3)
+        self.assertEqual(result['total_thoughts'], 4)
+        self.assertEqual(result['results'][-1]['status'], 'session_concluded')
+    
+    def test_batch_stops_at_first_error(self):
+        """Test that a failing operation ends the batch."""
+        tool = SequentialThinkingTool({})
+        session_id = tool.execute(action="start", problem="Test")["session_id"]
+        
+        result = tool.execute(
+            action="batch",
+            session_id=session_id,
+            ops=[
+                {"action": "revise", "thought": "No target"},
+                {"action": "think", "thought": "Never added"}
+            ]
+        )
+        
+        self.assertEqual(result['status'], 'batch_failed')
+        self.assertEqual(result['applied'], 0)
+        self.assertEqual(len(result['results']), 1)
+        self.assertEqual(result['total_thoughts'], 1)
+    
+    def test_direct_methods_use_current_session(self):
+        """Test the direct think/revise methods against the current session."""
+        tool = SequentialThinkingTool({})
+        tool.start("Test")
+        
+        tool.think("First", confidence=0.5)
+        result = tool.revise("First, revised", revises_thought_number=2)
+        
+        self.assertEqual(result['status'], 'thought_revised')
+        self.assertEqual(result['original_thought']['content'], "First")
+    
+    def test_script_starts_and_runs_a_session(self):
+        """Test that a script can start a session and run every step on it."""
+        tool = SequentialThinkingTool({})
+        
+        result = tool.execute(action="script", steps=[
+            {"action": "start", "problem": "Scripted problem"},
+            {"action": "think", "thought": "First"},
+            {"action": "get_summary"},
+            {"action": "conclude", "thought": "Done"}
+        ])
+        
+        self.assertEqual(result['status'], 'script_applied')
+        self.assertEqual(result['applied'], 4)
+        self.assertEqual(result['session_id'], result['results'][0]['session_id'])
+        self.assertEqual(result['results'][2]['summary']['total_thoughts'], 2)
+        self.assertEqual(result['total_thoughts'], 3)
+
+
+class TestSummarizationTool(unittest.TestCase):
+    """Test summarization tool actions."""
+    
+    TEXT = ("Agents call tools. Tools return results to agents. "
+            "The orchestrator combines agent answers. Users read the final answer.")
+    
+    def test_cache_key_matches_uncached_results(self):
+        """Test that reusing a cache_key does not change results."""
+        tool = SummarizationTool({})
+        
+        uncached = tool.execute(action="key_points", text=self.TEXT, num_points=2)
+        tool.execute(action="statistics", text=self.TEXT, cache_key="doc")
+        cached = tool.execute(action="key_points", text=self.TEXT, num_points=2, cache_key="doc")
+        
+        self.assertEqual(cached, uncached)
+    
+    def test_cache_key_with_different_text_is_reparsed(self):
+        """Test that a reused cache_key never returns another text's parse."""
+        tool = SummarizationTool({})
+        
+        tool.execute(action="statistics", text=self.TEXT, cache_key="doc")
+        result = tool.execute(action="statistics", text="One sentence only.", cache_key="doc")
+        
+        self.assertEqual(result['statistics']['sentence_count'], 1)
+    
+    def test_prepare_returns_reusable_doc_id(self):
+        """Test that actions accept a doc_id from 'prepare' instead of text."""
+        tool = SummarizationTool({})
+        
+        doc_id = tool.execute(action="prepare", text=self.TEXT)["doc_id"]
+        by_id = tool.execute(action="summarize", doc_id=doc_id, ratio=0.5)
+        by_text = tool.execute(action="summarize", text=self.TEXT, ratio=0.5)
+        
+        self.assertEqual(by_id, by_text)
+        self.assertIn('error', tool.execute(action="summarize", doc_id="doc_missing"))
+    
+    def test_prepare_with_sentences_skips_splitting(self):
+        """Test that pre-split sentences are used as given."""
+        tool = SummarizationTool({})
+        sentences = ["Agents call tools", "Tools return results to agents"]
+        
+        doc_id = tool.execute(action="prepare", text=self.TEXT, sentences=sentences)["doc_id"]
+        result = tool.execute(action="statistics", doc_id=doc_id)
+        
+        self.assertEqual(result['statistics']['sentence_count'], 2)
+        self.assertNotEqual(doc_id, tool.execute(action="prepare", text=self.TEXT)["doc_id"])
+    
+    def test_summarize_multi_matches_single_calls(self):
+        """Test that summarize_multi returns what separate calls would."""
+        tool = SummarizationTool({})
+        
+        result = tool.execute(action="summarize_multi", text=self.TEXT, ratios=[0.25, 0.5], key_points=[2])
+        
+        for summary in result['summaries']:
+            single = tool.execute(action="summarize", text=self.TEXT, ratio=summary['ratio'])
+            self.assertEqual(summary['summary'], single['summary'])
+        single_points = tool.execute(action="key_points", text=self.TEXT, num_points=2)
+        self.assertEqual(result['key_points'][0]['key_points'], single_points['key_points'])
+
+
+class TestMemoryTool(unittest.TestCase):
+    """Test memory tool actions."""
+    
+    def setUp(self):
+        self.temp_dir = tempfile.TemporaryDirectory()
+        self.tool = MemoryTool({"memory": {"storage_path": self.temp_dir.name}})
+        self.tool.execute(action="store", content="Agents share tools", tags=["agents"])
+        self.tool.execute(action="store", content="Validate user input", memory_type="instruction")
+    
+    def tearDown(self):
+        self.temp_dir.cleanup()
+    
+    def test_batch_search_matches_individual_searches(self):
+        """Test that batch_search returns what one search per query would."""
+        queries = ["agents", "input", "missing"]
+        
+        batch = self.tool.execute(action="batch_search", queries=queries)
+        
+        self.assertEqual(batch['status'], 'searched')
+        for query, result in zip(queries, batch['results']):
+            single = self.tool.execute(action="search", query=query)
+            self.assertEqual(result['query'], query)
+            self.assertEqual(result['results'], single['results'])
+            self.assertEqual(result['count'], single['count'])
+    
+    def test_bulk_store_indexes_every_memory(self):
+        """Test that bulk_store stores each memory and returns their ids."""
+        result = self.tool.execute(action="bulk_store", memories=[
+            {"content": "First bulk memory", "tags": ["bulk"]},
+            {"content": "Second bulk memory", "memory_type": "context", "tags": ["bulk"]}
+        ])
+        
+        self.assertEqual(result['status'], 'stored')
+        self.assertEqual(len(result['memory_ids']), 2)
+        tagged = self.tool.execute(action="search", tags=["bulk"])
+        self.assertEqual({m['id'] for m in tagged['results']}, set(result['memory_ids']))
+
+
+class TestPythonExecutorTool(unittest.TestCase):
+    """Test the Python executor tool."""
+    
+    def test_timeout_override_only_shortens_limit(self):
+        """Test that a per-call timeout applies but cannot exceed the config."""
+        tool = PythonExecutorTool({"code_execution": {"timeout": 2}})
+        
+        result = tool.execute(code="while True:\n    pass", timeout=1)
+        self.assertEqual(result['status'], 'timeout')
+        self.assertEqual(result['execution_time'], 1)
+        
+        result = tool.execute(code="while True:\n    pass", timeout=60)
+        self.assertEqual(result['execution_time'], 2)
+
+
 class TestToolDiscovery(unittest.TestCase):
     """Test automatic tool discovery."""
     
@@ -268,6 +463,66 @@ class TestOpenRouterAgent(unittest.TestCase):
         # Test missing required parameter
         with self.assertRaises(ValueError):
             agent.validate_tool_arguments("test_tool", {"optional_param": 5})
+    
+    def test_handle_tool_calls_runs_concurrently_in_order(self):
+        """Test that one turn's tool calls overlap and keep their order."""
+        agent = OpenRouterAgent.__new__(OpenRouterAgent)
+        agent.parallel_tool_calls = True
+        agent.max_parallel_tool_calls = 5
+        agent.discovered_tools = {"python_executor": PythonExecutorTool({})}
+        
+        # Both pooled calls must reach the barrier together or it times out
+        barrier = threading.Barrier(2, timeout=5)
+        main_thread = threading.current_thread()
+        
+        def handle(tool_call):
+            if tool_call.function.name == "python_executor":
+                self.assertIs(threading.current_thread(), main_thread)
+            else:
+                barrier.wait()
+            return {"tool_call_id": tool_call.id}
+        
+        agent.handle_tool_call = handle
+        tool_calls = []
+        for call_id, name in [("a", "search"), ("b", "python_executor"), ("c", "search")]:
+            tool_call = MagicMock(id=call_id)
+            tool_call.function.name = name
+            tool_calls.append(tool_call)
+        
+        results = agent.handle_tool_calls(tool_calls)
+        
+        self.assertEqual([r["tool_call_id"] for r in results], ["a", "b", "c"])
+    
+    def test_handle_tool_calls_runs_stateful_tools_serially(self):
+        """Test that calls to stateful tools run on the caller, in emitted order."""
+        agent = OpenRouterAgent.__new__(OpenRouterAgent)
+        agent.parallel_tool_calls = True
+        agent.max_parallel_tool_calls = 5
+        agent.discovered_tools = {
+            "memory": MemoryTool.__new__(MemoryTool),
+            "sequential_thinking": SequentialThinkingTool({}),
+        }
+        
+        main_thread = threading.current_thread()
+        handled = []
+        
+        def handle(tool_call):
+            self.assertIs(threading.current_thread(), main_thread)
+            handled.append(tool_call.id)
+            return {"tool_call_id": tool_call.id}
+        
+        agent.handle_tool_call = handle
+        tool_calls = []
+        for call_id, name in [("a", "sequential_thinking"), ("b", "memory"),
+                              ("c", "sequential_thinking"), ("d", "memory")]:
+            tool_call = MagicMock(id=call_id)
+            tool_call.function.name = name
+            tool_calls.append(tool_call)
+        
+        results = agent.handle_tool_calls(tool_calls)
+        
+        self.assertEqual(handled, ["a", "b", "c", "d"])
+        self.assertEqual([r["tool_call_id"] for r in results], ["a", "b", "c", "d"])
 
 
 class TestConnectionPool(unittest.TestCase):
@@ -295,6 +550,31 @@ class TestConnectionPool(unittest.TestCase):
         self.assertEqual(mock_openai.call_count, 2)
 
 
+class TestVLLMEndpointSelector(unittest.TestCase):
+    """Test query routing between endpoint types."""
+    
+    def _selector(self, thinking_keywords, fast_keywords):
+        return VLLMEndpointSelector({
+            'agent': {
+                'auto_select_endpoint': True,
+                'query_routing': {
+                    'thinking_keywords': thinking_keywords,
+                    'fast_keywords': fast_keywords,
+                    'default_type': 'balanced'
+                }
+            }
+        })
+    
+    def test_keywords_sharing_a_prefix_all_count(self):
+        """Test that keywords starting at the same position are each counted."""
+        selector = self._selector(["reason", "reasoning"], ["list"])
+        self.assertEqual(selector._analyze_query("Reasoning about listing"), "thinking")
+        
+        # One keyword per category, so the tie falls back to the default
+        selector = self._selector(["quick analysis"], ["quick"])
+        self.assertEqual(selector._analyze_query("A quick analysis"), "balanced")
+
+
 class TestEndToEnd(unittest.TestCase):
     """End-to-end integration tests."""
     
@@ -348,6 +628,54 @@ class TestEndToEnd(unittest.TestCase):
             
         finally:
             os.unlink(config_file)
+    
+    @patch.dict('src.chat_with_tools.agent.ConnectionPool._instances', clear=True)
+    @patch('src.chat_with_tools.agent.OpenAI')
+    @patch('src.chat_with_tools.agent.discover_tools')
+    def test_streamed_query_flow(self, mock_discover, mock_openai_class):
+        """Test that run_stream yields the response as it arrives."""
+        mock_client = MagicMock()
+        mock_openai_class.return_value = mock_client
+        
+        # Mock a streamed completion split over three chunks
+        chunks = []
+        for text in ("Test", " streamed", " response"):
+            chunk = MagicMock()
+            chunk.choices[0].delta.content = text
+            chunk.choices[0].delta.tool_calls = None
+            chunks.append(chunk)
+        mock_client.chat.completions.create.side_effect = lambda **kwargs: iter(chunks)
+        
+        mock_discover.return_value = {}
+        
+        config = {
+            'openrouter': {
+                'api_key': 'test_key',
+                'base_url': 'https://test.api.com',
+                'model': 'test-model'
+            },
+            'system_prompt': 'Test prompt',
+            'agent': {'max_iterations': 1},
+            # Pooled clients are built from the OpenAI class patched above
+            'performance': {'connection_pooling': True}
+        }
+        
+        with tempfile.NamedTemporaryFile(mode='w', suffix='.yaml', delete=False) as f:
+            yaml.dump(config, f)
+            config_file = f.name
+        
+        try:
+            # The agent loads its config through ConfigManager, so point that
+            # at the temporary file rather than searching the working directory
+            with patch.object(ConfigManager, '_find_config_file', return_value=Path(config_file)):
+                agent = OpenRouterAgent(config_file, silent=True)
+            pieces = list(agent.run_stream("Test query"))
+            
+            self.assertEqual(pieces, ["Test", " streamed", " response"])
+            self.assertTrue(mock_client.chat.completions.create.call_args.kwargs['stream'])
+            
+        finally:
+            os.unlink(config_file)
 
 
 def run_tests():
@@ -358,9 +686,14 @@ def run_tests():
     # Add all test cases
     suite.addTests(loader.loadTestsFromTestCase(TestUtils))
     suite.addTests(loader.loadTestsFromTestCase(TestBaseTool))
+    suite.addTests(loader.loadTestsFromTestCase(TestSequentialThinkingTool))
+    suite.addTests(loader.loadTestsFromTestCase(TestSummarizationTool))
+    suite.addTests(loader.loadTestsFromTestCase(TestMemoryTool))
+    suite.addTests(loader.loadTestsFromTestCase(TestPythonExecutorTool))
     suite.addTests(loader.loadTestsFromTestCase(TestToolDiscovery))
     suite.addTests(loader.loadTestsFromTestCase(TestOpenRouterAgent))
     suite.addTests(loader.loadTestsFromTestCase(TestConnectionPool))
+    suite.addTests(loader.loadTestsFromTestCase(TestVLLMEndpointSelector))
     suite.addTests(loader.loadTestsFromTestCase(TestEndToEnd))
     
     # Run tests